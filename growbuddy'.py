@@ -1,1194 +1,6145 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, font, filedialog
-import random
-import os
-import json
-import math
-import re
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Tuple
-import threading
-import time
-
-# ==================== REGEX VALIDATION PATTERNS ====================
-
-class PlantValidationPatterns:
-    """
-    Define regular expression patterns for plant data validation
-    Using various metacharacters and pattern matching techniques
-    """
-    
-    # Plant name validation - allows letters, numbers, spaces, hyphens, apostrophes
-    # ^: Start of string, $: End of string, []: Character class, +: One or more, {}: Quantifiers
-    PLANT_NAME = r"^[A-Za-z0-9\s\-']{2,30}$"
-    
-    # Plant type validation - exact matches only
-    # |: OR operator, (): Grouping
-    PLANT_TYPE = r"^(Flower|Herb|Succulent|Vegetable|Tree)$"
-    
-    # Care notes validation - allows letters, numbers, spaces, and common punctuation
-    # \w: Word characters, \s: Whitespace, \.: Literal dot, ?: Zero or one, *: Zero or more
-    CARE_NOTES = r"^[\w\s\.,!?'-]{0,200}$"
-    
-    # Numeric value validation for plant stats (0-100)
-    # \d: Digits, {1,3}: 1 to 3 digits, (?:...): Non-capturing group
-    STAT_VALUE = r"^(?:100|[1-9]?\d)$"
-    
-    # Plant ID validation - alphanumeric with optional prefix
-    # [A-Z]: Uppercase letters, \d{4}: Exactly 4 digits
-    PLANT_ID = r"^PLT-[A-Z]{2}\d{4}$"
-    
-    # Date validation (YYYY-MM-DD format)
-    # \d{4}: Exactly 4 digits, -: Literal hyphen
-    DATE_FORMAT = r"^\d{4}-\d{2}-\d{2}$"
-    
-    # Time validation (HH:MM format)
-    # [0-2]: Character range, [0-5]: Character range
-    TIME_FORMAT = r"^[0-2]\d:[0-5]\d$"
-    
-    # Email validation for garden sharing features
-    # [^@]: Not @ character, +: One or more, \.?: Optional dot
-    EMAIL = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    
-    # Garden location validation (City, State/Country format)
-    # \w+: One or more word characters, \s*: Zero or more spaces
-    LOCATION = r"^[A-Za-z\s]+,\s*[A-Za-z\s]+$"
-    
-    # Disease name validation - specific medical/botanical terms
-    # (?i): Case insensitive flag, \b: Word boundary
-    DISEASE_NAME = r"(?i)^(root\s+rot|aphids?|fungal\s+infection|nutrient\s+deficiency|overwatering|sunburn|leaf\s+spot|powdery\s+mildew)$"
-    
-    # Water amount validation - supports decimal values
-    # \.: Literal dot, ?: Zero or one occurrence
-    WATER_AMOUNT = r"^(?:[1-9]\d?|100)(?:\.\d{1,2})?$"
-    
-    # Hex color code validation for plant colors
-    # [A-Fa-f0-9]: Hexadecimal characters, {6}: Exactly 6 characters
-    HEX_COLOR = r"^#[A-Fa-f0-9]{6}$"
-    
-    # Plant trait validation - predefined traits only
-    PLANT_TRAIT = r"^(Fast Growing|Drought Resistant|Disease Resistant|High Yield|Colorful|Fragrant|Cold Hardy|Heat Tolerant|Low Maintenance|Decorative)$"
-    
-    # Season validation
-    SEASON = r"^(Spring|Summer|Fall|Autumn|Winter)$"
-    
-    # Weather condition validation
-    WEATHER = r"^(Sunny|Rainy|Cloudy|Windy|Stormy|Foggy|Snow)$"
-
-class RegexValidator:
-    """
-    Utility class for performing regex validation with detailed error messages
-    """
-    
-    @staticmethod
-    def validate_pattern(value: str, pattern: str, field_name: str = "Field") -> Tuple[bool, str]:
-        """
-        Validate a value against a regex pattern
-        Returns (is_valid, error_message)
-        """
-        if not isinstance(value, str):
-            return False, f"{field_name} must be a string"
-        
-        if re.match(pattern, value):
-            return True, ""
-        else:
-            return False, f"{field_name} format is invalid"
-    
-    @staticmethod
-    def extract_pattern_info(value: str, pattern: str) -> List[str]:
-        """
-        Extract all matches from a string using a pattern
-        Useful for finding specific elements in text
-        """
-        return re.findall(pattern, value)
-    
-    @staticmethod
-    def sanitize_input(value: str, allowed_pattern: str) -> str:
-        """
-        Remove characters that don't match the allowed pattern
-        """
-        # Find all valid characters and join them
-        valid_chars = re.findall(allowed_pattern, value)
-        return ''.join(valid_chars)
-    
-    @staticmethod
-    def validate_plant_data(plant_data: dict) -> Tuple[bool, List[str]]:
-        """
-        Comprehensive validation of plant data using multiple regex patterns
-        """
-        errors = []
-        
-        # Validate plant name
-        if 'name' in plant_data:
-            is_valid, error = RegexValidator.validate_pattern(
-                plant_data['name'], 
-                PlantValidationPatterns.PLANT_NAME, 
-                "Plant name"
-            )
-            if not is_valid:
-                errors.append("Plant name must be 2-30 characters, letters, numbers, spaces, hyphens, or apostrophes only")
-        
-        # Validate plant type
-        if 'type' in plant_data:
-            is_valid, error = RegexValidator.validate_pattern(
-                plant_data['type'], 
-                PlantValidationPatterns.PLANT_TYPE, 
-                "Plant type"
-            )
-            if not is_valid:
-                errors.append("Plant type must be one of: Flower, Herb, Succulent, Vegetable, Tree")
-        
-        # Validate care notes if present
-        if 'care_notes' in plant_data and plant_data['care_notes']:
-            is_valid, error = RegexValidator.validate_pattern(
-                plant_data['care_notes'], 
-                PlantValidationPatterns.CARE_NOTES, 
-                "Care notes"
-            )
-            if not is_valid:
-                errors.append("Care notes can only contain letters, numbers, spaces, and basic punctuation (max 200 characters)")
-        
-        # Validate location if present
-        if 'location' in plant_data and plant_data['location']:
-            is_valid, error = RegexValidator.validate_pattern(
-                plant_data['location'], 
-                PlantValidationPatterns.LOCATION, 
-                "Location"
-            )
-            if not is_valid:
-                errors.append("Location must be in format: City, State/Country")
-        
-        # Validate email if present
-        if 'owner_email' in plant_data and plant_data['owner_email']:
-            is_valid, error = RegexValidator.validate_pattern(
-                plant_data['owner_email'], 
-                PlantValidationPatterns.EMAIL, 
-                "Email"
-            )
-            if not is_valid:
-                errors.append("Email format is invalid")
-        
-        return len(errors) == 0, errors
-
-class ValidatedPlant:
-    """
-    Enhanced Plant class with regex validation for all inputs
-    """
-    
-    def __init__(self, name: str, plant_type: str, **kwargs):
-        # Validate required fields
-        plant_data = {
-            'name': name,
-            'type': plant_type,
-            **kwargs
-        }
-        
-        is_valid, errors = RegexValidator.validate_plant_data(plant_data)
-        if not is_valid:
-            raise ValueError(f"Invalid plant data: {'; '.join(errors)}")
-        
-        self.plant_id = self._generate_plant_id()
-        self.name = name
-        self.plant_type = plant_type
-        self.created_date = datetime.now()
-        self.care_notes = kwargs.get('care_notes', '')
-        self.location = kwargs.get('location', '')
-        self.owner_email = kwargs.get('owner_email', '')
-        
-        # Plant stats with validation
-        self.health = self._validate_stat_value(kwargs.get('health', 50))
-        self.water_level = self._validate_stat_value(kwargs.get('water_level', 50))
-        self.nutrients = self._validate_stat_value(kwargs.get('nutrients', 50))
-        self.sunlight = self._validate_stat_value(kwargs.get('sunlight', 50))
-        
-        self.diseases = []
-        self.care_history = []
-        self.special_traits = []
-        
-    def _generate_plant_id(self) -> str:
-        """Generate a validated plant ID using regex pattern"""
-        # Generate random plant ID that matches PLT-XX0000 pattern
-        letters = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=2))
-        numbers = ''.join(random.choices('0123456789', k=4))
-        plant_id = f"PLT-{letters}{numbers}"
-        
-        # Validate the generated ID
-        is_valid, _ = RegexValidator.validate_pattern(
-            plant_id, 
-            PlantValidationPatterns.PLANT_ID, 
-            "Plant ID"
-        )
-        
-        if not is_valid:
-            # Fallback to a known good pattern
-            plant_id = f"PLT-AA{random.randint(1000, 9999)}"
-        
-        return plant_id
-    
-    def _validate_stat_value(self, value) -> float:
-        """Validate and convert stat values (0-100)"""
-        str_value = str(value)
-        is_valid, _ = RegexValidator.validate_pattern(
-            str_value, 
-            PlantValidationPatterns.STAT_VALUE, 
-            "Stat value"
-        )
-        
-        if is_valid:
-            return float(value)
-        else:
-            # Return default safe value
-            return 50.0
-    
-    def add_care_note(self, note: str) -> bool:
-        """Add a care note with validation"""
-        is_valid, error = RegexValidator.validate_pattern(
-            note, 
-            PlantValidationPatterns.CARE_NOTES, 
-            "Care note"
-        )
-        
-        if is_valid:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-            self.care_history.append({
-                'timestamp': timestamp,
-                'note': note,
-                'type': 'manual_note'
-            })
-            return True
-        else:
-            print(f"Invalid care note: {error}")
-            return False
-    
-    def add_disease(self, disease_name: str) -> bool:
-        """Add a disease with name validation"""
-        is_valid, error = RegexValidator.validate_pattern(
-            disease_name, 
-            PlantValidationPatterns.DISEASE_NAME, 
-            "Disease name"
-        )
-        
-        if is_valid:
-            if disease_name.lower() not in [d['name'].lower() for d in self.diseases]:
-                self.diseases.append({
-                    'name': disease_name,
-                    'diagnosed_date': datetime.now().strftime("%Y-%m-%d"),
-                    'severity': random.randint(1, 10)
-                })
-            return True
-        else:
-            print(f"Invalid disease name: {error}")
-            return False
-    
-    def water_plant(self, amount_str: str) -> bool:
-        """Water the plant with amount validation"""
-        is_valid, error = RegexValidator.validate_pattern(
-            amount_str, 
-            PlantValidationPatterns.WATER_AMOUNT, 
-            "Water amount"
-        )
-        
-        if is_valid:
-            amount = float(amount_str)
-            self.water_level = min(100, self.water_level + amount)
-            self.add_care_note(f"Watered with {amount} units")
-            return True
-        else:
-            print(f"Invalid water amount: {error}")
-            return False
-    
-    def add_trait(self, trait: str) -> bool:
-        """Add a special trait with validation"""
-        is_valid, error = RegexValidator.validate_pattern(
-            trait, 
-            PlantValidationPatterns.PLANT_TRAIT, 
-            "Plant trait"
-        )
-        
-        if is_valid and trait not in self.special_traits:
-            self.special_traits.append(trait)
-            return True
-        else:
-            if not is_valid:
-                print(f"Invalid plant trait: {error}")
-            return False
-    
-    def get_validation_report(self) -> dict:
-        """Generate a comprehensive validation report for the plant"""
-        report = {
-            'plant_id': self.plant_id,
-            'validations': {},
-            'errors': [],
-            'warnings': []
-        }
-        
-        # Check all validation patterns
-        validations = [
-            ('name', self.name, PlantValidationPatterns.PLANT_NAME),
-            ('type', self.plant_type, PlantValidationPatterns.PLANT_TYPE),
-            ('plant_id', self.plant_id, PlantValidationPatterns.PLANT_ID),
-        ]
-        
-        if self.care_notes:
-            validations.append(('care_notes', self.care_notes, PlantValidationPatterns.CARE_NOTES))
-        
-        if self.location:
-            validations.append(('location', self.location, PlantValidationPatterns.LOCATION))
-        
-        if self.owner_email:
-            validations.append(('owner_email', self.owner_email, PlantValidationPatterns.EMAIL))
-        
-        for field_name, value, pattern in validations:
-            is_valid, error = RegexValidator.validate_pattern(value, pattern, field_name)
-            report['validations'][field_name] = {
-                'value': value,
-                'valid': is_valid,
-                'pattern': pattern
-            }
-            if not is_valid:
-                report['errors'].append(f"{field_name}: {error}")
-        
-        # Check diseases
-        for disease in self.diseases:
-            is_valid, error = RegexValidator.validate_pattern(
-                disease['name'], 
-                PlantValidationPatterns.DISEASE_NAME, 
-                "Disease"
-            )
-            if not is_valid:
-                report['warnings'].append(f"Invalid disease name: {disease['name']}")
-        
-        # Check traits
-        for trait in self.special_traits:
-            is_valid, error = RegexValidator.validate_pattern(
-                trait, 
-                PlantValidationPatterns.PLANT_TRAIT, 
-                "Trait"
-            )
-            if not is_valid:
-                report['warnings'].append(f"Invalid trait: {trait}")
-        
-        return report
-
-class PlantDataAnalyzer:
-    """
-    Use regex patterns to analyze and extract information from plant data
-    """
-    
-    @staticmethod
-    def extract_plant_mentions(text: str) -> List[str]:
-        """Extract plant mentions from text using regex"""
-        # Pattern to find plant-related words
-        plant_pattern = r'\b(?:flower|herb|succulent|vegetable|tree|plant|bloom|leaf|root|stem)\b'
-        return re.findall(plant_pattern, text, re.IGNORECASE)
-    
-    @staticmethod
-    def extract_dates_from_notes(care_history: List[dict]) -> List[str]:
-        """Extract all dates from care notes"""
-        dates = []
-        date_pattern = r'\d{4}-\d{2}-\d{2}'
-        
-        for entry in care_history:
-            if 'note' in entry:
-                found_dates = re.findall(date_pattern, entry['note'])
-                dates.extend(found_dates)
-        
-        return dates
-    
-    @staticmethod
-    def extract_numeric_values(text: str) -> List[str]:
-        """Extract numeric values from text"""
-        # Pattern for numbers (integer or decimal)
-        number_pattern = r'\b\d+(?:\.\d+)?\b'
-        return re.findall(number_pattern, text)
-    
-    @staticmethod
-    def validate_garden_data_batch(gardens_data: List[dict]) -> dict:
-        """Validate multiple garden records using regex patterns"""
-        results = {
-            'total_records': len(gardens_data),
-            'valid_records': 0,
-            'invalid_records': 0,
-            'validation_errors': [],
-            'pattern_matches': {}
-        }
-        
-        for i, garden_data in enumerate(gardens_data):
-            is_valid, errors = RegexValidator.validate_plant_data(garden_data)
-            
-            if is_valid:
-                results['valid_records'] += 1
-            else:
-                results['invalid_records'] += 1
-                results['validation_errors'].append({
-                    'record_index': i,
-                    'errors': errors,
-                    'data': garden_data
-                })
-        
-        return results
-    
-    @staticmethod
-    def generate_plant_statistics(plants: List[ValidatedPlant]) -> dict:
-        """Generate statistics using regex pattern matching"""
-        stats = {
-            'total_plants': len(plants),
-            'plants_by_type': {},
-            'common_traits': {},
-            'disease_frequency': {},
-            'location_distribution': {},
-            'email_domains': {}
-        }
-        
-        for plant in plants:
-            # Count by type
-            plant_type = plant.plant_type
-            stats['plants_by_type'][plant_type] = stats['plants_by_type'].get(plant_type, 0) + 1
-            
-            # Count traits
-            for trait in plant.special_traits:
-                stats['common_traits'][trait] = stats['common_traits'].get(trait, 0) + 1
-            
-            # Count diseases
-            for disease in plant.diseases:
-                disease_name = disease['name']
-                stats['disease_frequency'][disease_name] = stats['disease_frequency'].get(disease_name, 0) + 1
-            
-            # Extract location information
-            if plant.location:
-                # Use regex to extract city and state/country
-                location_parts = re.findall(r'([^,]+),\s*(.+)', plant.location)
-                if location_parts:
-                    city, state_country = location_parts[0]
-                    stats['location_distribution'][state_country.strip()] = \
-                        stats['location_distribution'].get(state_country.strip(), 0) + 1
-            
-            # Extract email domains
-            if plant.owner_email:
-                domain_match = re.search(r'@([a-zA-Z0-9.-]+)', plant.owner_email)
-                if domain_match:
-                    domain = domain_match.group(1)
-                    stats['email_domains'][domain] = stats['email_domains'].get(domain, 0) + 1
-        
-        return stats
-
-# ==================== ENHANCED UI WITH VALIDATION ====================
-
-class ValidatedAddPlantDialog(tk.Toplevel):
-    """
-    Enhanced add plant dialog with real-time regex validation
-    """
-    
-    def __init__(self, parent, callback):
-        super().__init__(parent)
-        self.callback = callback
-        self.title("Add New Plant - With Validation")
-        self.geometry("600x800")
-        self.configure(bg="#f4f9f4")
-        
-        # Make modal
-        self.transient(parent)
-        self.grab_set()
-        
-        # Center dialog
-        self.update_idletasks()
-        x = parent.winfo_rootx() + (parent.winfo_width() - 600) // 2
-        y = parent.winfo_rooty() + (parent.winfo_height() - 800) // 2
-        self.geometry(f"+{x}+{y}")
-        
-        self.setup_validation_ui()
-    
-    def setup_validation_ui(self):
-        # Main container
-        main_frame = tk.Frame(self, bg="#f4f9f4", padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        title_label = tk.Label(main_frame, text="🌱 Add New Plant (With Validation)", 
-                              font=("Helvetica", 16, "bold"), 
-                              bg="#f4f9f4", fg="#2c3639")
-        title_label.pack(pady=(0, 20))
-        
-        # Validation status indicator
-        self.validation_frame = tk.Frame(main_frame, bg="#f4f9f4")
-        self.validation_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        self.validation_label = tk.Label(self.validation_frame, 
-                                        text="🔍 Real-time validation active", 
-                                        font=("Helvetica", 10), 
-                                        bg="#f4f9f4", fg="#526d82")
-        self.validation_label.pack()
-        
-        # Plant name with validation
-        self.create_validated_field(
-            main_frame, 
-            "Plant Name", 
-            PlantValidationPatterns.PLANT_NAME,
-            "2-30 characters: letters, numbers, spaces, hyphens, apostrophes",
-            "name_entry"
-        )
-        
-        # Plant type dropdown
-        type_frame = tk.LabelFrame(main_frame, text="Plant Type", 
-                                 bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
-        type_frame.pack(fill=tk.X, pady=10)
-        
-        self.plant_type = tk.StringVar(value="Flower")
-        type_combo = ttk.Combobox(type_frame, textvariable=self.plant_type,
-                                 values=["Flower", "Herb", "Succulent", "Vegetable", "Tree"],
-                                 state="readonly")
-        type_combo.pack(fill=tk.X, padx=10, pady=5)
-        
-        # Care notes with validation
-        self.create_validated_field(
-            main_frame, 
-            "Care Notes (Optional)", 
-            PlantValidationPatterns.CARE_NOTES,
-            "Letters, numbers, spaces, basic punctuation (max 200 chars)",
-            "care_notes_entry",
-            is_text=True
-        )
-        
-        # Location with validation
-        self.create_validated_field(
-            main_frame, 
-            "Location (Optional)", 
-            PlantValidationPatterns.LOCATION,
-            "Format: City, State/Country",
-            "location_entry"
-        )
-        
-        # Owner email with validation
-        self.create_validated_field(
-            main_frame, 
-            "Owner Email (Optional)", 
-            PlantValidationPatterns.EMAIL,
-            "Valid email address format",
-            "email_entry"
-        )
-        
-        # Validation summary
-        self.create_validation_summary(main_frame)
-        
-        # Buttons
-        button_frame = tk.Frame(main_frame, bg="#f4f9f4")
-        button_frame.pack(fill=tk.X, pady=20)
-        
-        tk.Button(button_frame, text="Cancel", 
-                 font=("Helvetica", 11), command=self.destroy).pack(side=tk.LEFT)
-        
-        self.add_button = tk.Button(button_frame, text="Add Plant", 
-                                   font=("Helvetica", 11, "bold"),
-                                   bg="#8ac586", fg="white",
-                                   command=self.add_plant)
-        self.add_button.pack(side=tk.RIGHT)
-        
-        # Initial validation
-        self.validate_all_fields()
-    
-    def create_validated_field(self, parent, label_text, pattern, help_text, attr_name, is_text=False):
-        """Create a form field with real-time regex validation"""
-        field_frame = tk.LabelFrame(parent, text=label_text, 
-                                  bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
-        field_frame.pack(fill=tk.X, pady=10)
-        
-        # Entry or Text widget
-        if is_text:
-            widget = tk.Text(field_frame, height=4, font=("Helvetica", 10))
-        else:
-            widget = tk.Entry(field_frame, font=("Helvetica", 11))
-        
-        widget.pack(fill=tk.X, padx=10, pady=5)
-        
-        # Help text
-        help_label = tk.Label(field_frame, text=f"ℹ️ {help_text}", 
-                            font=("Helvetica", 9), 
-                            bg="#f4f9f4", fg="#526d82")
-        help_label.pack(anchor="w", padx=10)
-        
-        # Validation indicator
-        validation_indicator = tk.Label(field_frame, text="", 
-                                      font=("Helvetica", 9), 
-                                      bg="#f4f9f4")
-        validation_indicator.pack(anchor="w", padx=10, pady=(0, 5))
-        
-        # Store references
-        setattr(self, attr_name, widget)
-        setattr(self, f"{attr_name}_indicator", validation_indicator)
-        setattr(self, f"{attr_name}_pattern", pattern)
-        
-        # Bind validation events
-        if is_text:
-            widget.bind("<KeyRelease>", lambda e: self.validate_field(attr_name))
-            widget.bind("<FocusOut>", lambda e: self.validate_field(attr_name))
-        else:
-            widget.bind("<KeyRelease>", lambda e: self.validate_field(attr_name))
-            widget.bind("<FocusOut>", lambda e: self.validate_field(attr_name))
-    
-    def get_field_value(self, attr_name):
-        """Get value from entry or text widget"""
-        widget = getattr(self, attr_name)
-        if isinstance(widget, tk.Text):
-            return widget.get("1.0", tk.END).strip()
-        else:
-            return widget.get().strip()
-    
-    def validate_field(self, attr_name):
-        """Validate a specific field using its regex pattern"""
-        value = self.get_field_value(attr_name)
-        pattern = getattr(self, f"{attr_name}_pattern")
-        indicator = getattr(self, f"{attr_name}_indicator")
-        
-        # Skip validation for optional empty fields
-        if not value and "Optional" in attr_name:
-            indicator.config(text="✓ Optional field", fg="#526d82")
-            return True
-        
-        # Validate against pattern
-        is_valid, error = RegexValidator.validate_pattern(value, pattern)
-        
-        if is_valid:
-            indicator.config(text="✓ Valid format", fg="#2a9d8f")
-            return True
-        else:
-            indicator.config(text="✗ Invalid format", fg="#e76f51")
-            return False
-    
-    def validate_all_fields(self):
-        """Validate all fields and update UI accordingly"""
-        field_names = ['name_entry', 'care_notes_entry', 'location_entry', 'email_entry']
-        all_valid = True
-        
-        for field_name in field_names:
-            if hasattr(self, field_name):
-                field_valid = self.validate_field(field_name)
-                value = self.get_field_value(field_name)
-                
-                # Required fields must be valid and non-empty
-                if field_name == 'name_entry':
-                    if not value or not field_valid:
-                        all_valid = False
-                elif value and not field_valid:  # Optional fields must be valid if filled
-                    all_valid = False
-        
-        # Update add button state
-        if all_valid:
-            self.add_button.config(state=tk.NORMAL, bg="#8ac586")
-            self.validation_label.config(text="✅ All fields valid", fg="#2a9d8f")
-        else:
-            self.add_button.config(state=tk.DISABLED, bg="#cccccc")
-            self.validation_label.config(text="❌ Please fix validation errors", fg="#e76f51")
-        
-        # Schedule next validation
-        self.after(500, self.validate_all_fields)
-    
-    def create_validation_summary(self, parent):
-        """Create a summary of regex patterns being used"""
-        summary_frame = tk.LabelFrame(parent, text="🔍 Validation Patterns Used", 
-                                    bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
-        summary_frame.pack(fill=tk.X, pady=10)
-        
-        patterns_text = """
-Pattern Examples:
-• Plant Name: ^[A-Za-z0-9\\s\\-']{2,30}$ (letters, numbers, spaces, hyphens, apostrophes)
-• Email: ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$ (standard email format)
-• Location: ^[A-Za-z\\s]+,\\s*[A-Za-z\\s]+$ (City, State format)
-• Care Notes: ^[\\w\\s\\.,!?'-]{0,200}$ (basic text with punctuation)
-
-Metacharacters Used:
-^ = Start of string, $ = End of string, [] = Character class, + = One or more
-* = Zero or more, ? = Zero or one, {n,m} = Quantifiers, \\ = Escape character
-        """
-        
-        tk.Label(summary_frame, text=patterns_text, 
-                font=("Courier", 8), 
-                bg="#f4f9f4", fg="#526d82",
-                justify=tk.LEFT).pack(anchor="w", padx=10, pady=5)
-    
-    def add_plant(self):
-        """Add plant with comprehensive validation"""
-        plant_data = {
-            'name': self.get_field_value('name_entry'),
-            'type': self.plant_type.get(),
-            'care_notes': self.get_field_value('care_notes_entry'),
-            'location': self.get_field_value('location_entry'),
-            'owner_email': self.get_field_value('email_entry')
-        }
-        
-        # Final validation
-        is_valid, errors = RegexValidator.validate_plant_data(plant_data)
-        
-        if is_valid:
-            try:
-                # Create validated plant
-                plant = ValidatedPlant(**plant_data)
-                
-                # Show validation report
-                report = plant.get_validation_report()
-                
-                if self.callback:
-                    self.callback(plant, report)
-                
-                self.destroy()
-                
-            except ValueError as e:
-                messagebox.showerror("Validation Error", str(e))
-        else:
-            error_message = "Validation failed:\n" + "\n".join(errors)
-            messagebox.showerror("Validation Error", error_message)
-
-# ==================== DEMO AND TESTING ====================
-
-class RegexDemoApp:
-    """
-    Demonstration application showing regex validation in action
-    """
-    
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("🌿 GrowBuddy - Regex Validation Demo")
-        self.root.geometry("1000x700")
-        self.root.configure(bg="#f4f9f4")
-        
-        self.plants = []
-        self.setup_demo_ui()
-        
-    def setup_demo_ui(self):
-        # Title
-        title_label = tk.Label(self.root, text="🌿 GrowBuddy - Regex Validation Demo", 
-                              font=("Helvetica", 18, "bold"), 
-                              bg="#f4f9f4", fg="#2c3639")
-        title_label.pack(pady=20)
-        
-        # Description
-        desc_text = """
-This demo showcases comprehensive regex validation patterns for plant data:
-• Plant names, types, and care information
-• Email addresses and location formats
-• Disease names and plant traits
-• Numeric values and dates
-• Real-time validation with visual feedback
-        """
-        
-        tk.Label(self.root, text=desc_text, 
-                font=("Helvetica", 11), 
-                bg="#f4f9f4", fg="#526d82",
-                justify=tk.LEFT).pack(pady=10)
-        
-        # Buttons frame
-        buttons_frame = tk.Frame(self.root, bg="#f4f9f4")
-        buttons_frame.pack(pady=20)
-        
-        # Demo buttons
-        tk.Button(buttons_frame, text="🌱 Add Plant (Validated)", 
-                 font=("Helvetica", 12), bg="#8ac586", fg="white",
-                 command=self.show_add_plant_dialog).pack(side=tk.LEFT, padx=10)
-        
-        tk.Button(buttons_frame, text="🔍 Test Patterns", 
-                 font=("Helvetica", 12), bg="#66c2ff", fg="white",
-                 command=self.show_pattern_tester).pack(side=tk.LEFT, padx=10)
-        
-        tk.Button(buttons_frame, text="📊 Generate Report", 
-                 font=("Helvetica", 12), bg="#ff9f43", fg="white",
-                 command=self.generate_validation_report).pack(side=tk.LEFT, padx=10)
-        
-        tk.Button(buttons_frame, text="💾 Demo Data", 
-                 font=("Helvetica", 12), bg="#9b59b6", fg="white",
-                 command=self.load_demo_data).pack(side=tk.LEFT, padx=10)
-        
-        # Results area
-        self.results_frame = tk.Frame(self.root, bg="#f4f9f4")
-        self.results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Results text widget
-        self.results_text = tk.Text(self.results_frame, 
-                                   font=("Courier", 10), 
-                                   bg="white", fg="#2c3639",
-                                   wrap=tk.WORD)
-        
-        # Scrollbar
-        scrollbar = tk.Scrollbar(self.results_frame, orient="vertical", 
-                               command=self.results_text.yview)
-        self.results_text.configure(yscrollcommand=scrollbar.set)
-        
-        self.results_text.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Initial message
-        self.display_message("🌿 Welcome to GrowBuddy Regex Validation Demo!\n\nClick buttons above to explore validation features.")
-    
-    def display_message(self, message):
-        """Display message in results area"""
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, message)
-    
-    def show_add_plant_dialog(self):
-        """Show the validated add plant dialog"""
-        dialog = ValidatedAddPlantDialog(self.root, self.plant_added_callback)
-    
-    def plant_added_callback(self, plant, validation_report):
-        """Handle plant addition with validation report"""
-        self.plants.append(plant)
-        
-        report_text = f"""
-✅ PLANT ADDED SUCCESSFULLY!
-
-Plant Details:
-• ID: {plant.plant_id}
-• Name: {plant.name}
-• Type: {plant.plant_type}
-• Created: {plant.created_date.strftime('%Y-%m-%d %H:%M:%S')}
-
-Validation Report:
-"""
-        
-        for field, details in validation_report['validations'].items():
-            status = "✅ VALID" if details['valid'] else "❌ INVALID"
-            report_text += f"• {field}: {status}\n  Value: '{details['value']}'\n  Pattern: {details['pattern']}\n\n"
-        
-        if validation_report['errors']:
-            report_text += "Errors:\n"
-            for error in validation_report['errors']:
-                report_text += f"• {error}\n"
-        
-        if validation_report['warnings']:
-            report_text += "Warnings:\n"
-            for warning in validation_report['warnings']:
-                report_text += f"• {warning}\n"
-        
-        self.display_message(report_text)
-    
-    def show_pattern_tester(self):
-        """Show pattern testing interface"""
-        tester_window = PatternTesterWindow(self.root)
-    
-    def generate_validation_report(self):
-        """Generate comprehensive validation report for all plants"""
-        if not self.plants:
-            self.display_message("No plants added yet! Add some plants first to generate a report.")
-            return
-        
-        # Generate statistics
-        stats = PlantDataAnalyzer.generate_plant_statistics(self.plants)
-        
-        report_text = f"""
-📊 COMPREHENSIVE VALIDATION REPORT
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-User: donlj
-
-GARDEN STATISTICS:
-• Total Plants: {stats['total_plants']}
-
-PLANTS BY TYPE:
-"""
-        
-        for plant_type, count in stats['plants_by_type'].items():
-            report_text += f"• {plant_type}: {count}\n"
-        
-        if stats['common_traits']:
-            report_text += "\nMOST COMMON TRAITS:\n"
-            for trait, count in sorted(stats['common_traits'].items(), key=lambda x: x[1], reverse=True):
-                report_text += f"• {trait}: {count} plants\n"
-        
-        if stats['disease_frequency']:
-            report_text += "\nDISEASE FREQUENCY:\n"
-            for disease, count in sorted(stats['disease_frequency'].items(), key=lambda x: x[1], reverse=True):
-                report_text += f"• {disease}: {count} cases\n"
-        
-        if stats['location_distribution']:
-            report_text += "\nLOCATION DISTRIBUTION:\n"
-            for location, count in sorted(stats['location_distribution'].items(), key=lambda x: x[1], reverse=True):
-                report_text += f"• {location}: {count} plants\n"
-        
-        if stats['email_domains']:
-            report_text += "\nEMAIL DOMAINS:\n"
-            for domain, count in sorted(stats['email_domains'].items(), key=lambda x: x[1], reverse=True):
-                report_text += f"• {domain}: {count} users\n"
-        
-        report_text += "\nVALIDATION PATTERNS USED:\n"
-        for attr_name, pattern in vars(PlantValidationPatterns).items():
-            if not attr_name.startswith('_') and isinstance(pattern, str):
-                report_text += f"• {attr_name}: {pattern}\n"
-        
-        self.display_message(report_text)
-    
-    def load_demo_data(self):
-        """Load demonstration data with various validation scenarios"""
-        demo_plants_data = [
-            # Valid data
-            {
-                'name': "Rose Garden Beauty",
-                'type': "Flower",
-                'care_notes': "Needs daily watering and weekly fertilizer.",
-                'location': "San Francisco, California",
-                'owner_email': "donlj@example.com"
-            },
-            {
-                'name': "Basil-Supreme",
-                'type': "Herb",
-                'care_notes': "Harvest leaves regularly for best flavor!",
-                'location': "Portland, Oregon",
-                'owner_email': "gardener@greenthumb.org"
-            },
-            {
-                'name': "Desert Star",
-                'type': "Succulent",
-                'care_notes': "Water sparingly, once per week maximum.",
-                'location': "Phoenix, Arizona",
-                'owner_email': "donlj@gmail.com"
-            },
-            # Edge cases and validation tests
-            {
-                'name': "O'Malley's Tomato",  # Apostrophe test
-                'type': "Vegetable",
-                'care_notes': "Great for salads & sandwiches!",
-                'location': "Dublin, Ireland",
-                'owner_email': "test.user+garden@example.co.uk"
-            }
-        ]
-        
-        results_text = "🎯 LOADING DEMO DATA WITH VALIDATION TESTING...\n\n"
-        
-        for i, plant_data in enumerate(demo_plants_data, 1):
-            results_text += f"Plant {i}: {plant_data['name']}\n"
-            
-            try:
-                plant = ValidatedPlant(**plant_data)
-                self.plants.append(plant)
-                
-                # Add some demo diseases and traits
-                if i == 1:
-                    plant.add_disease("Aphids")
-                    plant.add_trait("Fragrant")
-                elif i == 2:
-                    plant.add_trait("Disease Resistant")
-                    plant.add_trait("Fast Growing")
-                elif i == 3:
-                    plant.add_trait("Drought Resistant")
-                    plant.add_trait("Low Maintenance")
-                
-                validation_report = plant.get_validation_report()
-                error_count = len(validation_report['errors'])
-                warning_count = len(validation_report['warnings'])
-                
-                results_text += f"  ✅ CREATED - Errors: {error_count}, Warnings: {warning_count}\n"
-                
-            except ValueError as e:
-                results_text += f"  ❌ FAILED: {str(e)}\n"
-            
-            results_text += "\n"
-        
-        results_text += f"\n✅ Demo data loaded! Total plants: {len(self.plants)}\n"
-        results_text += "Click 'Generate Report' to see detailed validation analysis."
-        
-        self.display_message(results_text)
-    
-    def run(self):
-        """Start the demo application"""
-        self.root.mainloop()
-
-class PatternTesterWindow:
-    """
-    Interactive pattern testing window
-    """
-    
-    def __init__(self, parent):
-        self.window = tk.Toplevel(parent)
-        self.window.title("🔍 Regex Pattern Tester")
-        self.window.geometry("700x600")
-        self.window.configure(bg="#f4f9f4")
-        
-        self.setup_tester_ui()
-    
-    def setup_tester_ui(self):
-        # Title
-        tk.Label(self.window, text="🔍 Interactive Regex Pattern Tester", 
-                font=("Helvetica", 16, "bold"), 
-                bg="#f4f9f4", fg="#2c3639").pack(pady=20)
-        
-        # Pattern selection
-        pattern_frame = tk.LabelFrame(self.window, text="Select Pattern to Test", 
-                                    bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
-        pattern_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        self.pattern_var = tk.StringVar(value="PLANT_NAME")
-        
-        patterns = [
-            ("PLANT_NAME", "Plant Name Validation"),
-            ("EMAIL", "Email Address Validation"),
-            ("LOCATION", "Location Format Validation"),
-            ("DISEASE_NAME", "Disease Name Validation"),
-            ("WATER_AMOUNT", "Water Amount Validation"),
-            ("HEX_COLOR", "Hex Color Code Validation"),
-            ("DATE_FORMAT", "Date Format Validation")
-        ]
-        
-        for pattern_key, description in patterns:
-            tk.Radiobutton(pattern_frame, text=f"{description} ({pattern_key})", 
-                          variable=self.pattern_var, value=pattern_key,
-                          bg="#f4f9f4", anchor="w").pack(fill=tk.X, padx=10, pady=2)
-        
-        # Test input
-        input_frame = tk.LabelFrame(self.window, text="Test Input", 
-                                  bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
-        input_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        self.test_input = tk.Entry(input_frame, font=("Helvetica", 12))
-        self.test_input.pack(fill=tk.X, padx=10, pady=5)
-        self.test_input.bind("<KeyRelease>", self.test_pattern)
-        
-        # Pattern display
-        pattern_display_frame = tk.LabelFrame(self.window, text="Current Pattern", 
-                                            bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
-        pattern_display_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        self.pattern_display = tk.Label(pattern_display_frame, text="", 
-                                      font=("Courier", 10), 
-                                      bg="#f4f9f4", fg="#526d82",
-                                      wraplength=650)
-        self.pattern_display.pack(anchor="w", padx=10, pady=5)
-        
-        # Results
-        results_frame = tk.LabelFrame(self.window, text="Test Results", 
-                                    bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
-        results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        self.results_display = tk.Text(results_frame, 
-                                     font=("Courier", 10), 
-                                     bg="white", fg="#2c3639")
-        self.results_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # Bind pattern change
-        self.pattern_var.trace_add("write", self.pattern_changed)
-        
-        # Initial setup
-        self.pattern_changed()
-        
-        # Add some example test cases
-        self.add_example_button = tk.Button(self.window, text="Load Example Test Cases", 
-                                          font=("Helvetica", 10), bg="#8ac586", fg="white",
-                                          command=self.load_examples)
-        self.add_example_button.pack(pady=10)
-    
-    def pattern_changed(self, *args):
-        """Update pattern display when selection changes"""
-        pattern_key = self.pattern_var.get()
-        pattern = getattr(PlantValidationPatterns, pattern_key, "")
-        self.pattern_display.config(text=f"Pattern: {pattern}")
-        self.test_pattern()
-    
-    def test_pattern(self, *args):
-        """Test the current input against the selected pattern"""
-        pattern_key = self.pattern_var.get()
-        pattern = getattr(PlantValidationPatterns, pattern_key, "")
-        test_value = self.test_input.get()
-        
-        if not test_value:
-            self.results_display.delete(1.0, tk.END)
-            self.results_display.insert(tk.END, "Enter text to test...")
-            return
-        
-        # Test the pattern
-        is_valid, error = RegexValidator.validate_pattern(test_value, pattern, "Test Input")
-        
-        result_text = f"Input: '{test_value}'\n"
-        result_text += f"Pattern: {pattern}\n\n"
-        
-        if is_valid:
-            result_text += "✅ MATCH: Input matches the pattern!\n\n"
-        else:
-            result_text += "❌ NO MATCH: Input does not match the pattern.\n\n"
-        
-        # Show pattern breakdown
-        result_text += "Pattern Breakdown:\n"
-        if pattern_key == "PLANT_NAME":
-            result_text += "• ^ = Start of string\n"
-            result_text += "• [A-Za-z0-9\\s\\-'] = Letters, numbers, spaces, hyphens, apostrophes\n"
-            result_text += "• {2,30} = Length between 2 and 30 characters\n"
-            result_text += "• $ = End of string\n"
-        elif pattern_key == "EMAIL":
-            result_text += "• [a-zA-Z0-9._%+-]+ = One or more alphanumeric chars or symbols\n"
-            result_text += "• @ = Literal @ symbol\n"
-            result_text += "• [a-zA-Z0-9.-]+ = Domain name characters\n"
-            result_text += "• \\. = Literal dot\n"
-            result_text += "• [a-zA-Z]{2,} = Two or more letters for TLD\n"
-        # Add more breakdowns as needed...
-        
-        self.results_display.delete(1.0, tk.END)
-        self.results_display.insert(tk.END, result_text)
-    
-    def load_examples(self):
-        """Load example test cases for the selected pattern"""
-        pattern_key = self.pattern_var.get()
-        
-        examples = {
-            "PLANT_NAME": [
-                "Rose Garden",      # Valid
-                "Basil-Supreme",    # Valid
-                "O'Malley's Oak",   # Valid
-                "123 Plant",        # Valid
-                "X",                # Invalid - too short
-                "A" * 31,          # Invalid - too long
-                "Plant@Home",       # Invalid - special character
-            ],
-            "EMAIL": [
-                "donlj@example.com",           # Valid
-                "user.name+tag@domain.org",    # Valid
-                "test@sub.domain.com",         # Valid
-                "invalid.email",               # Invalid - no @
-                "@domain.com",                 # Invalid - no local part
-                "user@",                       # Invalid - no domain
-            ],
-            "LOCATION": [
-                "San Francisco, California",   # Valid
-                "Dublin, Ireland",             # Valid
-                "New York City, New York",     # Valid
-                "San Francisco",               # Invalid - no comma
-                "California, ",                # Invalid - empty after comma
-                "123 Main St, CA",            # Invalid - numbers
-            ],
-            "DISEASE_NAME": [
-                "Root Rot",                    # Valid
-                "Aphids",                      # Valid
-                "Fungal Infection",            # Valid
-                "Nutrient Deficiency",         # Valid
-                "Plant Cancer",                # Invalid - not recognized
-                "Unknown Disease",             # Invalid - not recognized
-            ]
-        }
-        
-        if pattern_key in examples:
-            example_text = f"\nExample test cases for {pattern_key}:\n\n"
-            for example in examples[pattern_key]:
-                self.test_input.delete(0, tk.END)
-                self.test_input.insert(0, example)
-                self.test_pattern()
-                
-                # Get result
-                pattern = getattr(PlantValidationPatterns, pattern_key, "")
-                is_valid, _ = RegexValidator.validate_pattern(example, pattern)
-                status = "✅ VALID" if is_valid else "❌ INVALID"
-                example_text += f"'{example}' - {status}\n"
-            
-            self.results_display.delete(1.0, tk.END)
-            self.results_display.insert(tk.END, example_text)
-
-# ==================== MAIN DEMO EXECUTION ====================
-
-def main():
-    """
-    Main function to demonstrate regex validation in GrowBuddy
-    """
-    print("🌿 GrowBuddy Regex Validation Demo")
-    print("=" * 50)
-    print(f"Started by user: donlj")
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
-    
-    # Run the demo application
-    app = RegexDemoApp()
-    app.run()
-
-if __name__ == "__main__":
+import tkinter as tk
+from tkinter import ttk, messagebox, font, filedialog, simpledialog
+import random
+import os
+import json
+import math
+import re
+from datetime import datetime, timedelta
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional, Tuple
+import threading
+import time
+import asyncio
+import glob
+from collections import Counter, deque
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
+import heapq
+import bisect
+import argparse
+import tracemalloc
+import queue
+import cProfile
+import functools
+import io
+import pstats
+import csv
+import gzip
+import array
+import shutil
+import subprocess
+import sys
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:  # Optional: column parsers fall back to plain lists
+    np = None
+
+# ==================== REGEX VALIDATION PATTERNS ====================
+
+class PlantValidationPatterns:
+    """
+    Define regular expression patterns for plant data validation
+    Using various metacharacters and pattern matching techniques
+    """
+    
+    # Plant name validation - allows letters, numbers, spaces, hyphens, apostrophes
+    # ^: Start of string, $: End of string, []: Character class, +: One or more, {}: Quantifiers
+    PLANT_NAME = r"^[A-Za-z0-9\s\-']{2,30}$"
+    
+    # Plant type validation - exact matches only
+    # |: OR operator, (): Grouping
+    PLANT_TYPE = r"^(Flower|Herb|Succulent|Vegetable|Tree)$"
+    
+    # Care notes validation - allows letters, numbers, spaces, and common punctuation
+    # \w: Word characters, \s: Whitespace, \.: Literal dot, ?: Zero or one, *: Zero or more
+    CARE_NOTES = r"^[\w\s\.,!?'-]{0,200}$"
+    
+    # Numeric value validation for plant stats (0-100)
+    # \d: Digits, {1,3}: 1 to 3 digits, (?:...): Non-capturing group
+    STAT_VALUE = r"^(?:100|[1-9]?\d)$"
+    
+    # Plant ID validation - alphanumeric with optional prefix
+    # [A-Z]: Uppercase letters, \d{4}: Exactly 4 digits
+    PLANT_ID = r"^PLT-[A-Z]{2}\d{4}$"
+    
+    # Date validation (YYYY-MM-DD format)
+    # \d{4}: Exactly 4 digits, -: Literal hyphen
+    DATE_FORMAT = r"^\d{4}-\d{2}-\d{2}$"
+    
+    # Time validation (HH:MM format)
+    # [0-2]: Character range, [0-5]: Character range
+    TIME_FORMAT = r"^[0-2]\d:[0-5]\d$"
+    
+    # Email validation for garden sharing features
+    # [^@]: Not @ character, +: One or more, \.?: Optional dot
+    EMAIL = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    
+    # Garden location validation (City, State/Country format)
+    # \w+: One or more word characters, \s*: Zero or more spaces
+    LOCATION = r"^[A-Za-z\s]+,\s*[A-Za-z\s]+$"
+    
+    # Disease name validation - specific medical/botanical terms
+    # (?i): Case insensitive flag, \b: Word boundary
+    DISEASE_NAME = r"(?i)^(root\s+rot|aphids?|fungal\s+infection|nutrient\s+deficiency|overwatering|sunburn|leaf\s+spot|powdery\s+mildew)$"
+    
+    # Water amount validation - supports decimal values
+    # \.: Literal dot, ?: Zero or one occurrence
+    WATER_AMOUNT = r"^(?:[1-9]\d?|100)(?:\.\d{1,2})?$"
+    
+    # Hex color code validation for plant colors
+    # [A-Fa-f0-9]: Hexadecimal characters, {6}: Exactly 6 characters
+    HEX_COLOR = r"^#[A-Fa-f0-9]{6}$"
+    
+    # Plant trait validation - predefined traits only
+    PLANT_TRAIT = r"^(Fast Growing|Drought Resistant|Disease Resistant|High Yield|Colorful|Fragrant|Cold Hardy|Heat Tolerant|Low Maintenance|Decorative)$"
+    
+    # Season validation
+    SEASON = r"^(Spring|Summer|Fall|Autumn|Winter)$"
+    
+    # Weather condition validation
+    WEATHER = r"^(Sunny|Rainy|Cloudy|Windy|Stormy|Foggy|Snow)$"
+
+# ==================== CHARACTER-CLASS VALIDATORS ====================
+
+class CharClassValidator:
+    """
+    Regex-free equivalent of an anchored single character-class pattern
+    
+    Matches ^[class]{min,max}$ exactly as re.match does: 'word' and 'space'
+    stand for Unicode \\w and \\s, and because '$' also matches before a
+    final newline, a value ending in "\\n" is accepted when the rest of it
+    is. ASCII values in range take a length test plus one bytes.translate
+    that deletes every allowed byte; anything else goes through the exact
+    character-by-character check.
+    """
+    
+    def __init__(self, pattern_key: str, literals: str, min_length: int, max_length: int,
+                 word: bool = False, space: bool = False):
+        self.pattern_key = pattern_key
+        self.pattern = getattr(PlantValidationPatterns, pattern_key)
+        self.min_length = min_length
+        self.max_length = max_length
+        self.word = word
+        self.space = space
+        self._literals = dict.fromkeys(map(ord, literals))
+        ascii_allowed = [char for char in map(chr, range(128))
+                         if char in literals
+                         or word and (char.isalnum() or char == "_")
+                         or space and char.isspace()]
+        self._ascii_allowed = "".join(ascii_allowed).encode("ascii")
+        self.check = self._build_check()
+    
+    def _build_check(self):
+        lo, hi = self.min_length, self.max_length
+        allowed = self._ascii_allowed
+        exact = self._matches
+        
+        def check(value: str) -> bool:
+            if lo <= len(value) <= hi and value.isascii() and not value.encode().translate(None, allowed):
+                return True
+            return exact(value)
+        
+        return check
+    
+    def _matches_whole(self, value: str) -> bool:
+        if not self.min_length <= len(value) <= self.max_length:
+            return False
+        rest = value.translate(self._literals)
+        if not rest:
+            return True
+        word, space = self.word, self.space
+        return all(word and (char.isalnum() or char == "_") or space and char.isspace()
+                   for char in rest)
+    
+    def _matches(self, value: str) -> bool:
+        return self._matches_whole(value) or (
+            value[-1:] == "\n" and self._matches_whole(value[:-1]))
+    
+    def __call__(self, value: str) -> bool:
+        return self.check(value)
+
+_ASCII_LETTERS_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+# Patterns checked without the regex engine, in the record validator and
+# validate_pattern. Only long fields are listed: for short ones such as plant
+# names and hex colours the compiled regex is faster on CPython 3 (about
+# 200 ns against 360 ns for a 5-character name), while for a 200-character
+# care note the char-class check takes about 370 ns against 2 us; see
+# --benchmark charclass.
+CHARCLASS_VALIDATORS = {
+    'CARE_NOTES': CharClassValidator('CARE_NOTES', ".,!?'-", 0, 200, word=True, space=True),
+}
+
+# RegexValidator.validate_pattern receives raw pattern strings
+_CHARCLASS_BY_PATTERN = {validator.pattern: validator.check
+                         for validator in CHARCLASS_VALIDATORS.values()}
+
+def fuzz_charclass_validators(iterations: int = 100_000, seed: int = 0) -> List[tuple]:
+    """
+    Differential check of CHARCLASS_VALIDATORS against re.match
+    
+    Feeds generated valid, invalid and adversarial field values plus random
+    mixes of ASCII, punctuation, Unicode letters, digits and whitespace to
+    both and returns every (pattern_key, value, regex_result) that disagrees.
+    """
+    rng = random.Random(seed)
+    generator = SyntheticGardenGenerator(seed, invalid_rate=0.2, adversarial_rate=0.2)
+    alphabet = (_ASCII_LETTERS_DIGITS + " -'#.,!?_%@<>\t\n\r\x0b\x0c\x1c\x1f\x85\xa0"
+                "\u00e9\u00df\u0430\u043e\u0660\u00b2\u2167\u200b\u2028\u3000\u202e\U0001f331")
+    mismatches = []
+    for key, validator in CHARCLASS_VALIDATORS.items():
+        match = re.compile(validator.pattern).match
+        values = generator.pattern_values(key, iterations // 2)
+        for _ in range(iterations - len(values)):
+            length = rng.choice((rng.randrange(0, 10), rng.randrange(0, 40), rng.randrange(190, 215)))
+            values.append("".join(rng.choices(alphabet, k=length)))
+        for value in values:
+            expected = match(value) is not None
+            if validator.check(value) != expected:
+                mismatches.append((key, value, expected))
+    return mismatches
+
+# ==================== INPUT SANITIZATION ====================
+
+# Allowed characters for each PlantValidationPatterns field, as one character class
+FIELD_CHARACTER_CLASSES = {
+    'PLANT_NAME': r"[A-Za-z0-9\s\-']",
+    'PLANT_TYPE': r"[A-Za-z]",
+    'CARE_NOTES': r"[\w\s\.,!?'-]",
+    'STAT_VALUE': r"\d",
+    'PLANT_ID': r"[A-Z0-9-]",
+    'DATE_FORMAT': r"[0-9-]",
+    'TIME_FORMAT': r"[0-9:]",
+    'EMAIL': r"[a-zA-Z0-9._%+@-]",
+    'LOCATION': r"[A-Za-z\s,]",
+    'DISEASE_NAME': r"[A-Za-z\s]",
+    'WATER_AMOUNT': r"[0-9.]",
+    'HEX_COLOR': r"[#A-Fa-f0-9]",
+    'PLANT_TRAIT': r"[A-Za-z\s]",
+    'SEASON': r"[A-Za-z]",
+    'WEATHER': r"[A-Za-z]",
+}
+
+# A bare character class or class escape, optionally repeated with '+'
+_SINGLE_CLASS_PATTERN = re.compile(r"^(?:\[(?:\\.|[^\]\\])+\]|\\[wWsSdD])\+?$")
+
+class _DeletionTable(dict):
+    """
+    str.translate table mapping disallowed code points to None
+    
+    The first 256 code points are filled in up front; others are classified
+    with the pattern the first time translate() asks for them.
+    """
+    
+    def __init__(self, pattern: str):
+        super().__init__()
+        self._fullmatch = re.compile(pattern).fullmatch
+        for code in range(256):
+            self[code]
+    
+    def __missing__(self, code):
+        result = code if self._fullmatch(chr(code)) else None
+        self[code] = result
+        return result
+
+class Sanitizer:
+    """
+    Keep only the characters an allowed pattern matches, optionally truncating
+    
+    For a single character class (with or without '+') the result equals
+    ''.join(re.findall(allowed_pattern, value)) but is computed with one
+    str.translate over a deletion table. Any other pattern falls back to
+    re.findall so output stays identical.
+    """
+    
+    def __init__(self, allowed_pattern: str, max_length: Optional[int] = None):
+        self.allowed_pattern = allowed_pattern
+        self.max_length = max_length
+        if _SINGLE_CLASS_PATTERN.match(allowed_pattern):
+            self.table = _DeletionTable(allowed_pattern)
+        else:
+            self.table = None
+            self._findall = re.compile(allowed_pattern).findall
+    
+    def sanitize(self, value: str, max_length: Optional[int] = None) -> str:
+        if self.table is not None:
+            value = value.translate(self.table)
+        else:
+            value = ''.join(self._findall(value))
+        max_length = self.max_length if max_length is None else max_length
+        if max_length is not None:
+            value = value[:max_length]
+        return value
+    
+    __call__ = sanitize
+    
+    def sanitize_column(self, values, max_length: Optional[int] = None) -> List[str]:
+        """Sanitize a whole column of strings in one pass"""
+        max_length = self.max_length if max_length is None else max_length
+        if self.table is not None:
+            table = self.table
+            column = [value.translate(table) for value in values]
+        else:
+            findall = self._findall
+            column = [''.join(findall(value)) for value in values]
+        if max_length is not None:
+            column = [value[:max_length] for value in column]
+        return column
+
+@functools.lru_cache(maxsize=64)
+def get_sanitizer(allowed_pattern: str) -> Sanitizer:
+    """Shared Sanitizer for a pattern, so its translate table is built once"""
+    return Sanitizer(allowed_pattern)
+
+FIELD_SANITIZERS = {key: get_sanitizer(pattern) for key, pattern in FIELD_CHARACTER_CLASSES.items()}
+
+def sanitize_records(records: List[dict], fields: Optional[Dict[str, str]] = None,
+                     truncate: bool = False) -> List[dict]:
+    """
+    Sanitize record fields column by column, returning new record dicts
+    
+    fields maps record keys to PlantValidationPatterns keys and defaults to
+    PLANT_RECORD_SCHEMA. With truncate, values are cut to the schema's
+    max_length. Non-string and missing values are left alone.
+    """
+    if fields is None:
+        fields = {spec.name: spec.pattern_key for spec in PLANT_RECORD_SCHEMA}
+    limits = {spec.name: spec.max_length for spec in PLANT_RECORD_SCHEMA} if truncate else {}
+    
+    cleaned = [dict(record) for record in records]
+    for name, pattern_key in fields.items():
+        rows = [record for record in cleaned if type(record.get(name)) is str]
+        if not rows:
+            continue
+        column = FIELD_SANITIZERS[pattern_key].sanitize_column(
+            [record[name] for record in rows], limits.get(name))
+        for record, value in zip(rows, column):
+            record[name] = value
+    return cleaned
+
+# ==================== STRING INTERNING ====================
+
+class StringPool:
+    """
+    Interning table for low-cardinality strings that repeat across a garden
+    
+    intern() returns one canonical str object per distinct value so repeated
+    values share storage and compare by identity. Only fields with few
+    distinct values are pooled: plant type, location, city and region, email
+    domain, traits, disease names and the fixed watering notes. Timestamps,
+    names and free-text notes are not, since each would sit in the pool
+    without being shared. Values longer than max_length, and new values once
+    max_entries is reached, are passed through unchanged; the pool never
+    evicts, so the cap only guards against a caller pooling unbounded data.
+    """
+    
+    def __init__(self, max_entries: int = 1_000_000, max_length: int = 256):
+        self.max_entries = max_entries
+        self.max_length = max_length
+        self.enabled = True
+        self._strings = {}
+    
+    def __len__(self):
+        return len(self._strings)
+    
+    def intern(self, value):
+        """Return the pooled copy of value (non-strings are returned as-is)"""
+        if not self.enabled or type(value) is not str:
+            return value
+        pooled = self._strings.get(value)
+        if pooled is not None:
+            return pooled
+        if len(value) > self.max_length or len(self._strings) >= self.max_entries:
+            return value
+        # setdefault is atomic, so import worker threads agree on the pooled copy
+        return self._strings.setdefault(value, value)
+
+# Shared pool for plant fields, care history and statistics keys
+GARDEN_STRINGS = StringPool()
+
+_WATERING_NOTE = re.compile(r'^Watered with (\d+(?:\.\d+)?) units$')
+
+def intern_care_note(note):
+    """Pool the fixed 'Watered with N units' notes; other notes are free text and stay as they are"""
+    if type(note) is str and _WATERING_NOTE.match(note):
+        return GARDEN_STRINGS.intern(note)
+    return note
+
+def intern_care_entry(entry: dict) -> dict:
+    """Copy of a care history entry with its type and watering note pooled (never its timestamp)"""
+    pooled = dict(entry)
+    if 'type' in pooled:
+        pooled['type'] = GARDEN_STRINGS.intern(pooled['type'])
+    if 'note' in pooled:
+        pooled['note'] = intern_care_note(pooled['note'])
+    return pooled
+
+# ==================== LOCATION AND EMAIL PARSING ====================
+
+PARSE_CACHE_SIZE = 65536
+
+def normalize_place_name(value: str) -> str:
+    """
+    Canonical spelling of a city or region name
+    Whitespace is collapsed and an all-lowercase name is title-cased
+    ('oregon ' -> 'Oregon'); any other spelling is kept as stored, so 'UK'
+    stays 'UK'. The result depends only on the value, never on which
+    plants were parsed first.
+    """
+    display = ' '.join(value.split())
+    return display.title() if display.islower() else display
+
+def preferred_place_label(label: str, other: Optional[str] = None) -> str:
+    """
+    Spelling to report for a place stored both as label and as other
+    Prefers a spelling that is not all capitals, then the smallest, so the
+    choice does not depend on the order plants are counted in.
+    """
+    if other is None:
+        return label
+    return min(label, other, key=lambda spelling: (spelling.isupper(), spelling))
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_location(location: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Split a 'City, State/Country' location into normalized, interned (city, region)
+    Results are kept in a bounded cache shared by plants and bulk imports.
+    """
+    if not location or not isinstance(location, str):
+        return None
+    city, comma, region = location.partition(',')
+    city, region = normalize_place_name(city), normalize_place_name(region)
+    if not comma or not city or not region:
+        return None
+    return GARDEN_STRINGS.intern(city), GARDEN_STRINGS.intern(region)
+
+_EMAIL_DOMAIN = re.compile(r'@([a-zA-Z0-9.-]+)')
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_email_domain(email: Optional[str]) -> Optional[str]:
+    """Lower-cased, interned domain of an email address (bounded shared cache)"""
+    if not email or not isinstance(email, str):
+        return None
+    domain_match = _EMAIL_DOMAIN.search(email)
+    return GARDEN_STRINGS.intern(domain_match.group(1).lower()) if domain_match else None
+
+# ==================== PROFILING ====================
+
+class OperationProfiler:
+    """
+    Opt-in profiler for the major GrowBuddy operations
+    
+    When enabled, each profiled operation runs under cProfile and tracemalloc;
+    a .prof file (readable with pstats or snakeviz) and a top-allocation
+    summary are written to output_dir, and a one-line timing/memory summary
+    is passed to report(). Operations called inside another profiled
+    operation are included in the outer profile rather than profiled twice.
+    """
+    
+    ENVIRONMENT_VARIABLE = "GROWBUDDY_PROFILE"
+    DEFAULT_DIRECTORY = "growbuddy-profiles"
+    
+    def __init__(self, output_dir: Optional[str] = None, top_allocations: int = 15):
+        self.output_dir = output_dir
+        self.top_allocations = top_allocations
+        self.report = print
+        self.summaries = []
+        self._counts = Counter()
+        self._active = threading.local()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.output_dir is not None
+    
+    def enable(self, output_dir: Optional[str] = None):
+        # The directory is created with the first profile, not at import time
+        self.output_dir = output_dir or self.DEFAULT_DIRECTORY
+    
+    @classmethod
+    def from_environment(cls) -> 'OperationProfiler':
+        """Profiler enabled when GROWBUDDY_PROFILE is set (to a directory, or 1)"""
+        profiler = cls()
+        value = os.environ.get(cls.ENVIRONMENT_VARIABLE, "").strip()
+        if value and value.lower() not in ("0", "false", "no"):
+            profiler.enable(None if value.lower() in ("1", "true", "yes") else value)
+        return profiler
+    
+    @contextmanager
+    def profile(self, name: str):
+        """Profile the enclosed block as one run of the named operation"""
+        if not self.enabled or getattr(self._active, 'name', None):
+            yield
+            return
+        
+        self._active.name = name
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            self._active.name = None
+            self._write_results(name, profiler, snapshot, elapsed, current - memory_before, peak - memory_before)
+    
+    def _write_results(self, name, profiler, snapshot, elapsed, retained, peak):
+        self._counts[name] += 1
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{name}-{self._counts[name]:04d}")
+        profiler.dump_stats(base + ".prof")
+        
+        with open(base + "-alloc.txt", 'w', encoding='utf-8') as handle:
+            handle.write(f"{name}: {elapsed * 1000:.1f} ms, peak +{peak / 1024:.1f} KiB, "
+                         f"retained {retained / 1024:+.1f} KiB\n\nTop allocations:\n")
+            for stat in snapshot.statistics('lineno')[:self.top_allocations]:
+                handle.write(f"{stat}\n")
+            handle.write("\nTop functions by cumulative time:\n")
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(15)
+            handle.write(stream.getvalue())
+        
+        summary = {'operation': name, 'seconds': elapsed, 'peak_bytes': peak,
+                   'retained_bytes': retained, 'profile': base + ".prof"}
+        self.summaries.append(summary)
+        self.report(f"⏱ {name}: {elapsed * 1000:.1f} ms, peak memory +{peak / 1024:.1f} KiB "
+                    f"(profile: {base}.prof)")
+
+# Shared profiler, enabled by GROWBUDDY_PROFILE or the --profile flag
+PROFILER = OperationProfiler.from_environment()
+
+def profiled(name: str):
+    """Decorator profiling every call of a function as the named operation"""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return function(*args, **kwargs)
+            with PROFILER.profile(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+class RegexValidator:
+    """
+    Utility class for performing regex validation with detailed error messages
+    """
+    
+    @staticmethod
+    def validate_pattern(value: str, pattern: str, field_name: str = "Field") -> Tuple[bool, str]:
+        """
+        Validate a value against a regex pattern
+        Returns (is_valid, error_message)
+        """
+        if not isinstance(value, str):
+            return False, f"{field_name} must be a string"
+        
+        fast_check = _CHARCLASS_BY_PATTERN.get(pattern)
+        if fast_check is not None:
+            matched = fast_check(value)
+        else:
+            matched = re.match(pattern, value) is not None
+        
+        if matched:
+            return True, ""
+        else:
+            return False, f"{field_name} format is invalid"
+    
+    @staticmethod
+    def extract_pattern_info(value: str, pattern: str) -> List[str]:
+        """
+        Extract all matches from a string using a pattern
+        Useful for finding specific elements in text
+        """
+        return re.findall(pattern, value)
+    
+    @staticmethod
+    def sanitize_input(value: str, allowed_pattern: str, max_length: Optional[int] = None) -> str:
+        """
+        Remove characters that don't match the allowed pattern
+        Optionally truncate the result to max_length characters
+        """
+        return get_sanitizer(allowed_pattern).sanitize(value, max_length)
+    
+    @staticmethod
+    def validate_plant_data(plant_data: dict) -> Tuple[bool, List[str]]:
+        """
+        Comprehensive validation of plant data using multiple regex patterns
+        Rules come from PLANT_RECORD_SCHEMA, compiled once into PLANT_RECORD_VALIDATOR
+        """
+        return PLANT_RECORD_VALIDATOR(plant_data)
+
+# ==================== DATE AND TIME PARSING ====================
+
+# Layout name -> (strptime format, strict ASCII shape with one group per field)
+DATETIME_LAYOUTS = {
+    'date': ("%Y-%m-%d", re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)),
+    'time': ("%H:%M", re.compile(r"(\d{2}):(\d{2})", re.ASCII)),
+    'timestamp': ("%Y-%m-%d %H:%M", re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})", re.ASCII)),
+}
+
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+# Sentinel for invalid entries in NumPy results; equals NaT when viewed as datetime64
+INVALID_EPOCH = -(1 << 63)
+
+@dataclass
+class ParsedColumn:
+    """
+    Result of parsing a column of date/time strings
+    
+    values holds epoch seconds (seconds since midnight for 'time'), as a list
+    with None for invalid entries, or a NumPy int64 array using INVALID_EPOCH,
+    or a datetime64/timedelta64 array using NaT. invalid lists the positions
+    that failed, in order.
+    """
+    values: object
+    invalid: List[int]
+    
+    @property
+    def valid_count(self) -> int:
+        return len(self.values) - len(self.invalid)
+
+def _parse_datetime_value(value, layout: str) -> Optional[int]:
+    if type(value) is not str:
+        return None
+    match = DATETIME_LAYOUTS[layout][1].fullmatch(value)
+    if match is None:
+        return None
+    fields = [int(part) for part in match.groups()]
+    seconds = 0
+    if layout != 'date':
+        hour, minute = fields[-2:]
+        if hour > 23 or minute > 59:
+            return None
+        seconds = hour * 3600 + minute * 60
+    if layout != 'time':
+        year, month, day = fields[:3]
+        try:
+            ordinal = datetime(year, month, day).toordinal()
+        except ValueError:
+            return None
+        seconds += (ordinal - _EPOCH_ORDINAL) * DAY_SECONDS
+    return seconds
+
+def _parse_datetime_column_lists(values, layout: str) -> ParsedColumn:
+    # Dates in histories repeat heavily, so each distinct string is parsed once
+    memo = {}
+    parsed = []
+    invalid = []
+    for index, value in enumerate(values):
+        try:
+            seconds = memo[value]
+        except KeyError:
+            seconds = memo[value] = _parse_datetime_value(value, layout)
+        except TypeError:
+            seconds = None
+        if seconds is None:
+            invalid.append(index)
+        parsed.append(seconds)
+    return ParsedColumn(parsed, invalid)
+
+def _parse_datetime_column_numpy(values, layout: str, output: str) -> ParsedColumn:
+    strptime_format = DATETIME_LAYOUTS[layout][0]
+    template = datetime(2000, 1, 1).strftime(strptime_format)
+    width = len(template)
+    shaped = [type(value) is str and len(value) == width and value.isascii() for value in values]
+    text = "".join([value if ok else template for value, ok in zip(values, shaped)])
+    grid = np.frombuffer(text.encode("ascii"), dtype=np.uint8).reshape(len(values), width)
+    
+    # Every position is either a digit or the template's separator
+    valid = np.array(shaped, dtype=bool)
+    separators = [i for i, char in enumerate(template) if not char.isdigit()]
+    digits = [i for i, char in enumerate(template) if char.isdigit()]
+    for i in separators:
+        valid &= grid[:, i] == ord(template[i])
+    digit_grid = grid[:, digits].astype(np.int64) - 48
+    valid &= ((digit_grid >= 0) & (digit_grid <= 9)).all(axis=1)
+    
+    def number(start, length):
+        result = np.zeros(len(values), dtype=np.int64)
+        for i in range(start, start + length):
+            result = result * 10 + (grid[:, i].astype(np.int64) - 48)
+        return result
+    
+    seconds = np.zeros(len(values), dtype=np.int64)
+    offset = 0
+    if layout != 'time':
+        year, month, day = number(0, 4), number(5, 2), number(8, 2)
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        month_days = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+        valid &= (year >= 1) & (month >= 1) & (month <= 12)
+        month = np.where(valid, month, 1)
+        valid &= (day >= 1) & (day <= month_days[month] + (leap & (month == 2)))
+        
+        # Days from civil date (proleptic Gregorian), valid for years 1-9999
+        shifted = year - (month <= 2)
+        era = shifted // 400
+        year_of_era = shifted - era * 400
+        day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+        day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+        seconds += (era * 146097 + day_of_era - 719468) * DAY_SECONDS
+        offset = 11
+    if layout != 'date':
+        hour, minute = number(offset, 2), number(offset + 3, 2)
+        valid &= (hour <= 23) & (minute <= 59)
+        seconds += hour * 3600 + minute * 60
+    
+    seconds[~valid] = INVALID_EPOCH
+    if output == 'datetime64':
+        seconds = seconds.view('timedelta64[s]' if layout == 'time' else 'datetime64[s]')
+    return ParsedColumn(seconds, np.flatnonzero(~valid).tolist())
+
+def parse_datetime_column(values: List[str], layout: str = 'date', output: str = 'epoch',
+                          use_numpy: Optional[bool] = None) -> ParsedColumn:
+    """
+    Parse and validate a whole column of DATE_FORMAT, TIME_FORMAT or care
+    history timestamp strings
+    
+    Unlike the DATE_FORMAT and TIME_FORMAT patterns, which accept
+    '9999-99-99' and '29:59', values must be real calendar dates (years
+    1-9999, leap years included) and clock times, written with ASCII
+    digits and no trailing newline. Naive values are read as UTC. output
+    is 'epoch' (int seconds) or 'datetime64'; NumPy is used when installed
+    unless use_numpy is False, and is required for 'datetime64'.
+    """
+    if layout not in DATETIME_LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}")
+    if output not in ('epoch', 'datetime64'):
+        raise ValueError(f"Unknown output: {output}")
+    if use_numpy is None:
+        use_numpy = np is not None
+    if (use_numpy or output == 'datetime64') and np is None:
+        raise ValueError("NumPy is required for this output")
+    if use_numpy or output == 'datetime64':
+        return _parse_datetime_column_numpy(list(values), layout, output)
+    return _parse_datetime_column_lists(values, layout)
+
+# ==================== SCHEMA-COMPILED RECORD VALIDATION ====================
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Declarative validation rule for one record field
+    
+    required fields are validated whenever the key is present, even when the
+    value is empty; optional fields are skipped when empty. max_length is
+    checked before the pattern, so over-long values are rejected without
+    touching the regex engine.
+    """
+    name: str
+    pattern_key: str
+    error_code: str
+    message: str
+    required: bool = False
+    max_length: Optional[int] = None
+
+PLANT_RECORD_SCHEMA = (
+    FieldSpec('name', 'PLANT_NAME', 'invalid_name',
+              "Plant name must be 2-30 characters, letters, numbers, spaces, hyphens, or apostrophes only",
+              required=True, max_length=30),
+    FieldSpec('type', 'PLANT_TYPE', 'invalid_type',
+              "Plant type must be one of: Flower, Herb, Succulent, Vegetable, Tree",
+              required=True, max_length=9),
+    FieldSpec('care_notes', 'CARE_NOTES', 'invalid_care_notes',
+              "Care notes can only contain letters, numbers, spaces, and basic punctuation (max 200 characters)",
+              max_length=200),
+    FieldSpec('location', 'LOCATION', 'invalid_location',
+              "Location must be in format: City, State/Country"),
+    FieldSpec('owner_email', 'EMAIL', 'invalid_email',
+              "Email format is invalid"),
+)
+
+def compile_record_validator(schema, with_codes: bool = False):
+    """
+    Compile a field schema into a specialized validator function
+    
+    The generated function looks each field up once, binds the compiled
+    patterns, caps and messages as default-argument locals and returns
+    (is_valid, errors) like RegexValidator.validate_plant_data. With
+    with_codes, errors are (error_code, message) pairs. Fields with a
+    CHARCLASS_VALIDATORS entry are checked without the regex engine.
+    """
+    lines = []
+    bindings = {}
+    for i, spec in enumerate(schema):
+        pattern = getattr(PlantValidationPatterns, spec.pattern_key)
+        bindings[f"_error_{i}"] = (spec.error_code, spec.message) if with_codes else spec.message
+        
+        checks = ["not isinstance(value, str)"]
+        if spec.max_length is not None:
+            checks.append(f"len(value) > {spec.max_length}")
+        fast = CHARCLASS_VALIDATORS.get(spec.pattern_key)
+        if fast is not None:
+            bindings[f"_check_{i}"] = fast.check
+            checks.append(f"not _check_{i}(value)")
+        else:
+            bindings[f"_match_{i}"] = re.compile(pattern).match
+            checks.append(f"_match_{i}(value) is None")
+        
+        if spec.required:
+            lines.append(f"    value = get({spec.name!r}, _missing)")
+            lines.append("    if value is not _missing:")
+        else:
+            lines.append(f"    value = get({spec.name!r})")
+            lines.append("    if value:")
+        lines.append(f"        if {' or '.join(checks)}:")
+        lines.append(f"            errors.append(_error_{i})")
+    
+    parameters = ", ".join(f"{name}={name}" for name in bindings)
+    source = "\n".join(
+        [f"def validate_record(record, _missing=_missing, {parameters}):",
+         "    errors = []",
+         "    get = record.get"]
+        + lines
+        + ["    return not errors, errors"]
+    )
+    namespace = dict(bindings, _missing=object())
+    exec(compile(source, "<record validator>", "exec"), namespace)
+    validator = namespace["validate_record"]
+    validator.source = source
+    validator.schema = tuple(schema)
+    return validator
+
+PLANT_RECORD_VALIDATOR = compile_record_validator(PLANT_RECORD_SCHEMA)
+
+class _ReportedField:
+    """
+    Plant attribute whose assignment invalidates its cached validation report section
+    """
+    
+    def __init__(self, section: str, interned: bool = False, derive: Optional[str] = None):
+        self.section = section
+        self.interned = interned
+        self.derive = derive
+    
+    def __set_name__(self, owner, name):
+        self.attr = f"_{name}"
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.attr)
+    
+    def __set__(self, instance, value):
+        if self.interned:
+            value = GARDEN_STRINGS.intern(value)
+        if instance._cow_guard is not None:
+            instance._cow_guard.before_write(instance, self.attr[1:])
+        setattr(instance, self.attr, value)
+        instance._invalidate_report(self.section)
+        if self.derive:
+            getattr(instance, self.derive)()
+        if instance._observers:
+            instance._notify('field', {'field': self.attr[1:], 'value': value})
+
+class ValidatedPlant:
+    """
+    Enhanced Plant class with regex validation for all inputs
+    """
+    
+    # Validation report sections: (report field, attribute, pattern key, skip when empty)
+    REPORT_FIELDS = (
+        ('name', 'name', 'PLANT_NAME', False),
+        ('type', 'plant_type', 'PLANT_TYPE', False),
+        ('plant_id', 'plant_id', 'PLANT_ID', False),
+        ('care_notes', 'care_notes', 'CARE_NOTES', True),
+        ('location', 'location', 'LOCATION', True),
+        ('owner_email', 'owner_email', 'EMAIL', True),
+    )
+    
+    name = _ReportedField('name')
+    plant_type = _ReportedField('type', interned=True)
+    care_notes = _ReportedField('care_notes')
+    location = _ReportedField('location', interned=True, derive='_parse_location')
+    owner_email = _ReportedField('owner_email', derive='_parse_email')
+    
+    # Mutation observers, called as observer(plant, operation, details)
+    _observers = ()
+    
+    # Copy-on-write guard of the VersionedGarden holding this plant; it must
+    # see every mutation before it happens. The care_history, diseases and
+    # special_traits lists are only ever appended to in place (anything that
+    # rewrites them assigns a new list), which lets snapshots share them.
+    _cow_guard = None
+    _cow_epoch = 0
+    
+    # Care history retention: raw events older than the last few are folded
+    # into per-period summaries; care_history_offset counts the folded events
+    # so event numbers stay stable. retention_policy overrides the garden's.
+    care_summaries = ()
+    care_history_offset = 0
+    retention_policy = None
+    
+    def __init__(self, name: str, plant_type: str, **kwargs):
+        # Validate required fields
+        plant_data = {
+            'name': name,
+            'type': plant_type,
+            **kwargs
+        }
+        
+        is_valid, errors = PLANT_RECORD_VALIDATOR(plant_data)
+        if not is_valid:
+            raise ValueError(f"Invalid plant data: {'; '.join(errors)}")
+        
+        # Cached validation report, filled lazily by get_validation_report
+        self._report_sections = {}
+        self._report = None
+        
+        self.plant_id = self._generate_plant_id()
+        self.name = name
+        self.plant_type = plant_type
+        self.created_date = datetime.now()
+        self.care_notes = kwargs.get('care_notes', '')
+        self.location = kwargs.get('location', '')
+        self.owner_email = kwargs.get('owner_email', '')
+        
+        # Plant stats with validation
+        self.health = self._validate_stat_value(kwargs.get('health', 50))
+        self.water_level = self._validate_stat_value(kwargs.get('water_level', 50))
+        self.nutrients = self._validate_stat_value(kwargs.get('nutrients', 50))
+        self.sunlight = self._validate_stat_value(kwargs.get('sunlight', 50))
+        
+        self.diseases = []
+        self.care_history = []
+        self.special_traits = []
+        
+    def _generate_plant_id(self) -> str:
+        """Generate a validated plant ID using regex pattern"""
+        # Generate random plant ID that matches PLT-XX0000 pattern
+        letters = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=2))
+        numbers = ''.join(random.choices('0123456789', k=4))
+        plant_id = f"PLT-{letters}{numbers}"
+        
+        # Validate the generated ID
+        is_valid, _ = RegexValidator.validate_pattern(
+            plant_id, 
+            PlantValidationPatterns.PLANT_ID, 
+            "Plant ID"
+        )
+        
+        if not is_valid:
+            # Fallback to a known good pattern
+            plant_id = f"PLT-AA{random.randint(1000, 9999)}"
+        
+        return plant_id
+    
+    def _validate_stat_value(self, value) -> float:
+        """Validate and convert stat values (0-100)"""
+        str_value = str(value)
+        is_valid, _ = RegexValidator.validate_pattern(
+            str_value, 
+            PlantValidationPatterns.STAT_VALUE, 
+            "Stat value"
+        )
+        
+        if is_valid:
+            return float(value)
+        else:
+            # Return default safe value
+            return 50.0
+    
+    @classmethod
+    def from_record(cls, record: dict) -> 'ValidatedPlant':
+        """
+        Build a plant from an imported record dict
+        Uses 'type' for the plant type, like validate_plant_data, and applies
+        optional 'special_traits', 'diseases' and 'care_history' lists
+        """
+        fields = {key: value for key, value in record.items()
+                  if key not in ('name', 'type', 'special_traits', 'diseases', 'care_history')}
+        plant = cls(record['name'], record['type'], **fields)
+        
+        for entry in record.get('care_history') or []:
+            plant.care_history.append(intern_care_entry(entry))
+        
+        for trait in record.get('special_traits') or []:
+            plant.add_trait(trait)
+        for disease in record.get('diseases') or []:
+            plant.add_disease(disease['name'] if isinstance(disease, dict) else disease)
+        
+        return plant
+    
+    def to_dict(self) -> dict:
+        """Full plant state as a JSON-serializable dict"""
+        return {
+            'plant_id': self.plant_id,
+            'name': self.name,
+            'type': self.plant_type,
+            'created_date': self.created_date.isoformat(),
+            'care_notes': self.care_notes,
+            'location': self.location,
+            'owner_email': self.owner_email,
+            'health': self.health,
+            'water_level': self.water_level,
+            'nutrients': self.nutrients,
+            'sunlight': self.sunlight,
+            'diseases': [dict(disease) for disease in self.diseases],
+            'care_history': [dict(entry) for entry in self.care_history],
+            'care_summaries': [dict(summary) for summary in self.care_summaries],
+            'care_history_offset': self.care_history_offset,
+            'special_traits': list(self.special_traits),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ValidatedPlant':
+        """Restore a plant saved with to_dict, keeping its ID and history"""
+        plant = cls.__new__(cls)
+        plant._report_sections = {}
+        plant._report = None
+        plant.plant_id = data['plant_id']
+        plant.name = data['name']
+        plant.plant_type = data['type']
+        plant.created_date = datetime.fromisoformat(data['created_date'])
+        plant.care_notes = data.get('care_notes', '')
+        plant.location = data.get('location', '')
+        plant.owner_email = data.get('owner_email', '')
+        for stat in ('health', 'water_level', 'nutrients', 'sunlight'):
+            setattr(plant, stat, float(data.get(stat, 50.0)))
+        plant.diseases = [
+            dict(disease, name=GARDEN_STRINGS.intern(disease['name']))
+            for disease in data.get('diseases', [])
+        ]
+        plant.care_history = [intern_care_entry(entry) for entry in data.get('care_history', [])]
+        if data.get('care_summaries'):
+            plant.care_summaries = [dict(summary) for summary in data['care_summaries']]
+        plant.care_history_offset = data.get('care_history_offset', 0)
+        plant.special_traits = [GARDEN_STRINGS.intern(trait) for trait in data.get('special_traits', [])]
+        return plant
+    
+    def __setstate__(self, state: dict):
+        # Plants built in import worker processes arrive with their own copies
+        # of every string: pool them again and re-derive the parsed fields
+        intern = GARDEN_STRINGS.intern
+        for attr in ('_plant_type', '_location'):
+            if attr in state:
+                state[attr] = intern(state[attr])
+        state['care_history'] = [intern_care_entry(entry) for entry in state.get('care_history', [])]
+        state['diseases'] = [dict(disease, name=intern(disease['name']))
+                             for disease in state.get('diseases', [])]
+        state['special_traits'] = [intern(trait) for trait in state.get('special_traits', [])]
+        self.__dict__.update(state)
+        self._parse_location()
+        self._parse_email()
+    
+    def _parse_location(self):
+        """Keep the normalized city and region in step with location"""
+        parsed = parse_location(self.location)
+        self.city, self.region = parsed if parsed else (None, None)
+    
+    def _parse_email(self):
+        """Keep the normalized email domain in step with owner_email"""
+        self.email_domain = parse_email_domain(self.owner_email)
+    
+    def iter_care_history(self, include_summaries: bool = True):
+        """
+        Care history in chronological order: compacted period summaries first,
+        then the raw events still kept. Summaries are dicts with the same
+        'timestamp', 'note' and 'type' keys as raw events; a period that held
+        a single event keeps that event instead of a summary.
+        """
+        if include_summaries:
+            yield from self.care_summaries
+        yield from self.care_history
+    
+    def compact_care_history(self, keep_last: int, period: str = 'week',
+                             max_summaries: Optional[int] = None) -> int:
+        """
+        Fold all but the last keep_last raw care events into per-period summaries
+        Returns the number of events folded. Past max_summaries the oldest
+        summaries are rolled up into coarser periods, which also bounds the
+        copy made here. New lists are assigned rather than edited in place,
+        so snapshots sharing the old ones are unaffected. Observers get only
+        the summaries after the unchanged prefix ('keep' entries).
+        """
+        dropped = len(self.care_history) - keep_last
+        if dropped <= 0:
+            return 0
+        if self._cow_guard is not None:
+            self._cow_guard.before_write(self, 'care_history')
+        
+        previous = self.care_summaries
+        summaries = summarize_care_events(self.care_history[:dropped], period, list(previous))
+        if max_summaries is not None and len(summaries) > max_summaries:
+            summaries = rollup_care_summaries(summaries, max_summaries)
+        keep = 0
+        while keep < len(previous) and keep < len(summaries) and previous[keep] is summaries[keep]:
+            keep += 1
+        
+        self.care_summaries = summaries
+        self.care_history = self.care_history[dropped:]
+        self.care_history_offset += dropped
+        if self._observers:
+            self._notify('compact', {'dropped': dropped, 'keep': keep, 'summaries': summaries[keep:]})
+        return dropped
+    
+    def subscribe(self, observer):
+        """Call observer(plant, operation, details) after every recorded mutation"""
+        self._observers = self._observers + (observer,)
+    
+    def unsubscribe(self, observer):
+        self._observers = tuple(o for o in self._observers if o is not observer)
+    
+    def _notify(self, operation: str, details: dict):
+        for observer in self._observers:
+            observer(self, operation, details)
+    
+    def add_care_note(self, note: str) -> bool:
+        """Add a care note with validation"""
+        is_valid, error = RegexValidator.validate_pattern(
+            note, 
+            PlantValidationPatterns.CARE_NOTES, 
+            "Care note"
+        )
+        
+        if is_valid:
+            if self._cow_guard is not None:
+                self._cow_guard.before_write(self, 'care_history')
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+            entry = {
+                'timestamp': timestamp,
+                'note': intern_care_note(note),
+                'type': 'manual_note'
+            }
+            self.care_history.append(entry)
+            if self._observers:
+                self._notify('care_note', entry)
+            return True
+        else:
+            print(f"Invalid care note: {error}")
+            return False
+    
+    def add_disease(self, disease_name: str) -> bool:
+        """Add a disease with name validation"""
+        is_valid, error = RegexValidator.validate_pattern(
+            disease_name, 
+            PlantValidationPatterns.DISEASE_NAME, 
+            "Disease name"
+        )
+        
+        if is_valid:
+            if disease_name.lower() not in [d['name'].lower() for d in self.diseases]:
+                if self._cow_guard is not None:
+                    self._cow_guard.before_write(self, 'diseases')
+                disease = {
+                    'name': GARDEN_STRINGS.intern(disease_name),
+                    'diagnosed_date': datetime.now().strftime("%Y-%m-%d"),
+                    'severity': random.randint(1, 10)
+                }
+                self.diseases.append(disease)
+                self._invalidate_report('diseases')
+                if self._observers:
+                    self._notify('disease', disease)
+            return True
+        else:
+            print(f"Invalid disease name: {error}")
+            return False
+    
+    def water_plant(self, amount_str: str) -> bool:
+        """Water the plant with amount validation"""
+        is_valid, error = RegexValidator.validate_pattern(
+            amount_str, 
+            PlantValidationPatterns.WATER_AMOUNT, 
+            "Water amount"
+        )
+        
+        if is_valid:
+            amount = float(amount_str)
+            if self._cow_guard is not None:
+                self._cow_guard.before_write(self, 'water_level')
+            self.water_level = min(100, self.water_level + amount)
+            if self._observers:
+                self._notify('water', {'amount': amount, 'water_level': self.water_level})
+            self.add_care_note(f"Watered with {amount} units")
+            return True
+        else:
+            print(f"Invalid water amount: {error}")
+            return False
+    
+    def add_trait(self, trait: str) -> bool:
+        """Add a special trait with validation"""
+        is_valid, error = RegexValidator.validate_pattern(
+            trait, 
+            PlantValidationPatterns.PLANT_TRAIT, 
+            "Plant trait"
+        )
+        
+        if is_valid and trait not in self.special_traits:
+            if self._cow_guard is not None:
+                self._cow_guard.before_write(self, 'special_traits')
+            self.special_traits.append(GARDEN_STRINGS.intern(trait))
+            self._invalidate_report('traits')
+            if self._observers:
+                self._notify('trait', {'trait': trait})
+            return True
+        else:
+            if not is_valid:
+                print(f"Invalid plant trait: {error}")
+            return False
+    
+    def _invalidate_report(self, section: str):
+        """Drop one cached report section so it is re-validated on next use"""
+        self._report_sections.pop(section, None)
+        self._report = None
+    
+    def _report_field_section(self, field_name: str, value, pattern_key: str) -> tuple:
+        """Validate one field, returning its (report entry, error) pair"""
+        pattern = getattr(PlantValidationPatterns, pattern_key)
+        is_valid, error = RegexValidator.validate_pattern(value, pattern, field_name)
+        entry = {
+            'value': value,
+            'valid': is_valid,
+            'pattern_key': pattern_key
+        }
+        return entry, (None if is_valid else f"{field_name}: {error}")
+    
+    def _report_list_section(self, values, pattern_key: str, label: str) -> list:
+        """Validate disease or trait names, returning warnings for invalid ones"""
+        pattern = getattr(PlantValidationPatterns, pattern_key)
+        return [
+            f"Invalid {label}: {value}"
+            for value in values
+            if not RegexValidator.validate_pattern(value, pattern, label)[0]
+        ]
+    
+    def get_validation_report(self) -> dict:
+        """
+        Generate a comprehensive validation report for the plant
+        
+        Sections are validated lazily and cached until the field, disease list
+        or trait list they cover changes, so repeated calls on an unchanged
+        plant return the same report object. Treat it as read-only.
+        Each validation entry names its pattern by PlantValidationPatterns key.
+        """
+        if self._report is not None:
+            return self._report
+        
+        report = {
+            'plant_id': self.plant_id,
+            'validations': {},
+            'errors': [],
+            'warnings': []
+        }
+        sections = self._report_sections
+        
+        # Check all validation patterns
+        for field_name, attr, pattern_key, skip_empty in self.REPORT_FIELDS:
+            if field_name not in sections:
+                value = getattr(self, attr)
+                if skip_empty and not value:
+                    sections[field_name] = None
+                else:
+                    sections[field_name] = self._report_field_section(field_name, value, pattern_key)
+            section = sections[field_name]
+            if section is None:
+                continue
+            entry, error = section
+            report['validations'][field_name] = entry
+            if error:
+                report['errors'].append(error)
+        
+        # Check diseases
+        if 'diseases' not in sections:
+            sections['diseases'] = self._report_list_section(
+                [disease['name'] for disease in self.diseases], 'DISEASE_NAME', "disease name"
+            )
+        report['warnings'].extend(sections['diseases'])
+        
+        # Check traits
+        if 'traits' not in sections:
+            sections['traits'] = self._report_list_section(self.special_traits, 'PLANT_TRAIT', "trait")
+        report['warnings'].extend(sections['traits'])
+        
+        self._report = report
+        return report
+
+class PlantDataAnalyzer:
+    """
+    Use regex patterns to analyze and extract information from plant data
+    """
+    
+    @staticmethod
+    def extract_plant_mentions(text: str) -> List[str]:
+        """Extract plant mentions from text using regex"""
+        # Pattern to find plant-related words
+        plant_pattern = r'\b(?:flower|herb|succulent|vegetable|tree|plant|bloom|leaf|root|stem)\b'
+        return re.findall(plant_pattern, text, re.IGNORECASE)
+    
+    @staticmethod
+    def extract_dates_from_notes(care_history: List[dict]) -> List[str]:
+        """Extract all dates from care notes"""
+        dates = []
+        date_pattern = r'\d{4}-\d{2}-\d{2}'
+        
+        for entry in care_history:
+            if 'note' in entry:
+                found_dates = re.findall(date_pattern, entry['note'])
+                dates.extend(found_dates)
+        
+        return dates
+    
+    @staticmethod
+    def extract_epoch_dates_from_notes(care_history: List[dict]) -> ParsedColumn:
+        """Extract dates from care notes as epoch seconds, flagging impossible ones"""
+        return parse_datetime_column(PlantDataAnalyzer.extract_dates_from_notes(care_history), 'date')
+    
+    @staticmethod
+    def extract_numeric_values(text: str) -> List[str]:
+        """Extract numeric values from text"""
+        # Pattern for numbers (integer or decimal)
+        number_pattern = r'\b\d+(?:\.\d+)?\b'
+        return re.findall(number_pattern, text)
+    
+    @staticmethod
+    @profiled("validate_garden_data_batch")
+    def validate_garden_data_batch(gardens_data: List[dict]) -> dict:
+        """Validate multiple garden records using regex patterns"""
+        results = {
+            'total_records': len(gardens_data),
+            'valid_records': 0,
+            'invalid_records': 0,
+            'validation_errors': [],
+            'pattern_matches': {}
+        }
+        
+        validate = PLANT_RECORD_VALIDATOR
+        for i, garden_data in enumerate(gardens_data):
+            is_valid, errors = validate(garden_data)
+            
+            if is_valid:
+                results['valid_records'] += 1
+            else:
+                results['invalid_records'] += 1
+                results['validation_errors'].append({
+                    'record_index': i,
+                    'errors': errors,
+                    'data': garden_data
+                })
+        
+        return results
+    
+    @staticmethod
+    @profiled("generate_plant_statistics")
+    def generate_plant_statistics(plants: List[ValidatedPlant]) -> dict:
+        """Generate statistics using regex pattern matching"""
+        aggregate = GardenStatsAggregate()
+        aggregate.add_plants(plants)
+        return aggregate.to_stats()
+
+# ==================== SHARDED STATISTICS ====================
+
+def _stable_hash64(key: str) -> int:
+    """64-bit hash that is identical in every worker process (unlike hash())"""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+class CountMinSketch:
+    """
+    Count-Min sketch: approximate per-key counts in fixed memory
+    Estimates never undercount; with the defaults they overcount by at most
+    ~0.1% of the total with ~98% probability.
+    """
+    
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.rows = [[0] * width for _ in range(depth)]
+    
+    def _cells(self, key: str):
+        h = _stable_hash64(key)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        width = self.width
+        return [(h1 + i * h2) % width for i in range(self.depth)]
+    
+    def add(self, key: str, count: int = 1) -> int:
+        """Count key and return its new estimate"""
+        self.total += count
+        estimate = None
+        for row, cell in zip(self.rows, self._cells(key)):
+            row[cell] += count
+            if estimate is None or row[cell] < estimate:
+                estimate = row[cell]
+        return estimate
+    
+    def estimate(self, key: str) -> int:
+        return min(row[cell] for row, cell in zip(self.rows, self._cells(key)))
+    
+    def merge(self, other: 'CountMinSketch') -> 'CountMinSketch':
+        """Add another sketch of the same shape into this one"""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Count-Min sketches must have the same width and depth to merge")
+        for row, other_row in zip(self.rows, other.rows):
+            row[:] = map(int.__add__, row, other_row)
+        self.total += other.total
+        return self
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count estimator
+    Uses 2**precision one-byte registers; standard error is about
+    1.04 / sqrt(2**precision) (~1.6% at the default precision of 12).
+    """
+    
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+    
+    def add(self, key: str):
+        h = _stable_hash64(key)
+        index = h >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        rest = h & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+    
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Small range correction: linear counting
+            return round(m * math.log(m / zeros))
+        return round(raw)
+    
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Fold another estimator of the same precision into this one"""
+        if self.precision != other.precision:
+            raise ValueError("HyperLogLog estimators must have the same precision to merge")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+class ApproximateCounter:
+    """
+    Mergeable approximate frequency table for high-cardinality fields
+    Combines a Count-Min sketch for counts, a HyperLogLog for the number of
+    distinct keys and a bounded set of heavy-hitter candidates for top-K.
+    """
+    
+    def __init__(self, top_k: int = 20, width: int = 2048, depth: int = 4, precision: int = 12):
+        self.top_k = top_k
+        self.sketch = CountMinSketch(width, depth)
+        self.distinct = HyperLogLog(precision)
+        self.candidates = {}
+        self.labels = {}
+    
+    def add(self, key: str, count: int = 1, label: Optional[str] = None):
+        """Count key; label, if given, is how the key is reported (see preferred_place_label)"""
+        estimate = self.sketch.add(key, count)
+        self.distinct.add(key)
+        self.candidates[key] = estimate
+        if label is not None:
+            self.labels[key] = preferred_place_label(label, self.labels.get(key))
+        if len(self.candidates) > 4 * self.top_k:
+            self._prune()
+    
+    def _prune(self):
+        keep = heapq.nlargest(self.top_k, self.candidates.items(), key=lambda item: item[1])
+        self.candidates = dict(keep)
+        labels = self.labels
+        self.labels = {key: labels[key] for key in self.candidates if key in labels}
+    
+    def merge(self, other: 'ApproximateCounter') -> 'ApproximateCounter':
+        self.sketch.merge(other.sketch)
+        self.distinct.merge(other.distinct)
+        for key in other.candidates:
+            self.candidates[key] = 0
+        for key, label in other.labels.items():
+            self.labels[key] = preferred_place_label(label, self.labels.get(key))
+        estimate = self.sketch.estimate
+        self.candidates = {key: estimate(key) for key in self.candidates}
+        self._prune()
+        return self
+    
+    def most_common(self) -> List[Tuple[str, int]]:
+        estimate = self.sketch.estimate
+        labels = self.labels
+        ranked = sorted(((labels.get(key, key), estimate(key)) for key in self.candidates),
+                        key=lambda item: item[1], reverse=True)
+        return ranked[:self.top_k]
+
+class GardenStatsAggregate:
+    """
+    Mergeable partial aggregate behind PlantDataAnalyzer.generate_plant_statistics
+    
+    Each shard of a garden builds its own aggregate; merge() combines them and
+    to_stats() produces the same dict as generate_plant_statistics. Fields
+    listed in approximate_fields are tracked with ApproximateCounter instead of
+    exact counts and report only their estimated top-K keys.
+    """
+    
+    COUNTER_FIELDS = ('plants_by_type', 'common_traits', 'disease_frequency',
+                      'location_distribution', 'email_domains')
+    APPROXIMATE_FIELDS = ('location_distribution', 'email_domains')
+    
+    def __init__(self, approximate_fields=(), top_k: int = 20):
+        unknown = set(approximate_fields) - set(self.APPROXIMATE_FIELDS)
+        if unknown:
+            raise ValueError(f"Fields cannot be approximated: {', '.join(sorted(unknown))}")
+        self.total_plants = 0
+        self.approximate_fields = tuple(approximate_fields)
+        self.top_k = top_k
+        self.counters = {
+            name: ApproximateCounter(top_k) if name in self.approximate_fields else Counter()
+            for name in self.COUNTER_FIELDS
+        }
+        # Exact location counts are keyed by the casefolded region; this maps
+        # keys to the preferred spelling seen ('Oregon' over 'OREGON'), so the
+        # report does not depend on plant or shard order
+        self.place_labels = {}
+    
+    def _count(self, name: str, key: str, label: Optional[str] = None):
+        counter = self.counters[name]
+        if isinstance(counter, Counter):
+            counter[key] += 1
+            if label is not None:
+                self.place_labels[key] = preferred_place_label(label, self.place_labels.get(key))
+        else:
+            counter.add(key, label=label)
+    
+    def _add(self, plant_type, traits, disease_names, region, email_domain):
+        self.total_plants += 1
+        counters = self.counters
+        counters['plants_by_type'][plant_type] += 1
+        counters['common_traits'].update(traits)
+        counters['disease_frequency'].update(disease_names)
+        if region is not None:
+            # Spellings that differ only in case are counted together
+            self._count('location_distribution', region.casefold(), region)
+        if email_domain is not None:
+            self._count('email_domains', email_domain)
+    
+    @staticmethod
+    def plant_row(plant: ValidatedPlant) -> tuple:
+        """The fields the aggregate counts, as a plain picklable tuple"""
+        # Location and email domain were parsed when the plant was set up
+        return (plant.plant_type, list(plant.special_traits),
+                [disease['name'] for disease in plant.diseases],
+                plant.region, plant.email_domain)
+    
+    def add_plant(self, plant: ValidatedPlant):
+        self._add(*self.plant_row(plant))
+    
+    def add_plants(self, plants):
+        for plant in plants:
+            self.add_plant(plant)
+        return self
+    
+    def add_record(self, record: dict):
+        """Count a plant record dict as read from a data file"""
+        location = parse_location(record.get('location'))
+        self._add(record.get('type'), record.get('special_traits') or [],
+                  [d['name'] if isinstance(d, dict) else d for d in record.get('diseases') or []],
+                  location[1] if location else None, parse_email_domain(record.get('owner_email')))
+    
+    def merge(self, other: 'GardenStatsAggregate') -> 'GardenStatsAggregate':
+        """Fold another shard's aggregate into this one"""
+        if (other.approximate_fields, other.top_k) != (self.approximate_fields, self.top_k):
+            raise ValueError("Aggregates must use the same approximation settings to merge")
+        self.total_plants += other.total_plants
+        for name, counter in self.counters.items():
+            if isinstance(counter, Counter):
+                counter.update(other.counters[name])
+            else:
+                counter.merge(other.counters[name])
+        for key, label in other.place_labels.items():
+            self.place_labels[key] = preferred_place_label(label, self.place_labels.get(key))
+        return self
+    
+    def to_stats(self) -> dict:
+        stats = {'total_plants': self.total_plants}
+        approximate = {}
+        labels = self.place_labels
+        for name, counter in self.counters.items():
+            if isinstance(counter, Counter):
+                stats[name] = {labels.get(key, key): count for key, count in counter.items()} \
+                    if name == 'location_distribution' else dict(counter)
+            else:
+                stats[name] = dict(counter.most_common())
+                approximate[name] = {
+                    'distinct_estimate': counter.distinct.estimate(),
+                    'top_k': counter.top_k
+                }
+        if approximate:
+            stats['approximate'] = approximate
+        return stats
+
+def _aggregate_shard(shard, approximate_fields, top_k) -> GardenStatsAggregate:
+    """Map step: aggregate one shard (a JSON-lines path or a list of plants, records or plant rows)"""
+    aggregate = GardenStatsAggregate(approximate_fields, top_k)
+    if isinstance(shard, str):
+        with open(shard, 'r', encoding='utf-8') as handle:
+            for line in handle:
+                if line.strip():
+                    aggregate.add_record(json.loads(line))
+    else:
+        for item in shard:
+            if isinstance(item, dict):
+                aggregate.add_record(item)
+            elif isinstance(item, tuple):
+                aggregate._add(*item)
+            else:
+                aggregate.add_plant(item)
+    return aggregate
+
+def _picklable_shard(shard):
+    # Plants in a VersionedGarden or with observers hold locks and bound
+    # methods, so only the counted fields are sent to the workers
+    if isinstance(shard, str):
+        return shard
+    return [GardenStatsAggregate.plant_row(item) if isinstance(item, (ValidatedPlant, PlantView)) else item
+            for item in shard]
+
+def shard_plants(plants: list, shard_count: int) -> List[list]:
+    """Split a plant collection into shard_count contiguous shards"""
+    size = max(1, math.ceil(len(plants) / max(1, shard_count)))
+    return [plants[i:i + size] for i in range(0, len(plants), size)]
+
+def compute_sharded_statistics(shards, processes: Optional[int] = None,
+                               approximate_fields=(), top_k: int = 20) -> dict:
+    """
+    Map-reduce garden statistics over shards on a process pool
+    
+    shards may mix JSON-lines file paths and in-memory lists of plants or
+    record dicts; plants are sent to the workers as plant_row() tuples, so
+    plants held by a VersionedGarden or with observers work too. Partial aggregates are merged in shard order, so exact mode
+    returns the same dict as generate_plant_statistics over the concatenated
+    shards.
+    """
+    shards = list(shards)
+    result = GardenStatsAggregate(approximate_fields, top_k)
+    if not shards:
+        return result.to_stats()
+    
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        partials = pool.map(_aggregate_shard, map(_picklable_shard, shards),
+                            [approximate_fields] * len(shards), [top_k] * len(shards))
+        for partial in partials:
+            result.merge(partial)
+    return result.to_stats()
+
+# ==================== GARDEN SNAPSHOTS ====================
+
+class PlantView:
+    """
+    Immutable point-in-time view of a ValidatedPlant
+    
+    Scalar fields are copied; care_history, diseases and special_traits are
+    kept as (shared list, length) pairs, which is safe because plants only
+    append to those lists in place. Freezing a plant is therefore O(1).
+    """
+    
+    SCALAR_FIELDS = ('plant_id', 'name', 'plant_type', 'created_date', 'care_notes',
+                     'location', 'owner_email', 'city', 'region', 'email_domain',
+                     'health', 'water_level', 'nutrients', 'sunlight', 'care_history_offset')
+    LIST_FIELDS = ('care_history', 'diseases', 'special_traits', 'care_summaries')
+    
+    __slots__ = SCALAR_FIELDS + tuple(f"_{name}" for name in LIST_FIELDS)
+    
+    def __init__(self, plant: ValidatedPlant):
+        for name in self.SCALAR_FIELDS:
+            object.__setattr__(self, name, getattr(plant, name))
+        for name in self.LIST_FIELDS:
+            values = getattr(plant, name)
+            object.__setattr__(self, f"_{name}", (values, len(values)))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("PlantView is read-only")
+    
+    @property
+    def care_history(self) -> list:
+        values, length = self._care_history
+        return values[:length]
+    
+    @property
+    def diseases(self) -> list:
+        values, length = self._diseases
+        return values[:length]
+    
+    @property
+    def special_traits(self) -> list:
+        values, length = self._special_traits
+        return values[:length]
+    
+    @property
+    def care_summaries(self) -> list:
+        values, length = self._care_summaries
+        return values[:length]
+    
+    def iter_care_history(self, include_summaries: bool = True):
+        return ValidatedPlant.iter_care_history(self, include_summaries)
+    
+    def to_dict(self) -> dict:
+        return ValidatedPlant.to_dict(self)
+
+class _SnapshotEpoch:
+    """Pre-images of plants first written after a snapshot was taken"""
+    
+    __slots__ = ('number', 'version', 'preimages', 'next', '__weakref__')
+    
+    def __init__(self, number: int, version: int):
+        self.number = number
+        self.version = version
+        self.preimages = {}
+        self.next = None
+
+class GardenSnapshot:
+    """
+    Consistent, read-only view of a VersionedGarden at one version
+    Iterating yields PlantView objects as they were when the snapshot was taken.
+    """
+    
+    def __init__(self, garden: 'VersionedGarden', epoch: _SnapshotEpoch, plants: list, count: int):
+        self.garden = garden
+        self.version = epoch.version
+        self._epoch = epoch
+        self._plants = plants
+        self._count = count
+    
+    def __len__(self):
+        return self._count
+    
+    def __getitem__(self, index: int) -> PlantView:
+        if not -self._count <= index < self._count:
+            raise IndexError("snapshot index out of range")
+        return self._resolve(self._plants[index % self._count])
+    
+    def __iter__(self):
+        plants = self._plants
+        for i in range(self._count):
+            yield self._resolve(plants[i])
+    
+    def _find_preimage(self, plant) -> Optional[PlantView]:
+        # The oldest pre-image recorded at or after this snapshot is the plant
+        # as it was when the snapshot was taken
+        epoch = self._epoch
+        key = id(plant)
+        while epoch is not None:
+            view = epoch.preimages.get(key)
+            if view is not None:
+                return view
+            epoch = epoch.next
+        return None
+    
+    def _resolve(self, plant: ValidatedPlant) -> PlantView:
+        view = self._find_preimage(plant)
+        if view is not None:
+            return view
+        with self.garden._lock:
+            # Not written since the snapshot (re-checked under the writers' lock)
+            return self._find_preimage(plant) or PlantView(plant)
+
+class VersionedGarden:
+    """
+    Plant collection with cheap copy-on-write snapshots
+    
+    snapshot() is O(1): it records the current length of the (append-only)
+    plant list and opens a new epoch. The first write to a plant after a
+    snapshot stores a frozen pre-image of it in that epoch, so readers see
+    the snapshot version while writers carry on; plants never written while
+    a snapshot is alive cost nothing. Epochs are only weakly held by the
+    garden, so pre-images are released together with the last snapshot that
+    needs them. Removing a plant copies the plant list.
+    """
+    
+    def __init__(self, plants=()):
+        self._plants = []
+        self._lock = threading.Lock()
+        self._epoch_ref = None
+        self._epoch_number = 0
+        self.version = 0
+        self.removals = 0
+        self.field_versions = {}
+        self.extend(plants)
+    
+    def __len__(self):
+        return len(self._plants)
+    
+    def __iter__(self):
+        # The list is append-only (remove() swaps in a new one), so walking it
+        # by index is safe against concurrent appends without copying it
+        plants = self._plants
+        index = 0
+        while index < len(plants):
+            yield plants[index]
+            index += 1
+    
+    def __getitem__(self, index):
+        return self._plants[index]
+    
+    def append(self, plant: ValidatedPlant):
+        with self._lock:
+            plant._cow_guard = self
+            self._plants.append(plant)
+            self.version += 1
+    
+    def extend(self, plants):
+        for plant in plants:
+            self.append(plant)
+    
+    def remove(self, plant: ValidatedPlant):
+        with self._lock:
+            # Snapshots keep the old list, so removal copies instead of mutating
+            self._plants = [p for p in self._plants if p is not plant]
+            # Later writes to the plant are not guarded: freeze it now for the
+            # snapshots that still list it
+            epoch = self._live_epoch()
+            if epoch is not None and plant._cow_epoch != epoch.number and id(plant) not in epoch.preimages:
+                epoch.preimages[id(plant)] = PlantView(plant)
+                plant._cow_epoch = epoch.number
+            plant._cow_guard = None
+            self.version += 1
+            self.removals += 1
+    
+    def _live_epoch(self) -> Optional[_SnapshotEpoch]:
+        return self._epoch_ref() if self._epoch_ref is not None else None
+    
+    def before_write(self, plant: ValidatedPlant, field_name: Optional[str] = None):
+        """
+        Called by a plant before each mutation: save its pre-image if a snapshot needs it
+        field_name records which attribute is written, so views that depend on
+        a few fields can tell their writes apart from all the others.
+        """
+        with self._lock:
+            # Import workers, the journal flusher and the UI thread all write,
+            # so the counter is only ever bumped under the lock
+            self.version += 1
+            if field_name is not None:
+                self.field_versions[field_name] = self.version
+            epoch = self._live_epoch()
+            if epoch is None or plant._cow_epoch == epoch.number:
+                return
+            if id(plant) not in epoch.preimages:
+                epoch.preimages[id(plant)] = PlantView(plant)
+                plant._cow_epoch = epoch.number
+    
+    def snapshot(self) -> GardenSnapshot:
+        """Point-in-time, read-only view of the garden, in O(1)"""
+        with self._lock:
+            epoch = self._live_epoch()
+            if epoch is None or epoch.version != self.version:
+                previous = epoch
+                self._epoch_number += 1
+                epoch = _SnapshotEpoch(self._epoch_number, self.version)
+                if previous is not None:
+                    previous.next = epoch
+                self._epoch_ref = weakref.ref(epoch)
+            return GardenSnapshot(self, epoch, self._plants, len(self._plants))
+
+# ==================== ASYNC BULK IMPORT ====================
+
+@dataclass
+class ImportMetrics:
+    """
+    Throughput and latency counters for a bulk import run
+    Latency is measured per record from the moment it was read to the moment
+    its batch was committed; only the most recent samples are kept.
+    """
+    records_read: int = 0
+    records_committed: int = 0
+    records_rejected: int = 0
+    batches_committed: int = 0
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    latency_samples: deque = field(default_factory=lambda: deque(maxlen=10000))
+    rejected_samples: deque = field(default_factory=lambda: deque(maxlen=100))
+    
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at or time.perf_counter()
+        return max(end - self.started_at, 1e-9) if self.started_at else 0.0
+    
+    @property
+    def throughput(self) -> float:
+        """Committed records per second"""
+        elapsed = self.elapsed
+        return self.records_committed / elapsed if elapsed else 0.0
+    
+    def latency_percentile(self, percentile: float) -> float:
+        """Read-to-commit latency in seconds at the given percentile (0-100)"""
+        if not self.latency_samples:
+            return 0.0
+        ordered = sorted(self.latency_samples)
+        index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+        return ordered[index]
+    
+    def summary(self) -> dict:
+        return {
+            'records_read': self.records_read,
+            'records_committed': self.records_committed,
+            'records_rejected': self.records_rejected,
+            'batches_committed': self.batches_committed,
+            'elapsed_seconds': round(self.elapsed, 4),
+            'records_per_second': round(self.throughput, 1),
+            'latency_p50_ms': round(self.latency_percentile(50) * 1000, 3),
+            'latency_p95_ms': round(self.latency_percentile(95) * 1000, 3),
+            'latency_p99_ms': round(self.latency_percentile(99) * 1000, 3),
+        }
+
+@dataclass
+class ImportRejection:
+    """A record that could not be imported, with the reasons why"""
+    source: str
+    record: object
+    errors: List[str]
+
+def _parse_record_line(line, source: str):
+    """Decode one JSON line into a record dict, an ImportRejection, or None for blank lines"""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return ImportRejection(source, line[:200], [f"Malformed JSON: {e}"])
+    if not isinstance(record, dict):
+        return ImportRejection(source, line[:200], ["Record must be a JSON object"])
+    return record
+
+def _read_line_chunk(handle, chunk_size: int) -> List[str]:
+    """Blocking read of up to chunk_size lines (run in an executor)"""
+    lines = []
+    for _ in range(chunk_size):
+        line = handle.readline()
+        if not line:
+            break
+        lines.append(line)
+    return lines
+
+async def read_jsonl_file(path: str, chunk_size: int = 1000):
+    """
+    Async reader yielding records from a JSON-lines file
+    Disk reads are done in chunks on the default executor so the event loop
+    keeps serving sockets while large files are read.
+    """
+    loop = asyncio.get_running_loop()
+    handle = await loop.run_in_executor(None, lambda: open(path, 'r', encoding='utf-8'))
+    try:
+        while True:
+            lines = await loop.run_in_executor(None, _read_line_chunk, handle, chunk_size)
+            if not lines:
+                break
+            for line in lines:
+                record = _parse_record_line(line, path)
+                if record is not None:
+                    yield record
+    finally:
+        handle.close()
+
+async def read_directory(directory: str, pattern: str = "*.jsonl"):
+    """Async reader yielding records from every matching file in a directory"""
+    for path in sorted(glob.glob(os.path.join(directory, pattern))):
+        async for record in read_jsonl_file(path):
+            yield record
+
+async def read_spool_directory(directory: str, suffix: str = ".jsonl", done_suffix: str = ".done"):
+    """
+    Async reader draining a queue spool directory
+    Each spool file is read fully and then renamed with done_suffix so it is
+    not imported again.
+    """
+    loop = asyncio.get_running_loop()
+    for path in sorted(glob.glob(os.path.join(directory, f"*{suffix}"))):
+        async for record in read_jsonl_file(path):
+            yield record
+        await loop.run_in_executor(None, os.replace, path, path[:-len(suffix)] + done_suffix)
+
+async def _read_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, source: str):
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            record = _parse_record_line(line.decode('utf-8', errors='replace'), source)
+            if record is not None:
+                yield record
+    finally:
+        writer.close()
+
+async def read_socket(host: str, port: int):
+    """Async reader yielding JSON-lines records from a local TCP feed until EOF"""
+    reader, writer = await asyncio.open_connection(host, port)
+    async for record in _read_stream(reader, writer, f"tcp://{host}:{port}"):
+        yield record
+
+async def read_unix_socket(path: str):
+    """Async reader yielding JSON-lines records from a Unix domain socket feed until EOF"""
+    reader, writer = await asyncio.open_unix_connection(path)
+    async for record in _read_stream(reader, writer, f"unix://{path}"):
+        yield record
+
+async def read_records(records, source: str = "memory"):
+    """Async reader over an in-memory iterable of records (useful as a stand-in source)"""
+    for record in records:
+        yield record
+        await asyncio.sleep(0)
+
+def _build_plant_chunk(records: List[dict]) -> Tuple[List[ValidatedPlant], List[Tuple[int, List[str]]]]:
+    """
+    Validate a chunk of records and build plants (run in an executor)
+    Returns the built plants and (chunk index, errors) for rejected records
+    """
+    plants = []
+    rejected = []
+    validate = PLANT_RECORD_VALIDATOR
+    for index, record in enumerate(records):
+        is_valid, errors = validate(record)
+        if is_valid:
+            try:
+                plants.append(ValidatedPlant.from_record(record))
+                continue
+            except (ValueError, TypeError, KeyError) as e:
+                errors = [f"Could not build plant: {e}"]
+        rejected.append((index, errors))
+    return plants, rejected
+
+class BulkImportService:
+    """
+    asyncio front end that streams plant records from many sources into a plant collection
+    
+    Readers feed a bounded queue (back-pressure when validation falls behind),
+    a fixed number of workers hand chunks of records to an executor for
+    validation, and accepted plants are committed to the collection in batches.
+    Validation is CPU-bound, so without an executor a process pool is used
+    when there is more than one CPU (a thread pool otherwise).
+    """
+    
+    def __init__(self, plants: list, concurrency: int = 4, queue_size: int = 1000,
+                 chunk_size: int = 100, batch_size: int = 500,
+                 executor: Optional[Executor] = None, commit=None):
+        if concurrency < 1 or queue_size < 1 or chunk_size < 1 or batch_size < 1:
+            raise ValueError("concurrency, queue_size, chunk_size and batch_size must be positive")
+        self.plants = plants
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.executor = executor
+        self.commit = commit or plants.extend
+        self.metrics = ImportMetrics()
+        self._pending = []
+        self._pending_read_times = []
+    
+    async def run(self, *sources) -> ImportMetrics:
+        """Import every record from the given async reader sources"""
+        loop = asyncio.get_running_loop()
+        owns_executor = self.executor is None
+        executor = self.executor or self._default_executor()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        
+        self.metrics = ImportMetrics(started_at=time.perf_counter())
+        workers = [asyncio.create_task(self._worker(queue, loop, executor))
+                   for _ in range(self.concurrency)]
+        producers = [asyncio.create_task(self._produce(source, queue)) for source in sources]
+        try:
+            try:
+                await asyncio.gather(*producers)
+            finally:
+                # If a source fails, stop the others but still validate and
+                # commit every record already read before re-raising
+                for producer in producers:
+                    producer.cancel()
+                await asyncio.gather(*producers, return_exceptions=True)
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if owns_executor:
+                executor.shutdown(wait=False)
+            self._flush()
+            self.metrics.finished_at = time.perf_counter()
+        return self.metrics
+    
+    def _default_executor(self) -> Executor:
+        processes = min(self.concurrency, os.cpu_count() or 1)
+        if processes > 1:
+            return ProcessPoolExecutor(max_workers=processes)
+        return ThreadPoolExecutor(max_workers=self.concurrency)
+    
+    async def _produce(self, source, queue: asyncio.Queue):
+        async for record in source:
+            self.metrics.records_read += 1
+            if isinstance(record, ImportRejection):
+                self._reject(record)
+                continue
+            await queue.put((record, time.perf_counter()))
+    
+    async def _worker(self, queue: asyncio.Queue, loop, executor: Executor):
+        while True:
+            items = [await queue.get()]
+            while len(items) < self.chunk_size and not queue.empty():
+                items.append(queue.get_nowait())
+            try:
+                records = [record for record, _ in items]
+                plants, rejected = await loop.run_in_executor(executor, _build_plant_chunk, records)
+                rejected_indices = set()
+                for index, errors in rejected:
+                    rejected_indices.add(index)
+                    self._reject(ImportRejection("validation", records[index], errors))
+                read_times = [read_at for i, (_, read_at) in enumerate(items)
+                              if i not in rejected_indices]
+                self._pending.extend(plants)
+                self._pending_read_times.extend(read_times)
+                if len(self._pending) >= self.batch_size:
+                    self._flush()
+            except Exception as e:
+                for record, _ in items:
+                    self._reject(ImportRejection("validation", record, [f"Import failed: {e}"]))
+            finally:
+                for _ in items:
+                    queue.task_done()
+    
+    def _flush(self):
+        """Commit pending plants to the collection as one batch"""
+        if not self._pending:
+            return
+        batch, read_times = self._pending, self._pending_read_times
+        self._pending, self._pending_read_times = [], []
+        self.commit(batch)
+        
+        committed_at = time.perf_counter()
+        self.metrics.records_committed += len(batch)
+        self.metrics.batches_committed += 1
+        self.metrics.latency_samples.extend(committed_at - read_at for read_at in read_times)
+    
+    def _reject(self, rejection: ImportRejection):
+        self.metrics.records_rejected += 1
+        self.metrics.rejected_samples.append(rejection)
+
+def run_bulk_import(plants: list, *sources, **options) -> ImportMetrics:
+    """Synchronous helper: run a BulkImportService over the sources to completion"""
+    service = BulkImportService(plants, **options)
+    return asyncio.run(service.run(*sources))
+
+# ==================== MUTATION JOURNAL ====================
+
+class PlantJournal:
+    """
+    Append-only write-ahead journal for plant mutations, with periodic snapshots
+    
+    Every tracked plant reports its mutations (care notes, waterings, diseases,
+    traits, field edits) as one compact JSON line, so saving after a single
+    care event costs one small append whatever the garden size. Records are
+    group-committed: buffered until group_size records are pending or
+    group_interval seconds have passed, then written together. fsync policy:
+    'always' syncs every record, 'batch' syncs each group, 'never' leaves
+    syncing to the OS. After compact_every records the background flusher
+    folds the journal into a snapshot and drops the records it covers;
+    writers only wait while the plants are frozen, not while they are saved.
+    """
+    
+    FSYNC_POLICIES = ('always', 'batch', 'never')
+    SNAPSHOT_FILE = "garden.snapshot.jsonl"
+    JOURNAL_FILE = "garden.journal.jsonl"
+    
+    # Compact operation codes used in journal records
+    _OPERATION_CODES = {'add': 'a', 'remove': 'x', 'care_note': 'n', 'water': 'w',
+                        'disease': 'd', 'trait': 't', 'field': 'f', 'compact': 'c'}
+    
+    def __init__(self, directory: str, fsync: str = 'batch', group_size: int = 64,
+                 group_interval: float = 0.05, compact_every: int = 100_000):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"fsync policy must be one of: {', '.join(self.FSYNC_POLICIES)}")
+        self.directory = directory
+        self.fsync = fsync
+        self.group_size = 1 if fsync == 'always' else max(1, group_size)
+        self.group_interval = group_interval
+        self.compact_every = compact_every
+        
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, self.JOURNAL_FILE)
+        
+        self.plants = {}
+        self._keys = {}
+        self._next_key = 0
+        self._sequence = 0
+        self._records_since_snapshot = 0
+        self._pending = []
+        self._pending_since = 0.0
+        self._lock = threading.RLock()
+        # Held for a whole compaction, so the flusher and compact() callers never share the temp files
+        self._compact_lock = threading.Lock()
+        self._handle = None
+        self._flusher = None
+        self._closed = threading.Event()
+        self._wake = threading.Event()
+    
+    # ---------- startup and replay ----------
+    
+    def open(self) -> List[ValidatedPlant]:
+        """Load the snapshot, replay the journal on top of it and start journaling"""
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot_sequence = self._load_snapshot()
+        self._replay_journal(snapshot_sequence)
+        
+        self._handle = open(self.journal_path, 'a', encoding='utf-8')
+        for plant in self.plants.values():
+            plant.subscribe(self._on_mutation)
+        
+        # The flusher also runs compactions, so it is started whatever the policy
+        self._closed.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        return list(self.plants.values())
+    
+    def _load_snapshot(self) -> int:
+        if not os.path.exists(self.snapshot_path):
+            return 0
+        with open(self.snapshot_path, 'r', encoding='utf-8') as handle:
+            header = json.loads(handle.readline())
+            for line in handle:
+                entry = json.loads(line)
+                self._register(ValidatedPlant.from_dict(entry['plant']), entry['key'])
+        self._sequence = header['sequence']
+        return header['sequence']
+    
+    def _replay_journal(self, snapshot_sequence: int):
+        if not os.path.exists(self.journal_path):
+            return
+        good_offset = 0
+        with open(self.journal_path, 'rb') as handle:
+            for raw in handle:
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    # Torn write at the tail: drop it and everything after it
+                    break
+                good_offset += len(raw)
+                if record['s'] > snapshot_sequence:
+                    self._apply(record)
+                    self._sequence = record['s']
+                    self._records_since_snapshot += 1
+        if good_offset < os.path.getsize(self.journal_path):
+            with open(self.journal_path, 'r+b') as handle:
+                handle.truncate(good_offset)
+    
+    def _apply(self, record: dict):
+        """Apply one journal record to the in-memory plants"""
+        op = record['o']
+        if op == 'a':
+            self._register(ValidatedPlant.from_dict(record['v']), record['p'])
+            return
+        plant = self.plants.get(record['p'])
+        if plant is None:
+            return
+        value = record.get('v')
+        position = record.get('i')
+        if op == 'x':
+            del self.plants[record['p']]
+            self._keys.pop(id(plant), None)
+        elif op == 'n':
+            if position is None or plant.care_history_offset + len(plant.care_history) < position:
+                plant.care_history.append(intern_care_entry(value))
+        elif op == 'w':
+            plant.water_level = value
+        elif op == 'd':
+            if position is None or len(plant.diseases) < position:
+                plant.diseases.append(value)
+                plant._invalidate_report('diseases')
+        elif op == 't':
+            if position is None or len(plant.special_traits) < position:
+                plant.special_traits.append(GARDEN_STRINGS.intern(value))
+                plant._invalidate_report('traits')
+        elif op == 'f':
+            setattr(plant, value[0], value[1])
+        elif op == 'c' and (position is None or plant.care_history_offset < position):
+            plant.care_history = plant.care_history[value['dropped']:]
+            plant.care_history_offset += value['dropped']
+            plant.care_summaries = list(plant.care_summaries[:value.get('keep', 0)]) + value['summaries']
+    
+    def _register(self, plant: ValidatedPlant, key: int):
+        self.plants[key] = plant
+        self._keys[id(plant)] = key
+        self._next_key = max(self._next_key, key + 1)
+    
+    # ---------- recording ----------
+    
+    def track(self, plant: ValidatedPlant):
+        """Start journaling a plant, recording its full current state"""
+        with self._lock:
+            if self._handle is None:
+                raise ValueError("Journal is not open: call open() before tracking plants")
+            if id(plant) in self._keys:
+                return
+            key = self._next_key
+            self._register(plant, key)
+            self._append('a', key, plant.to_dict())
+        plant.subscribe(self._on_mutation)
+    
+    def untrack(self, plant: ValidatedPlant):
+        """Stop journaling a plant and record its removal"""
+        plant.unsubscribe(self._on_mutation)
+        with self._lock:
+            key = self._keys.pop(id(plant), None)
+            if key is not None:
+                del self.plants[key]
+                self._append('remove', key)
+    
+    def _on_mutation(self, plant: ValidatedPlant, operation: str, details: dict):
+        key = self._keys.get(id(plant))
+        if key is None:
+            return
+        # The plant changes before it reports, so a snapshot frozen in between
+        # already holds the change. Appends and compactions record where they
+        # leave the plant ('i') and replay skips them when it is already there;
+        # field and water records set absolute values and replay harmlessly.
+        position = None
+        if operation == 'water':
+            value = details['water_level']
+        elif operation == 'trait':
+            value, position = details['trait'], len(plant.special_traits)
+        elif operation == 'field':
+            value = [details['field'], details['value']]
+        else:
+            value = details
+            if operation == 'care_note':
+                position = plant.care_history_offset + len(plant.care_history)
+            elif operation == 'disease':
+                position = len(plant.diseases)
+            elif operation == 'compact':
+                position = plant.care_history_offset
+        with self._lock:
+            self._append(operation, key, value, position)
+    
+    def _append(self, operation: str, key: int, value=None, position: Optional[int] = None):
+        if self._handle is None:
+            raise ValueError("Journal is not open: call open() before recording plants")
+        self._sequence += 1
+        record = {'s': self._sequence, 'o': self._OPERATION_CODES.get(operation, operation), 'p': key}
+        if value is not None:
+            record['v'] = value
+        if position is not None:
+            record['i'] = position
+        self._pending.append(json.dumps(record, separators=(',', ':')))
+        if not self._pending_since:
+            self._pending_since = time.monotonic()
+        if (len(self._pending) >= self.group_size
+                or time.monotonic() - self._pending_since >= self.group_interval):
+            self.commit()
+    
+    def commit(self):
+        """Write pending records as one group and sync according to the fsync policy"""
+        with self._lock:
+            if not self._pending or self._handle is None:
+                return
+            self._write_pending()
+            if self.fsync != 'never':
+                os.fsync(self._handle.fileno())
+            
+            if self._records_since_snapshot >= self.compact_every:
+                # Snapshots are written by the flusher, never in the caller
+                self._wake.set()
+    
+    def _write_pending(self):
+        if self._pending:
+            self._handle.write("\n".join(self._pending) + "\n")
+            self._records_since_snapshot += len(self._pending)
+            self._pending = []
+            self._pending_since = 0.0
+        self._handle.flush()
+    
+    def _flush_loop(self):
+        # With fsync='always' every record is committed as it is appended
+        interval = self.group_interval if self.group_interval and self.fsync != 'always' else None
+        while not self._closed.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            if self._closed.is_set():
+                break
+            if self._pending:
+                self.commit()
+            if self._records_since_snapshot >= self.compact_every:
+                self.compact()
+    
+    # ---------- compaction ----------
+    
+    def compact(self):
+        """
+        Write a snapshot of every tracked plant and drop the journal records it covers
+        Plants are frozen as PlantViews (O(1) each) under the lock; serializing
+        and writing the snapshot happen outside it while recording carries on.
+        """
+        with self._compact_lock:
+            self._compact()
+    
+    def _compact(self):
+        with self._lock:
+            if self._handle is None:
+                raise ValueError("Journal is not open")
+            self._write_pending()
+            sequence = self._sequence
+            covered_bytes = os.path.getsize(self.journal_path)
+            frozen = [(key, PlantView(plant)) for key, plant in self.plants.items()]
+            self._records_since_snapshot = 0
+        
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            handle.write(json.dumps({'sequence': sequence, 'plants': len(frozen)}) + "\n")
+            for key, view in frozen:
+                handle.write(json.dumps({'key': key, 'plant': view.to_dict()},
+                                        separators=(',', ':')) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        
+        # Records up to the snapshot sequence are skipped on replay, so a
+        # crash before the journal is rewritten cannot apply them twice
+        with self._lock:
+            if self._handle is None:
+                return
+            self._write_pending()
+            with open(self.journal_path, 'rb') as journal:
+                journal.seek(covered_bytes)
+                tail = journal.read()
+            temp_path = self.journal_path + ".tmp"
+            with open(temp_path, 'wb') as handle:
+                handle.write(tail)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._handle.close()
+            os.replace(temp_path, self.journal_path)
+            self._handle = open(self.journal_path, 'a', encoding='utf-8')
+    
+    def close(self):
+        """Commit pending records and stop the background flusher"""
+        self._closed.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        with self._lock:
+            self.commit()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        for plant in self.plants.values():
+            plant.unsubscribe(self._on_mutation)
+
+# ==================== CARE SCHEDULING ====================
+
+DAY_SECONDS = 24 * 60 * 60
+
+class CareScheduler:
+    """
+    Priority-queue scheduler for watering and feeding reminders
+    
+    Next-due times live in a binary heap keyed by (due time, sequence), with a
+    dict holding the live sequence number per (plant, task). Rescheduling
+    pushes a new entry and leaves the old one to be skipped lazily, so
+    schedule() is O(log n) and pop_due(T) returns the k due tasks in
+    O(k log n) without scanning the garden. Tracked plants are rescheduled
+    automatically when they are watered or get a feeding care note.
+    """
+    
+    # Care intervals in seconds by plant type
+    DEFAULT_INTERVALS = {
+        'Flower': {'water': 2 * DAY_SECONDS, 'feed': 14 * DAY_SECONDS},
+        'Herb': {'water': 1 * DAY_SECONDS, 'feed': 14 * DAY_SECONDS},
+        'Succulent': {'water': 7 * DAY_SECONDS, 'feed': 30 * DAY_SECONDS},
+        'Vegetable': {'water': 1 * DAY_SECONDS, 'feed': 7 * DAY_SECONDS},
+        'Tree': {'water': 7 * DAY_SECONDS, 'feed': 30 * DAY_SECONDS},
+    }
+    
+    TASKS = ('water', 'feed')
+    FEEDING_NOTE = re.compile(r'\b(?:feed|fed|fertili[sz](?:e|ed|er|ing))\b', re.IGNORECASE)
+    WATERING_NOTE_PREFIX = "Watered with"
+    
+    def __init__(self, intervals: Optional[dict] = None, clock=time.time):
+        self.intervals = intervals or self.DEFAULT_INTERVALS
+        self.clock = clock
+        self._heap = []
+        self._live = {}
+        self._sequence = 0
+        self._tk_widget = None
+        self._tk_job = None
+    
+    def __len__(self):
+        return len(self._live)
+    
+    def schedule(self, key, task: str, due: float):
+        """Set (or move) the next due time of a task"""
+        self._sequence += 1
+        self._live[(key, task)] = self._sequence
+        heapq.heappush(self._heap, (due, self._sequence, key, task))
+        if len(self._heap) > 2 * len(self._live) + 1024:
+            self._rebuild()
+    
+    def cancel(self, key, task: Optional[str] = None):
+        """Drop one task, or every task, scheduled for key"""
+        for t in ([task] if task else self.TASKS):
+            self._live.pop((key, t), None)
+    
+    def _rebuild(self):
+        """Drop stale heap entries left behind by rescheduling"""
+        live = self._live
+        self._heap = [entry for entry in self._heap if live.get((entry[2], entry[3])) == entry[1]]
+        heapq.heapify(self._heap)
+    
+    def next_due(self) -> Optional[float]:
+        """Due time of the earliest live task, or None when nothing is scheduled"""
+        heap, live = self._heap, self._live
+        while heap:
+            due, sequence, key, task = heap[0]
+            if live.get((key, task)) == sequence:
+                return due
+            heapq.heappop(heap)
+        return None
+    
+    def pop_due(self, before: Optional[float] = None) -> List[Tuple[object, str, float]]:
+        """Remove and return (key, task, due) for every task due at or before the given time"""
+        if before is None:
+            before = self.clock()
+        heap, live = self._heap, self._live
+        due_tasks = []
+        while heap and heap[0][0] <= before:
+            due, sequence, key, task = heapq.heappop(heap)
+            if live.get((key, task)) == sequence:
+                del live[(key, task)]
+                due_tasks.append((key, task, due))
+        return due_tasks
+    
+    # ---------- plant integration ----------
+    
+    def track(self, plant: ValidatedPlant):
+        """Schedule a plant's care from its history and follow its future care events"""
+        intervals = self.intervals.get(plant.plant_type, self.DEFAULT_INTERVALS['Flower'])
+        now = self.clock()
+        last_watered = self._last_care_time(plant, watering=True)
+        last_fed = self._last_care_time(plant, watering=False)
+        # Never-watered plants are due now; feeding starts one interval out
+        self.schedule(plant, 'water', last_watered + intervals['water'] if last_watered else now)
+        self.schedule(plant, 'feed', (last_fed or now) + intervals['feed'])
+        plant.subscribe(self._on_mutation)
+    
+    def untrack(self, plant: ValidatedPlant):
+        plant.unsubscribe(self._on_mutation)
+        self.cancel(plant)
+    
+    def _last_care_time(self, plant: ValidatedPlant, watering: bool) -> Optional[float]:
+        for entry in reversed(plant.care_history):
+            note = entry.get('note', '')
+            is_watering = note.startswith(self.WATERING_NOTE_PREFIX)
+            if is_watering if watering else self.FEEDING_NOTE.search(note):
+                try:
+                    return datetime.strptime(entry['timestamp'], "%Y-%m-%d %H:%M").timestamp()
+                except (KeyError, ValueError):
+                    # One malformed imported entry must not hide older, valid ones
+                    continue
+        return None
+    
+    def _on_mutation(self, plant: ValidatedPlant, operation: str, details: dict):
+        if operation == 'water':
+            task = 'water'
+        elif operation == 'care_note' and self.FEEDING_NOTE.search(details.get('note', '')):
+            task = 'feed'
+        else:
+            return
+        intervals = self.intervals.get(plant.plant_type, self.DEFAULT_INTERVALS['Flower'])
+        self.schedule(plant, task, self.clock() + intervals[task])
+    
+    # ---------- drivers ----------
+    
+    def attach_tk(self, widget, on_due, max_interval_ms: int = 60_000):
+        """
+        Drive the scheduler from a Tk event loop
+        on_due receives each non-empty list of due (key, task, due) tuples;
+        the next check is timed for the next due task, at most max_interval_ms away.
+        detach_tk() stops it.
+        """
+        def tick():
+            due_tasks = self.pop_due()
+            if due_tasks:
+                on_due(due_tasks)
+            next_due = self.next_due()
+            delay_ms = max_interval_ms
+            if next_due is not None:
+                delay_ms = int(min(max_interval_ms, max(50, (next_due - self.clock()) * 1000)))
+            self._tk_job = widget.after(delay_ms, tick)
+        self.detach_tk()
+        self._tk_widget = widget
+        self._tk_job = widget.after(0, tick)
+    
+    def detach_tk(self):
+        """Cancel the pending Tk check scheduled by attach_tk"""
+        if self._tk_job is not None:
+            self._tk_widget.after_cancel(self._tk_job)
+            self._tk_widget = self._tk_job = None
+    
+    def run_headless(self, on_due, until: Optional[float] = None,
+                     max_sleep: float = 60.0, sleep=time.sleep):
+        """Headless loop: sleep until tasks fall due and hand them to on_due, until the given time"""
+        while until is None or self.clock() < until:
+            due_tasks = self.pop_due()
+            if due_tasks:
+                on_due(due_tasks)
+            next_due = self.next_due()
+            wait = max_sleep if next_due is None else min(max_sleep, max(0.0, next_due - self.clock()))
+            if until is not None:
+                wait = min(wait, max(0.0, until - self.clock()))
+            sleep(wait)
+
+# ==================== CARE HISTORY RETENTION ====================
+
+@functools.lru_cache(maxsize=4096)
+def _care_period_start(date: str, period: str) -> str:
+    """Start date (YYYY-MM-DD) of the day, ISO week, month or year containing date, '' if date is malformed"""
+    try:
+        day = datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        return ''
+    if period == 'day':
+        return date
+    if period == 'month':
+        return date[:8] + "01"
+    if period == 'year':
+        return date[:5] + "01-01"
+    return (day - timedelta(days=day.weekday())).strftime("%Y-%m-%d")
+
+def _care_entry_period(entry: dict, period: str) -> tuple:
+    """(period, start) an entry falls in when summarizing at period; summaries never get finer"""
+    if entry.get('type') == 'care_summary':
+        if CareRetentionPolicy.PERIODS.index(entry['period']) >= CareRetentionPolicy.PERIODS.index(period):
+            return (entry['period'], entry['period_start']) if entry['period_start'] else ('', '')
+        date = entry['period_start']
+    else:
+        date = entry.get('timestamp', '')[:10]
+    start = _care_period_start(date, period) if date else ''
+    return (period, start) if start else ('', '')
+
+def _merge_care_entry(target: dict, entry: dict, period: str, start: str) -> dict:
+    """New summary for period holding target (a raw event or summary) plus entry"""
+    if target.get('type') == 'care_summary':
+        summary = dict(target)
+    else:
+        summary = _merge_care_entry({'timestamp': '', 'type': 'care_summary', 'period': period,
+                                     'period_start': start, 'waterings': 0, 'water_units': 0.0, 'notes': 0,
+                                     'first': target.get('timestamp', ''), 'last': ''}, target, period, start)
+    summary['period'], summary['period_start'] = period, start
+    summary['timestamp'] = f"{start} 00:00" if start else ''
+    if entry.get('type') == 'care_summary':
+        summary['waterings'] += entry['waterings']
+        summary['water_units'] = round(summary['water_units'] + entry['water_units'], 2)
+        summary['notes'] += entry['notes']
+        summary['last'] = entry['last']
+    else:
+        watering = _WATERING_NOTE.match(entry.get('note', ''))
+        if watering:
+            summary['waterings'] += 1
+            summary['water_units'] = round(summary['water_units'] + float(watering.group(1)), 2)
+        else:
+            summary['notes'] += 1
+        summary['last'] = entry.get('timestamp', '')
+    summary['note'] = (f"Watered {summary['waterings']} times with {summary['water_units']} units; "
+                       f"{summary['notes']} other notes")
+    return summary
+
+def summarize_care_events(events: List[dict], period: str, summaries: Optional[List[dict]] = None) -> List[dict]:
+    """
+    Fold raw care events into per-period summary entries (appended to summaries)
+    
+    Each summary counts waterings, total water units and other notes for one
+    day, ISO week, month or year. A period holding a single event keeps that
+    event as it is, since a summary would be larger than the event; an event
+    in the same period as the last existing entry replaces that entry with a
+    merged summary. Events may themselves be summaries of a finer period,
+    which is how rollup_care_summaries coarsens old history. Events without a
+    parseable date are counted in undated summaries.
+    """
+    if period not in CareRetentionPolicy.PERIODS:
+        raise ValueError(f"Summary period must be one of: {', '.join(CareRetentionPolicy.PERIODS)}")
+    summaries = summaries if summaries is not None else []
+    for entry in events:
+        entry_period, start = _care_entry_period(entry, period)
+        if summaries and _care_entry_period(summaries[-1], period) == (entry_period, start):
+            summaries[-1] = _merge_care_entry(summaries[-1], entry, entry_period or period, start)
+        else:
+            summaries.append(entry)
+    return summaries
+
+def rollup_care_summaries(summaries: List[dict], max_entries: int) -> List[dict]:
+    """
+    Keep at most max_entries summaries by folding the oldest ones into coarser periods
+    The older half is rolled up to weeks, then months, then years, until
+    the list fits; the newer half keeps its resolution. Entries that are
+    not merged are kept as the same objects.
+    """
+    for period in CareRetentionPolicy.PERIODS[1:]:
+        if len(summaries) <= max_entries:
+            break
+        split = len(summaries) - max_entries // 2
+        summaries = summarize_care_events(summaries[:split], period) + summaries[split:]
+    return summaries
+
+@dataclass(frozen=True)
+class CareRetentionPolicy:
+    """
+    How much raw care history to keep
+    The last keep_last events stay raw; older ones are summarized per period,
+    and once a plant has more than max_summaries summaries the oldest are
+    rolled up into weeks, months and years. Compaction starts once slack
+    extra events have built up, so its cost is amortized over many care events.
+    """
+    keep_last: int = 200
+    period: str = 'week'
+    slack: int = 50
+    max_summaries: int = 104
+    
+    PERIODS = ('day', 'week', 'month', 'year')
+    
+    def __post_init__(self):
+        if self.period not in self.PERIODS:
+            raise ValueError(f"Summary period must be one of: {', '.join(self.PERIODS)}")
+        if self.keep_last < 0 or self.slack < 0:
+            raise ValueError("keep_last and slack must not be negative")
+        if self.max_summaries < 1:
+            raise ValueError("max_summaries must be at least 1")
+
+class CareHistoryCompactor:
+    """
+    Incremental care history compaction for a garden
+    
+    Tracked plants that grow past their retention limit are queued; step()
+    compacts a bounded number of queued plants, so compaction can run from a
+    Tk after() hook or between other work without pausing the application.
+    """
+    
+    def __init__(self, policy: Optional[CareRetentionPolicy] = None):
+        self.policy = policy or CareRetentionPolicy()
+        self.pending = deque()
+        self._queued = set()
+        self.events_compacted = 0
+        self._tk_widget = None
+        self._tk_job = None
+    
+    def policy_for(self, plant: ValidatedPlant) -> CareRetentionPolicy:
+        return plant.retention_policy or self.policy
+    
+    def track(self, plant: ValidatedPlant):
+        plant.subscribe(self._on_mutation)
+        self._check(plant)
+    
+    def untrack(self, plant: ValidatedPlant):
+        plant.unsubscribe(self._on_mutation)
+        self._queued.discard(id(plant))
+    
+    def _on_mutation(self, plant: ValidatedPlant, operation: str, details: dict):
+        if operation == 'care_note':
+            self._check(plant)
+    
+    def _check(self, plant: ValidatedPlant):
+        policy = self.policy_for(plant)
+        if len(plant.care_history) > policy.keep_last + policy.slack and id(plant) not in self._queued:
+            self._queued.add(id(plant))
+            self.pending.append(plant)
+    
+    def step(self, max_plants: int = 100) -> int:
+        """Compact up to max_plants queued plants; returns the number of events folded"""
+        compacted = 0
+        for _ in range(min(max_plants, len(self.pending))):
+            plant = self.pending.popleft()
+            self._queued.discard(id(plant))
+            policy = self.policy_for(plant)
+            compacted += plant.compact_care_history(policy.keep_last, policy.period, policy.max_summaries)
+        self.events_compacted += compacted
+        return compacted
+    
+    def run_pending(self) -> int:
+        """Compact every queued plant (headless use)"""
+        compacted = 0
+        while self.pending:
+            compacted += self.step()
+        return compacted
+    
+    def attach_tk(self, widget, interval_ms: int = 250, max_plants: int = 100):
+        """Run one bounded compaction step every interval_ms on the Tk event loop (until detach_tk)"""
+        def tick():
+            try:
+                self.step(max_plants)
+            finally:
+                # A plant that fails to compact must not stop compaction for the session
+                self._tk_job = widget.after(interval_ms, tick)
+        self.detach_tk()
+        self._tk_widget = widget
+        self._tk_job = widget.after(interval_ms, tick)
+    
+    def detach_tk(self):
+        """Cancel the pending Tk step scheduled by attach_tk"""
+        if self._tk_job is not None:
+            self._tk_widget.after_cancel(self._tk_job)
+            self._tk_widget = self._tk_job = None
+
+# ==================== OUTBREAK DETECTION ====================
+
+UNKNOWN_REGION = "Unknown"
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def normalize_disease_name(name: str) -> str:
+    """Canonical disease name ('root  rot' -> 'Root Rot'); DISEASE_NAME is case-insensitive"""
+    return GARDEN_STRINGS.intern(" ".join(name.split()).title())
+
+@dataclass(frozen=True)
+class OutbreakAlert:
+    """One threshold crossing for a (disease, region) pair"""
+    disease: str
+    region: str
+    reason: str
+    count: int
+    mean_severity: float
+    window_seconds: int
+    timestamp: float
+    
+    def describe(self) -> str:
+        hours = self.window_seconds / 3600
+        if self.reason == 'severity':
+            return (f"{self.disease} in {self.region}: mean severity {self.mean_severity:.1f} "
+                    f"over {self.count} cases in {hours:g} h")
+        return f"{self.disease} in {self.region}: {self.count} cases in {hours:g} h"
+
+class _WindowCounter:
+    """Ring of per-bucket case counts and severity sums for one (disease, region)"""
+    
+    __slots__ = ('last_bucket', 'count', 'severity', 'counts', 'severities', 'alerted')
+    
+    def __init__(self, buckets: int, bucket: int):
+        self.last_bucket = bucket
+        self.count = 0
+        self.severity = 0
+        self.counts = [0] * buckets
+        self.severities = [0] * buckets
+        self.alerted = set()
+    
+    def advance(self, bucket: int):
+        """Expire buckets that slid out of the window up to bucket"""
+        buckets = len(self.counts)
+        steps = bucket - self.last_bucket
+        if steps >= buckets:
+            self.counts = [0] * buckets
+            self.severities = [0] * buckets
+            self.count = self.severity = 0
+        else:
+            counts, severities = self.counts, self.severities
+            for b in range(self.last_bucket + 1, bucket + 1):
+                slot = b % buckets
+                self.count -= counts[slot]
+                self.severity -= severities[slot]
+                counts[slot] = severities[slot] = 0
+        self.last_bucket = bucket
+
+class OutbreakDetector:
+    """
+    Streaming early warning for disease spikes per (disease, region)
+    
+    Cases are counted in a sliding window made of fixed time buckets (a ring
+    of window_seconds / bucket_seconds slots per pair), so each event costs
+    O(1) and memory is bounded by max_pairs; the least recently updated pair
+    is evicted beyond that. on_alert receives an OutbreakAlert when a pair
+    reaches rate_threshold cases in the window, or when its mean severity
+    reaches severity_threshold over at least min_cases cases. An alert
+    re-arms once the pair drops back below its threshold. Events older than
+    the window are ignored.
+    """
+    
+    def __init__(self, window_seconds: int = DAY_SECONDS, bucket_seconds: int = 3600,
+                 rate_threshold: int = 5, severity_threshold: Optional[float] = 8.0,
+                 min_cases: int = 3, on_alert=None, max_pairs: int = 100_000,
+                 max_alerts: int = 1000, clock=time.time):
+        if window_seconds <= 0 or bucket_seconds <= 0 or window_seconds % bucket_seconds:
+            raise ValueError("window_seconds must be a positive multiple of bucket_seconds")
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.buckets = window_seconds // bucket_seconds
+        self.rate_threshold = rate_threshold
+        self.severity_threshold = severity_threshold
+        self.min_cases = min_cases
+        self.on_alert = on_alert
+        self.max_pairs = max_pairs
+        self.clock = clock
+        self.alerts = deque(maxlen=max_alerts)
+        self.events = 0
+        self._pairs = {}
+    
+    def __len__(self):
+        return len(self._pairs)
+    
+    def record(self, disease: str, region: Optional[str], timestamp: Optional[float] = None,
+               severity: int = 0):
+        """Count one diagnosis; fires on_alert for any threshold it crosses"""
+        if timestamp is None:
+            timestamp = self.clock()
+        bucket = int(timestamp // self.bucket_seconds)
+        key = (normalize_disease_name(disease), region or UNKNOWN_REGION)
+        pairs = self._pairs
+        counter = pairs.pop(key, None)
+        if counter is None:
+            counter = _WindowCounter(self.buckets, bucket)
+            if len(pairs) >= self.max_pairs:
+                del pairs[next(iter(pairs))]
+        elif bucket > counter.last_bucket:
+            counter.advance(bucket)
+        elif bucket <= counter.last_bucket - self.buckets:
+            pairs[key] = counter
+            return
+        # Re-inserting keeps the dict in least-recently-updated order
+        pairs[key] = counter
+        
+        slot = bucket % self.buckets
+        counter.counts[slot] += 1
+        counter.severities[slot] += severity
+        counter.count += 1
+        counter.severity += severity
+        self.events += 1
+        self._check(key, counter, timestamp)
+    
+    def record_many(self, events):
+        """Count an iterable of (disease, region, timestamp, severity) tuples"""
+        record = self.record
+        for disease, region, timestamp, severity in events:
+            record(disease, region, timestamp, severity)
+    
+    def _check(self, key, counter: _WindowCounter, timestamp: float):
+        alerted = counter.alerted
+        if counter.count >= self.rate_threshold:
+            if 'rate' not in alerted:
+                alerted.add('rate')
+                self._alert(key, counter, 'rate', timestamp)
+        elif alerted:
+            alerted.discard('rate')
+        
+        if self.severity_threshold is not None:
+            high = (counter.count >= self.min_cases
+                    and counter.severity >= self.severity_threshold * counter.count)
+            if high and 'severity' not in alerted:
+                alerted.add('severity')
+                self._alert(key, counter, 'severity', timestamp)
+            elif not high:
+                alerted.discard('severity')
+    
+    def _alert(self, key, counter: _WindowCounter, reason: str, timestamp: float):
+        alert = OutbreakAlert(key[0], key[1], reason, counter.count,
+                              counter.severity / counter.count, self.window_seconds, timestamp)
+        self.alerts.append(alert)
+        if self.on_alert is not None:
+            self.on_alert(alert)
+    
+    def count(self, disease: str, region: Optional[str], now: Optional[float] = None) -> int:
+        """Cases of disease in region within the window ending now"""
+        counter = self._pairs.get((normalize_disease_name(disease), region or UNKNOWN_REGION))
+        if counter is None:
+            return 0
+        bucket = int((self.clock() if now is None else now) // self.bucket_seconds)
+        if bucket > counter.last_bucket:
+            counter.advance(bucket)
+        return counter.count
+    
+    def hotspots(self, k: int = 10, now: Optional[float] = None) -> List[Tuple[str, str, int]]:
+        """The k (disease, region, cases) pairs with the most cases in the current window"""
+        bucket = int((self.clock() if now is None else now) // self.bucket_seconds)
+        for counter in self._pairs.values():
+            if bucket > counter.last_bucket:
+                counter.advance(bucket)
+        top = heapq.nlargest(k, self._pairs.items(), key=lambda item: item[1].count)
+        return [(disease, region, counter.count) for (disease, region), counter in top if counter.count]
+    
+    # ---------- plant integration ----------
+    
+    def track(self, plant: ValidatedPlant):
+        """Count a plant's recent diagnoses and every disease added from now on"""
+        horizon = self.clock() - self.window_seconds
+        for disease in plant.diseases:
+            diagnosed = _parse_datetime_value(disease.get('diagnosed_date'), 'date')
+            if diagnosed is not None and diagnosed >= horizon:
+                self.record(disease['name'], plant.region, diagnosed, disease.get('severity', 0))
+        plant.subscribe(self._on_mutation)
+    
+    def untrack(self, plant: ValidatedPlant):
+        plant.unsubscribe(self._on_mutation)
+    
+    def _on_mutation(self, plant: ValidatedPlant, operation: str, details: dict):
+        if operation == 'disease':
+            self.record(details['name'], plant.region, None, details.get('severity', 0))
+
+# ==================== CARE NOTE SEARCH ====================
+
+def _encode_varint(value: int, out: bytearray):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _encode_posting(gap: int, positions: List[int], out: bytearray):
+    """Append one document's entry; the low bit of the gap flags an explicit position count"""
+    if len(positions) == 1:
+        _encode_varint(gap << 1, out)
+    else:
+        _encode_varint(gap << 1 | 1, out)
+        _encode_varint(len(positions), out)
+    previous = 0
+    for position in positions:
+        _encode_varint(position - previous, out)
+        previous = position
+
+def _decode_postings(data: bytes):
+    """Yield (document number, positions) from a delta/varint-encoded posting list"""
+    index = 0
+    length = len(data)
+    document = 0
+    
+    def read():
+        nonlocal index
+        value = shift = 0
+        while True:
+            byte = data[index]
+            index += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+    
+    while index < length:
+        gap_and_flag = read()
+        document += gap_and_flag >> 1
+        count = read() if gap_and_flag & 1 else 1
+        positions = []
+        position = 0
+        for _ in range(count):
+            position += read()
+            positions.append(position)
+        yield document, positions
+
+class CareNoteIndex:
+    """
+    Inverted full-text index over plants' care notes and care history
+    
+    Each indexed text is a document identified by (plant, event), where event
+    is the entry's number in the plant's care history (its care_history
+    index plus care_history_offset), or -1 for the plant's care_notes field. Posting lists store document-number gaps, position
+    counts and token position gaps as varints in one bytearray per term
+    (a flag bit on the gap omits the count for single occurrences), so appends are
+    incremental and the index stays a fraction of the note text size.
+    Documents are not stored one by one: runs of consecutive documents
+    for consecutive events of one plant are kept as (first document, plant
+    slot, first event) in three arrays. Documents of removed plants,
+    replaced care notes and events folded by care history compaction are
+    dropped by merge(), which also regroups each plant's documents into one
+    run; it runs once dead documents or new runs reach half the index.
+    Supports term, prefix and phrase queries.
+    """
+    
+    TOKEN = re.compile(r"\w+")
+    CARE_NOTES_EVENT = -1
+    MERGE_MIN = 4096
+    
+    def __init__(self):
+        self._postings = {}
+        self._last_document = {}
+        self._document_count = 0
+        self._run_starts = array.array('I')
+        self._run_slots = array.array('I')
+        self._run_events = array.array('i')
+        self._merged_runs = 0
+        self._plants = []
+        self._slots = {}
+        self._first_event = []
+        self._next_event = []
+        self._care_notes_document = {}
+        self._dead = 0
+        self._sorted_terms = None
+        self.corpus_bytes = 0
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        return [token.lower() for token in cls.TOKEN.findall(text)]
+    
+    # ---------- indexing ----------
+    
+    def _index_text(self, slot: int, event: int, text: str) -> int:
+        """Add one document for the plant in slot and return its number"""
+        document = self._document_count
+        self._document_count += 1
+        starts, events = self._run_starts, self._run_events
+        if not (starts and event != self.CARE_NOTES_EVENT and self._run_slots[-1] == slot
+                and events[-1] != self.CARE_NOTES_EVENT and events[-1] + document - starts[-1] == event):
+            starts.append(document)
+            self._run_slots.append(slot)
+            events.append(event)
+        self.corpus_bytes += len(text.encode('utf-8'))
+        
+        positions_by_term = {}
+        for position, token in enumerate(self.tokenize(text)):
+            positions_by_term.setdefault(token, []).append(position)
+        
+        for term, positions in positions_by_term.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = bytearray()
+                self._last_document[term] = 0
+                self._sorted_terms = None
+            _encode_posting(document - self._last_document[term], positions, postings)
+            self._last_document[term] = document
+        return document
+    
+    def _add_event(self, slot: int, text: str):
+        event = self._next_event[slot]
+        self._next_event[slot] = event + 1
+        self._index_text(slot, event, text)
+    
+    def _set_care_notes(self, slot: int, text: str):
+        previous = self._care_notes_document.pop(slot, None)
+        if previous is not None:
+            self._dead += 1
+        if text:
+            self._care_notes_document[slot] = self._index_text(slot, self.CARE_NOTES_EVENT, text)
+    
+    def add_plant(self, plant: ValidatedPlant):
+        """Index a plant's care notes and full care history, then follow new notes"""
+        if id(plant) in self._slots:
+            return
+        slot = self._slots[id(plant)] = len(self._plants)
+        self._plants.append(plant)
+        self._first_event.append(plant.care_history_offset)
+        self._next_event.append(plant.care_history_offset)
+        self._set_care_notes(slot, plant.care_notes)
+        # Every event gets a document, even without a note, so runs map straight to events
+        for entry in plant.care_history:
+            self._add_event(slot, entry.get('note', ''))
+        plant.subscribe(self._on_mutation)
+    
+    def remove_plant(self, plant: ValidatedPlant):
+        """Hide a plant's documents from queries; their postings go at the next merge"""
+        plant.unsubscribe(self._on_mutation)
+        slot = self._slots.pop(id(plant), None)
+        if slot is None:
+            return
+        self._set_care_notes(slot, '')
+        self._dead += self._next_event[slot] - self._first_event[slot]
+        self._plants[slot] = None
+        self._maybe_merge()
+    
+    def _on_mutation(self, plant: ValidatedPlant, operation: str, details: dict):
+        slot = self._slots.get(id(plant))
+        if slot is None:
+            return
+        if operation == 'care_note':
+            self._add_event(slot, details.get('note', ''))
+        elif operation == 'field' and details['field'] == 'care_notes':
+            # Posting lists are append-only: the old text stays until the next merge
+            self._set_care_notes(slot, details['value'])
+        elif operation == 'compact':
+            # Events folded into care summaries are no longer retrievable
+            self._first_event[slot] += details['dropped']
+            self._dead += details['dropped']
+        else:
+            return
+        self._maybe_merge()
+    
+    def _maybe_merge(self):
+        waste = max(self._dead, len(self._run_starts) - self._merged_runs)
+        if waste >= self.MERGE_MIN and waste * 2 >= self._document_count:
+            self.merge()
+    
+    def merge(self):
+        """
+        Rewrite the index without dead documents
+        Live documents are renumbered plant by plant (care notes, then events
+        in order), so each plant becomes a single run; corpus_bytes is
+        recounted from the live texts.
+        """
+        starts = self._run_starts
+        live_events = {}
+        for run, start in enumerate(starts):
+            slot = self._run_slots[run]
+            event = self._run_events[run]
+            if self._plants[slot] is None or event == self.CARE_NOTES_EVENT:
+                continue
+            end = starts[run + 1] if run + 1 < len(starts) else self._document_count
+            first = start + max(0, self._first_event[slot] - event)
+            if first < end:
+                live_events.setdefault(slot, []).extend(range(first, end))
+        
+        renumbered = array.array('i', [-1]) * self._document_count
+        run_starts, run_slots, run_events = array.array('I'), array.array('I'), array.array('i')
+        plants, first_event, next_event, care_notes_document = [], [], [], {}
+        document = 0
+        for slot, plant in enumerate(self._plants):
+            if plant is None:
+                continue
+            new_slot = len(plants)
+            plants.append(plant)
+            first_event.append(self._first_event[slot])
+            next_event.append(self._next_event[slot])
+            care_notes = self._care_notes_document.get(slot)
+            if care_notes is not None:
+                renumbered[care_notes] = care_notes_document[new_slot] = document
+                run_starts.append(document)
+                run_slots.append(new_slot)
+                run_events.append(self.CARE_NOTES_EVENT)
+                document += 1
+            events = live_events.get(slot)
+            if events:
+                run_starts.append(document)
+                run_slots.append(new_slot)
+                run_events.append(self._first_event[slot])
+                for old in events:
+                    renumbered[old] = document
+                    document += 1
+        
+        for term in list(self._postings):
+            entries = sorted((renumbered[old], positions)
+                             for old, positions in _decode_postings(self._postings[term])
+                             if renumbered[old] >= 0)
+            if not entries:
+                del self._postings[term]
+                del self._last_document[term]
+                self._sorted_terms = None
+                continue
+            postings = bytearray()
+            last = 0
+            for new, positions in entries:
+                _encode_posting(new - last, positions, postings)
+                last = new
+            self._postings[term] = postings
+            self._last_document[term] = last
+        
+        self._document_count = document
+        self._run_starts, self._run_slots, self._run_events = run_starts, run_slots, run_events
+        self._merged_runs = len(run_starts)
+        self._plants = plants
+        self._slots = {id(plant): slot for slot, plant in enumerate(plants)}
+        self._first_event, self._next_event = first_event, next_event
+        self._care_notes_document = care_notes_document
+        self._dead = 0
+        self.corpus_bytes = sum(len((plant.care_notes or '').encode('utf-8'))
+                                + sum(len(entry.get('note', '').encode('utf-8')) for entry in plant.care_history)
+                                for plant in plants)
+    
+    # ---------- queries ----------
+    
+    def _term_documents(self, term: str) -> Dict[int, List[int]]:
+        postings = self._postings.get(term)
+        if not postings:
+            return {}
+        return dict(_decode_postings(postings))
+    
+    def _results(self, documents) -> List[Tuple[str, int]]:
+        """(plant ID, event) of the live documents, walking the runs in document order"""
+        results = []
+        starts = self._run_starts
+        run_end = 0
+        for document in sorted(documents):
+            if document >= run_end:
+                run = bisect.bisect_right(starts, document) - 1
+                run_end = starts[run + 1] if run + 1 < len(starts) else self._document_count
+                run_start, run_event = starts[run], self._run_events[run]
+                slot = self._run_slots[run]
+                plant = self._plants[slot]
+                care_notes = self._care_notes_document.get(slot)
+                live_from = self._first_event[slot]
+            if plant is None:
+                continue
+            if run_event == self.CARE_NOTES_EVENT:
+                if document == care_notes:
+                    results.append((plant.plant_id, run_event))
+            elif run_event + document - run_start >= live_from:
+                # Events folded into care summaries are no longer retrievable
+                results.append((plant.plant_id, run_event + document - run_start))
+        return results
+    
+    def term(self, term: str) -> List[Tuple[str, int]]:
+        """(plant ID, event) for every document containing the term"""
+        return self._results(self._term_documents(term.lower()))
+    
+    def prefix(self, prefix: str) -> List[Tuple[str, int]]:
+        """(plant ID, event) for every document containing a term starting with prefix"""
+        prefix = prefix.lower()
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        documents = set()
+        start = bisect.bisect_left(terms, prefix)
+        for term in terms[start:]:
+            if not term.startswith(prefix):
+                break
+            documents.update(self._term_documents(term))
+        return self._results(documents)
+    
+    def phrase(self, text: str) -> List[Tuple[str, int]]:
+        """(plant ID, event) for every document containing the tokens of text consecutively"""
+        tokens = self.tokenize(text)
+        if not tokens:
+            return []
+        # Start from the rarest term to keep candidate sets small
+        postings = [self._term_documents(token) for token in tokens]
+        order = sorted(range(len(tokens)), key=lambda i: len(postings[i]))
+        candidates = set(postings[order[0]])
+        for i in order[1:]:
+            candidates.intersection_update(postings[i])
+            if not candidates:
+                return []
+        
+        matches = []
+        for document in candidates:
+            starts = set(postings[0][document])
+            for offset in range(1, len(tokens)):
+                starts &= {position - offset for position in postings[offset][document]}
+                if not starts:
+                    break
+            if starts:
+                matches.append(document)
+        return self._results(matches)
+    
+    def search(self, query: str) -> List[Tuple[str, int]]:
+        """
+        Documents matching every part of a query
+        "quoted text" is a phrase, word* is a prefix, other words are terms.
+        """
+        result = None
+        parts = re.findall(r'"([^"]+)"|(\S+)', query)
+        for phrase, word in parts:
+            if phrase:
+                matches = self.phrase(phrase)
+            elif word.endswith('*'):
+                matches = self.prefix(word.rstrip('*'))
+            else:
+                matches = None
+                for token in self.tokenize(word):
+                    token_matches = set(self.term(token))
+                    matches = token_matches if matches is None else matches & token_matches
+                    if not matches:
+                        return []
+                if matches is None:
+                    continue
+            result = set(matches) if result is None else result & set(matches)
+            if not result:
+                return []
+        return sorted(result or [])
+    
+    def stats(self) -> dict:
+        """Index size against the size of the indexed text"""
+        posting_bytes = sum(len(postings) for postings in self._postings.values())
+        document_bytes = sum(runs.itemsize * len(runs)
+                             for runs in (self._run_starts, self._run_slots, self._run_events))
+        index_bytes = posting_bytes + document_bytes
+        return {
+            'documents': self._document_count - self._dead,
+            'dead_documents': self._dead,
+            'terms': len(self._postings),
+            'posting_bytes': posting_bytes,
+            'document_bytes': document_bytes,
+            'corpus_bytes': self.corpus_bytes,
+            'ratio': index_bytes / self.corpus_bytes if self.corpus_bytes else 0.0,
+        }
+
+# ==================== TRAIT SIMILARITY ====================
+
+def _pattern_alternatives(pattern: str) -> List[str]:
+    """Values of an anchored '^(A|B|C)$' pattern"""
+    return re.fullmatch(r"\^\((.*)\)\$", pattern).group(1).split("|")
+
+PLANT_TRAITS = _pattern_alternatives(PlantValidationPatterns.PLANT_TRAIT)
+PLANT_TYPES = _pattern_alternatives(PlantValidationPatterns.PLANT_TYPE)
+
+# Bits 0-9 are the ten traits, the bits above them one-hot encode the plant type
+TRAIT_BITS = {trait: 1 << i for i, trait in enumerate(PLANT_TRAITS)}
+TYPE_BITS = {plant_type: 1 << (len(PLANT_TRAITS) + i) for i, plant_type in enumerate(PLANT_TYPES)}
+TRAIT_MASK = (1 << len(PLANT_TRAITS)) - 1
+_POPCOUNT = [bin(mask).count("1") for mask in range(1 << (len(PLANT_TRAITS) + len(PLANT_TYPES)))]
+
+def trait_bitset(traits, plant_type: Optional[str] = None) -> int:
+    """Pack traits (and optionally a plant type) into an integer bitset"""
+    mask = TYPE_BITS.get(plant_type, 0)
+    for trait in traits:
+        mask |= TRAIT_BITS.get(trait, 0)
+    return mask
+
+class TraitIndex:
+    """
+    Packed trait/type bitsets for a whole garden, for similarity and trait filters
+    
+    Each tracked plant owns one uint16 slot in a NumPy array (an
+    array.array('H') when NumPy is not installed), kept current by the
+    plants' mutation observers. similar() ranks plants by Jaccard similarity
+    or Hamming distance to a query bitset and with_traits() returns plants
+    having at least the requested traits; both run as whole-array operations.
+    Removal moves the last slot into the freed one, so slots stay dense.
+    """
+    
+    METRICS = ('jaccard', 'hamming')
+    
+    def __init__(self, use_numpy: Optional[bool] = None):
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise ValueError("NumPy is not installed")
+        self.plants = []
+        self._slots = {}
+        if self.use_numpy:
+            self._masks = np.zeros(1024, dtype=np.uint16)
+            self._popcount = np.array(_POPCOUNT, dtype=np.uint8)
+        else:
+            self._masks = array.array('H')
+    
+    def __len__(self):
+        return len(self.plants)
+    
+    @property
+    def masks(self):
+        """Bitsets of the tracked plants, in slot order"""
+        return self._masks[:len(self.plants)]
+    
+    # ---------- plant integration ----------
+    
+    def add_plant(self, plant: ValidatedPlant):
+        if id(plant) in self._slots:
+            return
+        slot = len(self.plants)
+        mask = trait_bitset(plant.special_traits, plant.plant_type)
+        if self.use_numpy:
+            if slot == len(self._masks):
+                self._masks = np.concatenate([self._masks, np.zeros(len(self._masks), dtype=np.uint16)])
+            self._masks[slot] = mask
+        else:
+            self._masks.append(mask)
+        self.plants.append(plant)
+        self._slots[id(plant)] = slot
+        plant.subscribe(self._on_mutation)
+    
+    def add_plants(self, plants):
+        for plant in plants:
+            self.add_plant(plant)
+    
+    def remove_plant(self, plant: ValidatedPlant):
+        slot = self._slots.pop(id(plant), None)
+        if slot is None:
+            return
+        plant.unsubscribe(self._on_mutation)
+        last = len(self.plants) - 1
+        if slot != last:
+            moved = self.plants[last]
+            self.plants[slot] = moved
+            self._masks[slot] = self._masks[last]
+            self._slots[id(moved)] = slot
+        self.plants.pop()
+        if not self.use_numpy:
+            self._masks.pop()
+    
+    def _on_mutation(self, plant: ValidatedPlant, operation: str, details: dict):
+        if operation == 'trait':
+            slot = self._slots[id(plant)]
+            self._masks[slot] = int(self._masks[slot]) | TRAIT_BITS.get(details['trait'], 0)
+        elif operation == 'field' and details['field'] == 'plant_type':
+            self._masks[self._slots[id(plant)]] = trait_bitset(plant.special_traits, plant.plant_type)
+    
+    # ---------- queries ----------
+    
+    def _query_mask(self, query, include_type: bool) -> int:
+        if isinstance(query, ValidatedPlant):
+            mask = trait_bitset(query.special_traits, query.plant_type)
+        elif isinstance(query, int):
+            mask = query
+        else:
+            mask = trait_bitset(query)
+        return mask if include_type else mask & TRAIT_MASK
+    
+    def similar(self, query, k: int = 10, metric: str = 'jaccard',
+                include_type: bool = True) -> List[Tuple[ValidatedPlant, float]]:
+        """
+        The k plants most similar to query (a plant, a list of traits or a bitset)
+        
+        Returns (plant, score) pairs, best first: Jaccard similarity (higher is
+        closer) or Hamming distance in bits (lower is closer). Ties keep slot
+        order; a query plant is never returned as its own match.
+        """
+        if metric not in self.METRICS:
+            raise ValueError(f"Metric must be one of: {', '.join(self.METRICS)}")
+        mask = self._query_mask(query, include_type)
+        exclude = self._slots.get(id(query), -1) if isinstance(query, ValidatedPlant) else -1
+        count = len(self.plants)
+        if count == 0 or k <= 0:
+            return []
+        
+        if self.use_numpy:
+            masks = self.masks if include_type else self.masks & TRAIT_MASK
+            popcount = self._popcount
+            if metric == 'jaccard':
+                union = popcount[masks | mask].astype(np.float64)
+                scores = np.divide(popcount[masks & mask], union, out=np.ones(count), where=union > 0)
+                order_key = -scores
+            else:
+                scores = popcount[masks ^ mask].astype(np.float64)
+                order_key = scores.copy()
+            if exclude >= 0:
+                order_key[exclude] = np.inf
+            take = min(k, count)
+            # Everything better than the k-th key, then ties at the k-th key in slot order
+            kth = np.partition(order_key, take - 1)[take - 1]
+            better = np.flatnonzero(order_key < kth)
+            tied = np.flatnonzero(order_key == kth)[:take - len(better)]
+            candidates = np.concatenate([better, tied])
+            candidates = candidates[np.lexsort((candidates, order_key[candidates]))]
+            return [(self.plants[slot], float(scores[slot])) for slot in candidates.tolist()
+                    if slot != exclude]
+        
+        popcount = _POPCOUNT
+        score_by_mask = {}
+        for value in set(self._masks):
+            value_key = value if include_type else value & TRAIT_MASK
+            if metric == 'jaccard':
+                union = popcount[value_key | mask]
+                score_by_mask[value] = popcount[value_key & mask] / union if union else 1.0
+            else:
+                score_by_mask[value] = float(popcount[value_key ^ mask])
+        masks = self._masks
+        sign = -1 if metric == 'jaccard' else 1
+        best = heapq.nsmallest(k, (slot for slot in range(count) if slot != exclude),
+                               key=lambda slot: (sign * score_by_mask[masks[slot]], slot))
+        return [(self.plants[slot], score_by_mask[masks[slot]]) for slot in best]
+    
+    def with_traits(self, traits, plant_type: Optional[str] = None) -> List[ValidatedPlant]:
+        """Plants having at least every trait given (and of plant_type, if set)"""
+        required = trait_bitset(traits, plant_type)
+        if self.use_numpy:
+            slots = np.flatnonzero((self.masks & required) == required)
+            return [self.plants[slot] for slot in slots.tolist()]
+        return [self.plants[slot] for slot, mask in enumerate(self._masks) if mask & required == required]
+
+# ==================== CSV EXPORT ====================
+
+EXPORT_FORMATS = {'csv': 'excel', 'tsv': 'excel-tab'}
+EXPORT_BUFFER_SIZE = 1 << 20
+
+def open_export_file(path: str, compress: Optional[bool] = None):
+    """
+    Open a text file for a streaming export with a large write buffer
+    Output is gzip-compressed when compress is true, or when it is None
+    and the path ends in .gz.
+    """
+    if compress is None:
+        compress = path.endswith('.gz')
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+    return open(path, 'w', encoding='utf-8', newline='', buffering=EXPORT_BUFFER_SIZE)
+
+def _write_rows(path: str, header, rows, fmt: str, compress: Optional[bool]) -> int:
+    """Stream rows from an iterator to a CSV/TSV file; returns the data row count"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Export format must be one of: {', '.join(EXPORT_FORMATS)}")
+    counted = 0
+    
+    def counting(rows):
+        nonlocal counted
+        for row in rows:
+            counted += 1
+            yield row
+    
+    with open_export_file(path, compress) as handle:
+        writer = csv.writer(handle, dialect=EXPORT_FORMATS[fmt])
+        writer.writerow(header)
+        writer.writerows(counting(rows))
+    return counted
+
+PLANT_EXPORT_COLUMNS = ('plant_id', 'name', 'type', 'created_date', 'care_notes', 'location',
+                        'city', 'region', 'owner_email', 'email_domain', 'health', 'water_level',
+                        'nutrients', 'sunlight', 'traits', 'diseases', 'care_events')
+
+def export_plants(plants, path: str, fmt: str = 'csv', compress: Optional[bool] = None) -> int:
+    """One row per plant"""
+    rows = (
+        (plant.plant_id, plant.name, plant.plant_type, plant.created_date.isoformat(timespec='seconds'),
+         plant.care_notes, plant.location, plant.city or '', plant.region or '',
+         plant.owner_email, plant.email_domain or '', plant.health, plant.water_level,
+         plant.nutrients, plant.sunlight, ';'.join(plant.special_traits),
+         ';'.join(disease['name'] for disease in plant.diseases),
+         plant.care_history_offset + len(plant.care_history))
+        for plant in plants
+    )
+    return _write_rows(path, PLANT_EXPORT_COLUMNS, rows, fmt, compress)
+
+def export_care_history(plants, path: str, fmt: str = 'csv', compress: Optional[bool] = None) -> int:
+    """
+    Flattened care history, one row per event
+    Compacted period summaries come first for each plant, with an empty
+    event number and their watering totals filled in.
+    """
+    def rows():
+        for plant in plants:
+            plant_id = plant.plant_id
+            for summary in plant.care_summaries:
+                # Single events folded out of the raw history are kept as they are
+                yield (plant_id, '', summary.get('timestamp', ''), summary.get('type', ''),
+                       summary.get('note', ''), summary.get('period', ''), summary.get('waterings', ''),
+                       summary.get('water_units', ''), summary.get('notes', ''))
+            for event, entry in enumerate(plant.care_history, plant.care_history_offset):
+                yield (plant_id, event, entry.get('timestamp', ''), entry.get('type', ''),
+                       entry.get('note', ''), '', '', '', '')
+    
+    header = ('plant_id', 'event', 'timestamp', 'type', 'note',
+              'period', 'waterings', 'water_units', 'notes')
+    return _write_rows(path, header, rows(), fmt, compress)
+
+def export_diseases(plants, path: str, fmt: str = 'csv', compress: Optional[bool] = None) -> int:
+    """One row per recorded disease"""
+    rows = (
+        (plant.plant_id, disease['name'], disease.get('diagnosed_date', ''), disease.get('severity', ''))
+        for plant in plants
+        for disease in plant.diseases
+    )
+    return _write_rows(path, ('plant_id', 'disease', 'diagnosed_date', 'severity'), rows, fmt, compress)
+
+def export_traits(plants, path: str, fmt: str = 'csv', compress: Optional[bool] = None) -> int:
+    """One row per plant trait"""
+    rows = ((plant.plant_id, trait) for plant in plants for trait in plant.special_traits)
+    return _write_rows(path, ('plant_id', 'trait'), rows, fmt, compress)
+
+def export_statistics(stats: dict, path: str, fmt: str = 'csv', compress: Optional[bool] = None) -> int:
+    """The generate_plant_statistics tables as (table, key, count) rows"""
+    def rows():
+        yield ('summary', 'total_plants', stats['total_plants'])
+        for table in GardenStatsAggregate.COUNTER_FIELDS:
+            for key, count in stats.get(table, {}).items():
+                yield (table, key, count)
+    return _write_rows(path, ('table', 'key', 'count'), rows(), fmt, compress)
+
+def export_garden(plants, directory: str, fmt: str = 'csv', compress: bool = False) -> Dict[str, int]:
+    """
+    Export plants, care history, diseases, traits and statistics into directory
+    
+    Each file is written straight from the plant collection (a VersionedGarden
+    is exported from one snapshot) through csv writers over buffered or
+    gzip streams, so memory use does not grow with the garden. Returns the
+    row count per file.
+    
+    Measured with '--benchmark export' on a synthetic 1,000,000-plant garden
+    (5 care events, 2 traits and 0-2 diseases per plant; 9.0M rows) on one
+    core: about 300k rows/s uncompressed (30 s, 659 MB) and 180k rows/s with
+    gzip (50 s, 45 MB). Peak traced memory of the export itself stays about
+    2 MB, most of it the write buffer, whatever the garden size.
+    
+    plants is read once per file, so it must be a collection rather than a
+    one-shot iterator such as a generator (TypeError).
+    """
+    if isinstance(plants, VersionedGarden):
+        plants = plants.snapshot()
+    elif iter(plants) is plants:
+        raise TypeError("export_garden reads plants once per file: pass a list or garden, not an iterator")
+    os.makedirs(directory, exist_ok=True)
+    suffix = f".{fmt}" + (".gz" if compress else "")
+    
+    counts = {}
+    for name, exporter in (("plants", export_plants), ("care_history", export_care_history),
+                           ("diseases", export_diseases), ("traits", export_traits)):
+        path = os.path.join(directory, name + suffix)
+        counts[path] = exporter(plants, path, fmt, compress)
+    
+    stats = GardenStatsAggregate().add_plants(plants).to_stats()
+    path = os.path.join(directory, "statistics" + suffix)
+    counts[path] = export_statistics(stats, path, fmt, compress)
+    return counts
+
+# ==================== ENHANCED UI WITH VALIDATION ====================
+
+class ValidatedAddPlantDialog(tk.Toplevel):
+    """
+    Enhanced add plant dialog with real-time regex validation
+    """
+    
+    def __init__(self, parent, callback):
+        super().__init__(parent)
+        self.callback = callback
+        self.title("Add New Plant - With Validation")
+        self.geometry("600x800")
+        self.configure(bg="#f4f9f4")
+        
+        # Make modal
+        self.transient(parent)
+        self.grab_set()
+        
+        # Center dialog
+        self.update_idletasks()
+        x = parent.winfo_rootx() + (parent.winfo_width() - 600) // 2
+        y = parent.winfo_rooty() + (parent.winfo_height() - 800) // 2
+        self.geometry(f"+{x}+{y}")
+        
+        self.setup_validation_ui()
+    
+    def setup_validation_ui(self):
+        # Main container
+        main_frame = tk.Frame(self, bg="#f4f9f4", padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Title
+        title_label = tk.Label(main_frame, text="🌱 Add New Plant (With Validation)", 
+                              font=("Helvetica", 16, "bold"), 
+                              bg="#f4f9f4", fg="#2c3639")
+        title_label.pack(pady=(0, 20))
+        
+        # Validation status indicator
+        self.validation_frame = tk.Frame(main_frame, bg="#f4f9f4")
+        self.validation_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.validation_label = tk.Label(self.validation_frame, 
+                                        text="🔍 Real-time validation active", 
+                                        font=("Helvetica", 10), 
+                                        bg="#f4f9f4", fg="#526d82")
+        self.validation_label.pack()
+        
+        # Plant name with validation
+        self.create_validated_field(
+            main_frame, 
+            "Plant Name", 
+            PlantValidationPatterns.PLANT_NAME,
+            "2-30 characters: letters, numbers, spaces, hyphens, apostrophes",
+            "name_entry"
+        )
+        
+        # Plant type dropdown
+        type_frame = tk.LabelFrame(main_frame, text="Plant Type", 
+                                 bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
+        type_frame.pack(fill=tk.X, pady=10)
+        
+        self.plant_type = tk.StringVar(value="Flower")
+        type_combo = ttk.Combobox(type_frame, textvariable=self.plant_type,
+                                 values=["Flower", "Herb", "Succulent", "Vegetable", "Tree"],
+                                 state="readonly")
+        type_combo.pack(fill=tk.X, padx=10, pady=5)
+        
+        # Care notes with validation
+        self.create_validated_field(
+            main_frame, 
+            "Care Notes (Optional)", 
+            PlantValidationPatterns.CARE_NOTES,
+            "Letters, numbers, spaces, basic punctuation (max 200 chars)",
+            "care_notes_entry",
+            is_text=True
+        )
+        
+        # Location with validation
+        self.create_validated_field(
+            main_frame, 
+            "Location (Optional)", 
+            PlantValidationPatterns.LOCATION,
+            "Format: City, State/Country",
+            "location_entry"
+        )
+        
+        # Owner email with validation
+        self.create_validated_field(
+            main_frame, 
+            "Owner Email (Optional)", 
+            PlantValidationPatterns.EMAIL,
+            "Valid email address format",
+            "email_entry"
+        )
+        
+        # Validation summary
+        self.create_validation_summary(main_frame)
+        
+        # Buttons
+        button_frame = tk.Frame(main_frame, bg="#f4f9f4")
+        button_frame.pack(fill=tk.X, pady=20)
+        
+        tk.Button(button_frame, text="Cancel", 
+                 font=("Helvetica", 11), command=self.destroy).pack(side=tk.LEFT)
+        
+        self.add_button = tk.Button(button_frame, text="Add Plant", 
+                                   font=("Helvetica", 11, "bold"),
+                                   bg="#8ac586", fg="white",
+                                   command=self.add_plant)
+        self.add_button.pack(side=tk.RIGHT)
+        
+        # Initial validation
+        self.validate_all_fields()
+    
+    def create_validated_field(self, parent, label_text, pattern, help_text, attr_name, is_text=False):
+        """Create a form field with real-time regex validation"""
+        field_frame = tk.LabelFrame(parent, text=label_text, 
+                                  bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
+        field_frame.pack(fill=tk.X, pady=10)
+        
+        # Entry or Text widget
+        if is_text:
+            widget = tk.Text(field_frame, height=4, font=("Helvetica", 10))
+        else:
+            widget = tk.Entry(field_frame, font=("Helvetica", 11))
+        
+        widget.pack(fill=tk.X, padx=10, pady=5)
+        
+        # Help text
+        help_label = tk.Label(field_frame, text=f"ℹ️ {help_text}", 
+                            font=("Helvetica", 9), 
+                            bg="#f4f9f4", fg="#526d82")
+        help_label.pack(anchor="w", padx=10)
+        
+        # Validation indicator
+        validation_indicator = tk.Label(field_frame, text="", 
+                                      font=("Helvetica", 9), 
+                                      bg="#f4f9f4")
+        validation_indicator.pack(anchor="w", padx=10, pady=(0, 5))
+        
+        # Store references
+        setattr(self, attr_name, widget)
+        setattr(self, f"{attr_name}_indicator", validation_indicator)
+        setattr(self, f"{attr_name}_pattern", pattern)
+        
+        # Bind validation events
+        if is_text:
+            widget.bind("<KeyRelease>", lambda e: self.validate_field(attr_name))
+            widget.bind("<FocusOut>", lambda e: self.validate_field(attr_name))
+        else:
+            widget.bind("<KeyRelease>", lambda e: self.validate_field(attr_name))
+            widget.bind("<FocusOut>", lambda e: self.validate_field(attr_name))
+    
+    def get_field_value(self, attr_name):
+        """Get value from entry or text widget"""
+        widget = getattr(self, attr_name)
+        if isinstance(widget, tk.Text):
+            return widget.get("1.0", tk.END).strip()
+        else:
+            return widget.get().strip()
+    
+    def validate_field(self, attr_name):
+        """Validate a specific field using its regex pattern"""
+        value = self.get_field_value(attr_name)
+        pattern = getattr(self, f"{attr_name}_pattern")
+        indicator = getattr(self, f"{attr_name}_indicator")
+        
+        # Skip validation for optional empty fields
+        if not value and "Optional" in attr_name:
+            indicator.config(text="✓ Optional field", fg="#526d82")
+            return True
+        
+        # Validate against pattern
+        is_valid, error = RegexValidator.validate_pattern(value, pattern)
+        
+        if is_valid:
+            indicator.config(text="✓ Valid format", fg="#2a9d8f")
+            return True
+        else:
+            indicator.config(text="✗ Invalid format", fg="#e76f51")
+            return False
+    
+    def validate_all_fields(self):
+        """Validate all fields and update UI accordingly"""
+        field_names = ['name_entry', 'care_notes_entry', 'location_entry', 'email_entry']
+        all_valid = True
+        
+        for field_name in field_names:
+            if hasattr(self, field_name):
+                field_valid = self.validate_field(field_name)
+                value = self.get_field_value(field_name)
+                
+                # Required fields must be valid and non-empty
+                if field_name == 'name_entry':
+                    if not value or not field_valid:
+                        all_valid = False
+                elif value and not field_valid:  # Optional fields must be valid if filled
+                    all_valid = False
+        
+        # Update add button state
+        if all_valid:
+            self.add_button.config(state=tk.NORMAL, bg="#8ac586")
+            self.validation_label.config(text="✅ All fields valid", fg="#2a9d8f")
+        else:
+            self.add_button.config(state=tk.DISABLED, bg="#cccccc")
+            self.validation_label.config(text="❌ Please fix validation errors", fg="#e76f51")
+        
+        # Schedule next validation
+        self._validation_job = self.after(500, self.validate_all_fields)
+    
+    def destroy(self):
+        """Stop the validation polling loop before the widgets go away"""
+        job = getattr(self, '_validation_job', None)
+        if job is not None:
+            self.after_cancel(job)
+            self._validation_job = None
+        super().destroy()
+    
+    def create_validation_summary(self, parent):
+        """Create a summary of regex patterns being used"""
+        summary_frame = tk.LabelFrame(parent, text="🔍 Validation Patterns Used", 
+                                    bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
+        summary_frame.pack(fill=tk.X, pady=10)
+        
+        patterns_text = """
+Pattern Examples:
+• Plant Name: ^[A-Za-z0-9\\s\\-']{2,30}$ (letters, numbers, spaces, hyphens, apostrophes)
+• Email: ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$ (standard email format)
+• Location: ^[A-Za-z\\s]+,\\s*[A-Za-z\\s]+$ (City, State format)
+• Care Notes: ^[\\w\\s\\.,!?'-]{0,200}$ (basic text with punctuation)
+
+Metacharacters Used:
+^ = Start of string, $ = End of string, [] = Character class, + = One or more
+* = Zero or more, ? = Zero or one, {n,m} = Quantifiers, \\ = Escape character
+        """
+        
+        tk.Label(summary_frame, text=patterns_text, 
+                font=("Courier", 8), 
+                bg="#f4f9f4", fg="#526d82",
+                justify=tk.LEFT).pack(anchor="w", padx=10, pady=5)
+    
+    @profiled("dialog_validation")
+    def add_plant(self):
+        """Add plant with comprehensive validation"""
+        plant_data = {
+            'name': self.get_field_value('name_entry'),
+            'type': self.plant_type.get(),
+            'care_notes': self.get_field_value('care_notes_entry'),
+            'location': self.get_field_value('location_entry'),
+            'owner_email': self.get_field_value('email_entry')
+        }
+        
+        # Final validation
+        is_valid, errors = PLANT_RECORD_VALIDATOR(plant_data)
+        
+        if is_valid:
+            try:
+                # Create validated plant
+                plant = ValidatedPlant.from_record(plant_data)
+                
+                # Show validation report
+                report = plant.get_validation_report()
+                
+                if self.callback:
+                    self.callback(plant, report)
+                
+                self.destroy()
+                
+            except ValueError as e:
+                messagebox.showerror("Validation Error", str(e))
+        else:
+            error_message = "Validation failed:\n" + "\n".join(errors)
+            messagebox.showerror("Validation Error", error_message)
+
+# ==================== DEMO AND TESTING ====================
+
+class RegexDemoApp:
+    """
+    Demonstration application showing regex validation in action
+    """
+    
+    def __init__(self, journal_dir: Optional[str] = None, monitor: Optional['EventLoopMonitor'] = None):
+        self.root = tk.Tk()
+        self.root.title("🌿 GrowBuddy - Regex Validation Demo")
+        self.root.geometry("1000x700")
+        self.root.configure(bg="#f4f9f4")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.journal = None
+        
+        # Optional responsiveness monitor, installed first so every callback is timed
+        self.monitor = monitor
+        if monitor:
+            monitor.install(self.root)
+        try:
+            self._setup(journal_dir)
+        except BaseException:
+            # Never leave tkinter patched or the journal open behind a failed start
+            try:
+                if self.journal:
+                    self.journal.close()
+            finally:
+                if monitor:
+                    monitor.uninstall()
+                self.root.destroy()
+            raise
+    
+    def _setup(self, journal_dir: Optional[str]):
+        # Optional persistence: replay the garden from its journal
+        self.plants = VersionedGarden()
+        if journal_dir:
+            self.journal = PlantJournal(journal_dir)
+            self.plants.extend(self.journal.open())
+        
+        # Watering and feeding reminders, care note search and outbreak warnings
+        self.scheduler = CareScheduler()
+        self.note_index = CareNoteIndex()
+        self.compactor = CareHistoryCompactor()
+        self.outbreaks = OutbreakDetector(on_alert=self.show_outbreak_alert)
+        self.trait_index = TraitIndex()
+        self.results_text = None
+        for plant in self.plants:
+            self.scheduler.track(plant)
+            self.note_index.add_plant(plant)
+            self.compactor.track(plant)
+            self.outbreaks.track(plant)
+            self.trait_index.add_plant(plant)
+        
+        self.setup_demo_ui()
+        monitor = self.monitor
+        if monitor:
+            status_label = tk.Label(self.root, text=monitor.summary_line(), font=("Helvetica", 9),
+                                    bg="#f4f9f4", fg="#526d82", cursor="hand2")
+            status_label.pack(side=tk.BOTTOM, anchor="w", padx=20)
+            status_label.bind("<Button-1>", lambda e: self.display_message(monitor.report_text()))
+            monitor.attach_label(status_label)
+        self.scheduler.attach_tk(self.root, self.show_care_reminders)
+        self.compactor.attach_tk(self.root)
+        
+    def setup_demo_ui(self):
+        # Title
+        title_label = tk.Label(self.root, text="🌿 GrowBuddy - Regex Validation Demo", 
+                              font=("Helvetica", 18, "bold"), 
+                              bg="#f4f9f4", fg="#2c3639")
+        title_label.pack(pady=20)
+        
+        # Description
+        desc_text = """
+This demo showcases comprehensive regex validation patterns for plant data:
+• Plant names, types, and care information
+• Email addresses and location formats
+• Disease names and plant traits
+• Numeric values and dates
+• Real-time validation with visual feedback
+        """
+        
+        tk.Label(self.root, text=desc_text, 
+                font=("Helvetica", 11), 
+                bg="#f4f9f4", fg="#526d82",
+                justify=tk.LEFT).pack(pady=10)
+        
+        # Buttons frame
+        buttons_frame = tk.Frame(self.root, bg="#f4f9f4")
+        buttons_frame.pack(pady=20)
+        
+        # Demo buttons
+        tk.Button(buttons_frame, text="🌱 Add Plant (Validated)", 
+                 font=("Helvetica", 12), bg="#8ac586", fg="white",
+                 command=self.show_add_plant_dialog).pack(side=tk.LEFT, padx=10)
+        
+        tk.Button(buttons_frame, text="🔍 Test Patterns", 
+                 font=("Helvetica", 12), bg="#66c2ff", fg="white",
+                 command=self.show_pattern_tester).pack(side=tk.LEFT, padx=10)
+        
+        tk.Button(buttons_frame, text="📊 Generate Report", 
+                 font=("Helvetica", 12), bg="#ff9f43", fg="white",
+                 command=self.generate_validation_report).pack(side=tk.LEFT, padx=10)
+        
+        tk.Button(buttons_frame, text="💾 Demo Data", 
+                 font=("Helvetica", 12), bg="#9b59b6", fg="white",
+                 command=self.load_demo_data).pack(side=tk.LEFT, padx=10)
+        
+        tk.Button(buttons_frame, text="🔎 Search Notes", 
+                 font=("Helvetica", 12), bg="#2a9d8f", fg="white",
+                 command=self.search_care_notes).pack(side=tk.LEFT, padx=10)
+        
+        tk.Button(buttons_frame, text="🧬 Similar Plants", 
+                 font=("Helvetica", 12), bg="#e76f51", fg="white",
+                 command=self.find_similar_plants).pack(side=tk.LEFT, padx=10)
+        
+        tk.Button(buttons_frame, text="🌿 Browse Plants", 
+                 font=("Helvetica", 12), bg="#52796f", fg="white",
+                 command=self.show_plant_browser).pack(side=tk.LEFT, padx=10)
+        
+        # Results area
+        self.results_frame = tk.Frame(self.root, bg="#f4f9f4")
+        self.results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Results text widget
+        self.results_text = tk.Text(self.results_frame, 
+                                   font=("Courier", 10), 
+                                   bg="white", fg="#2c3639",
+                                   wrap=tk.WORD)
+        
+        # Scrollbar
+        scrollbar = tk.Scrollbar(self.results_frame, orient="vertical", 
+                               command=self.results_text.yview)
+        self.results_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.results_text.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Initial message
+        self.display_message("🌿 Welcome to GrowBuddy Regex Validation Demo!\n\nClick buttons above to explore validation features.")
+        
+        if PROFILER.enabled:
+            PROFILER.report = self.show_profile_summary
+    
+    def show_profile_summary(self, summary):
+        """Append a profiling summary line below the current results"""
+        self.results_text.insert(tk.END, f"\n{summary}")
+    
+    def display_message(self, message):
+        """Display message in results area"""
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, message)
+    
+    def show_add_plant_dialog(self):
+        """Show the validated add plant dialog"""
+        dialog = ValidatedAddPlantDialog(self.root, self.plant_added_callback)
+    
+    def add_plant_to_garden(self, plant):
+        """Add a plant to the garden, journaling it when persistence is on"""
+        self.plants.append(plant)
+        self.scheduler.track(plant)
+        self.note_index.add_plant(plant)
+        self.compactor.track(plant)
+        self.outbreaks.track(plant)
+        self.trait_index.add_plant(plant)
+        if self.journal:
+            self.journal.track(plant)
+    
+    def show_care_reminders(self, due_tasks):
+        """Append reminders for plants whose watering or feeding is due"""
+        actions = {'water': "needs watering", 'feed': "needs feeding"}
+        lines = [f"🔔 {plant.name} ({plant.plant_id}) {actions.get(task, task)}"
+                 for plant, task, _ in due_tasks]
+        self.results_text.insert(tk.END, "\n" + "\n".join(lines))
+    
+    def show_outbreak_alert(self, alert: OutbreakAlert):
+        """Append an outbreak warning (alerts raised while replaying the journal are logged)"""
+        message = f"⚠️ Possible outbreak: {alert.describe()}"
+        if self.results_text is None:
+            print(message)
+        else:
+            self.results_text.insert(tk.END, "\n" + message)
+    
+    def plant_added_callback(self, plant, validation_report):
+        """Handle plant addition with validation report"""
+        self.add_plant_to_garden(plant)
+        
+        report_text = f"""
+✅ PLANT ADDED SUCCESSFULLY!
+
+Plant Details:
+• ID: {plant.plant_id}
+• Name: {plant.name}
+• Type: {plant.plant_type}
+• Created: {plant.created_date.strftime('%Y-%m-%d %H:%M:%S')}
+
+Validation Report:
+"""
+        
+        for field, details in validation_report['validations'].items():
+            status = "✅ VALID" if details['valid'] else "❌ INVALID"
+            pattern = getattr(PlantValidationPatterns, details['pattern_key'])
+            report_text += f"• {field}: {status}\n  Value: '{details['value']}'\n  Pattern: {pattern}\n\n"
+        
+        if validation_report['errors']:
+            report_text += "Errors:\n"
+            for error in validation_report['errors']:
+                report_text += f"• {error}\n"
+        
+        if validation_report['warnings']:
+            report_text += "Warnings:\n"
+            for warning in validation_report['warnings']:
+                report_text += f"• {warning}\n"
+        
+        self.display_message(report_text)
+    
+    def search_care_notes(self):
+        """Search care notes and care history across the whole garden"""
+        query = simpledialog.askstring(
+            "Search Care Notes",
+            'Words, prefix* or "exact phrase":',
+            parent=self.root
+        )
+        if not query:
+            return
+        
+        matches = self.note_index.search(query)
+        plants_by_id = {plant.plant_id: plant for plant in self.plants}
+        report_text = f"🔎 CARE NOTE SEARCH: {query}\n{len(matches)} matching entries\n\n"
+        for plant_id, event in matches[:500]:
+            plant = plants_by_id.get(plant_id)
+            if plant is None:
+                continue
+            if event == CareNoteIndex.CARE_NOTES_EVENT:
+                report_text += f"• {plant.name} ({plant_id}) care notes: {plant.care_notes}\n"
+            else:
+                entry = plant.care_history[event - plant.care_history_offset]
+                report_text += f"• {plant.name} ({plant_id}) #{event} {entry['timestamp']}: {entry['note']}\n"
+        if len(matches) > 500:
+            report_text += f"... {len(matches) - 500} more\n"
+        self.display_message(report_text)
+    
+    def find_similar_plants(self):
+        """List the plants whose traits and type best match a chosen plant"""
+        query = simpledialog.askstring("Similar Plants", "Plant name or ID:", parent=self.root)
+        if not query:
+            return
+        
+        plant = next((plant for plant in self.plants
+                      if query in (plant.plant_id, plant.name)), None)
+        if plant is None:
+            self.display_message(f"🧬 No plant named or numbered {query}")
+            return
+        
+        report_text = (f"🧬 PLANTS SIMILAR TO {plant.name} ({plant.plant_id})\n"
+                       f"{plant.plant_type}; traits: {', '.join(plant.special_traits) or 'none'}\n\n")
+        for match, score in self.trait_index.similar(plant, 10):
+            report_text += (f"• {match.name} ({match.plant_id}) {match.plant_type}, "
+                            f"{', '.join(match.special_traits) or 'no traits'}: {score:.0%}\n")
+        self.display_message(report_text)
+    
+    def show_plant_browser(self):
+        """Open the lazy-loading plant browser over the garden"""
+        PlantBrowserWindow(self.root, self.plants)
+    
+    def show_pattern_tester(self):
+        """Show pattern testing interface"""
+        tester_window = PatternTesterWindow(self.root)
+    
+    @profiled("generate_validation_report")
+    def generate_validation_report(self):
+        """Generate comprehensive validation report for all plants"""
+        if not self.plants:
+            self.display_message("No plants added yet! Add some plants first to generate a report.")
+            return
+        
+        # Generate statistics from a consistent snapshot while imports carry on
+        snapshot = self.plants.snapshot()
+        stats = PlantDataAnalyzer.generate_plant_statistics(snapshot)
+        
+        report_text = f"""
+📊 COMPREHENSIVE VALIDATION REPORT
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Garden version: {snapshot.version}
+User: donlj
+
+GARDEN STATISTICS:
+• Total Plants: {stats['total_plants']}
+
+PLANTS BY TYPE:
+"""
+        
+        for plant_type, count in stats['plants_by_type'].items():
+            report_text += f"• {plant_type}: {count}\n"
+        
+        if stats['common_traits']:
+            report_text += "\nMOST COMMON TRAITS:\n"
+            for trait, count in sorted(stats['common_traits'].items(), key=lambda x: x[1], reverse=True):
+                report_text += f"• {trait}: {count} plants\n"
+        
+        if stats['disease_frequency']:
+            report_text += "\nDISEASE FREQUENCY:\n"
+            for disease, count in sorted(stats['disease_frequency'].items(), key=lambda x: x[1], reverse=True):
+                report_text += f"• {disease}: {count} cases\n"
+        
+        if stats['location_distribution']:
+            report_text += "\nLOCATION DISTRIBUTION:\n"
+            for location, count in sorted(stats['location_distribution'].items(), key=lambda x: x[1], reverse=True):
+                report_text += f"• {location}: {count} plants\n"
+        
+        if stats['email_domains']:
+            report_text += "\nEMAIL DOMAINS:\n"
+            for domain, count in sorted(stats['email_domains'].items(), key=lambda x: x[1], reverse=True):
+                report_text += f"• {domain}: {count} users\n"
+        
+        report_text += "\nVALIDATION PATTERNS USED:\n"
+        for attr_name, pattern in vars(PlantValidationPatterns).items():
+            if not attr_name.startswith('_') and isinstance(pattern, str):
+                report_text += f"• {attr_name}: {pattern}\n"
+        
+        self.display_message(report_text)
+    
+    @profiled("load_demo_data")
+    def load_demo_data(self):
+        """Load demonstration data with various validation scenarios"""
+        demo_plants_data = [
+            # Valid data
+            {
+                'name': "Rose Garden Beauty",
+                'type': "Flower",
+                'care_notes': "Needs daily watering and weekly fertilizer.",
+                'location': "San Francisco, California",
+                'owner_email': "donlj@example.com"
+            },
+            {
+                'name': "Basil-Supreme",
+                'type': "Herb",
+                'care_notes': "Harvest leaves regularly for best flavor!",
+                'location': "Portland, Oregon",
+                'owner_email': "gardener@greenthumb.org"
+            },
+            {
+                'name': "Desert Star",
+                'type': "Succulent",
+                'care_notes': "Water sparingly, once per week maximum.",
+                'location': "Phoenix, Arizona",
+                'owner_email': "donlj@gmail.com"
+            },
+            # Edge cases and validation tests
+            {
+                'name': "O'Malley's Tomato",  # Apostrophe test
+                'type': "Vegetable",
+                'care_notes': "Great for salads & sandwiches!",
+                'location': "Dublin, Ireland",
+                'owner_email': "test.user+garden@example.co.uk"
+            }
+        ]
+        
+        results_text = "🎯 LOADING DEMO DATA WITH VALIDATION TESTING...\n\n"
+        
+        for i, plant_data in enumerate(demo_plants_data, 1):
+            results_text += f"Plant {i}: {plant_data['name']}\n"
+            
+            try:
+                plant = ValidatedPlant.from_record(plant_data)
+                self.add_plant_to_garden(plant)
+                
+                # Add some demo diseases and traits
+                if i == 1:
+                    plant.add_disease("Aphids")
+                    plant.add_trait("Fragrant")
+                elif i == 2:
+                    plant.add_trait("Disease Resistant")
+                    plant.add_trait("Fast Growing")
+                elif i == 3:
+                    plant.add_trait("Drought Resistant")
+                    plant.add_trait("Low Maintenance")
+                
+                validation_report = plant.get_validation_report()
+                error_count = len(validation_report['errors'])
+                warning_count = len(validation_report['warnings'])
+                
+                results_text += f"  ✅ CREATED - Errors: {error_count}, Warnings: {warning_count}\n"
+                
+            except ValueError as e:
+                results_text += f"  ❌ FAILED: {str(e)}\n"
+            
+            results_text += "\n"
+        
+        results_text += f"\n✅ Demo data loaded! Total plants: {len(self.plants)}\n"
+        results_text += "Click 'Generate Report' to see detailed validation analysis."
+        
+        self.display_message(results_text)
+    
+    def run(self):
+        """Start the demo application"""
+        self.root.mainloop()
+    
+    def close(self):
+        """Commit the journal and close the application"""
+        try:
+            self.scheduler.detach_tk()
+            self.compactor.detach_tk()
+            if self.journal:
+                self.journal.close()
+        finally:
+            if self.monitor:
+                self.monitor.report(self.monitor.report_text())
+                self.monitor.uninstall()
+            self.root.destroy()
+
+class PatternTesterWindow:
+    """
+    Interactive pattern testing window
+    """
+    
+    def __init__(self, parent):
+        self.window = tk.Toplevel(parent)
+        self.window.title("🔍 Regex Pattern Tester")
+        self.window.geometry("700x600")
+        self.window.configure(bg="#f4f9f4")
+        
+        self.setup_tester_ui()
+    
+    def setup_tester_ui(self):
+        # Title
+        tk.Label(self.window, text="🔍 Interactive Regex Pattern Tester", 
+                font=("Helvetica", 16, "bold"), 
+                bg="#f4f9f4", fg="#2c3639").pack(pady=20)
+        
+        # Pattern selection
+        pattern_frame = tk.LabelFrame(self.window, text="Select Pattern to Test", 
+                                    bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
+        pattern_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        self.pattern_var = tk.StringVar(value="PLANT_NAME")
+        
+        patterns = [
+            ("PLANT_NAME", "Plant Name Validation"),
+            ("EMAIL", "Email Address Validation"),
+            ("LOCATION", "Location Format Validation"),
+            ("DISEASE_NAME", "Disease Name Validation"),
+            ("WATER_AMOUNT", "Water Amount Validation"),
+            ("HEX_COLOR", "Hex Color Code Validation"),
+            ("DATE_FORMAT", "Date Format Validation")
+        ]
+        
+        for pattern_key, description in patterns:
+            tk.Radiobutton(pattern_frame, text=f"{description} ({pattern_key})", 
+                          variable=self.pattern_var, value=pattern_key,
+                          bg="#f4f9f4", anchor="w").pack(fill=tk.X, padx=10, pady=2)
+        
+        # Test input
+        input_frame = tk.LabelFrame(self.window, text="Test Input", 
+                                  bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
+        input_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        self.test_input = tk.Entry(input_frame, font=("Helvetica", 12))
+        self.test_input.pack(fill=tk.X, padx=10, pady=5)
+        self.test_input.bind("<KeyRelease>", self.test_pattern)
+        
+        # Pattern display
+        pattern_display_frame = tk.LabelFrame(self.window, text="Current Pattern", 
+                                            bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
+        pattern_display_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        self.pattern_display = tk.Label(pattern_display_frame, text="", 
+                                      font=("Courier", 10), 
+                                      bg="#f4f9f4", fg="#526d82",
+                                      wraplength=650)
+        self.pattern_display.pack(anchor="w", padx=10, pady=5)
+        
+        # Results
+        results_frame = tk.LabelFrame(self.window, text="Test Results", 
+                                    bg="#f4f9f4", fg="#2c3639", font=("Helvetica", 10, "bold"))
+        results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        
+        self.results_display = tk.Text(results_frame, 
+                                     font=("Courier", 10), 
+                                     bg="white", fg="#2c3639")
+        self.results_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Bind pattern change
+        self.pattern_var.trace_add("write", self.pattern_changed)
+        
+        # Initial setup
+        self.pattern_changed()
+        
+        # Add some example test cases
+        examples_frame = tk.Frame(self.window, bg="#f4f9f4")
+        examples_frame.pack(pady=10)
+        
+        self.add_example_button = tk.Button(examples_frame, text="Load Example Test Cases", 
+                                          font=("Helvetica", 10), bg="#8ac586", fg="white",
+                                          command=self.load_examples)
+        self.add_example_button.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(examples_frame, text="📂 Batch Test File", 
+                 font=("Helvetica", 10), bg="#66c2ff", fg="white",
+                 command=self.open_batch_tester).pack(side=tk.LEFT, padx=5)
+    
+    def pattern_changed(self, *args):
+        """Update pattern display when selection changes"""
+        self.pattern_key = self.pattern_var.get()
+        self.pattern = getattr(PlantValidationPatterns, self.pattern_key, "")
+        self.compiled_pattern = re.compile(self.pattern)
+        self.pattern_display.config(text=f"Pattern: {self.pattern}")
+        self.test_pattern()
+    
+    def test_pattern(self, *args):
+        """Test the current input against the selected pattern"""
+        pattern_key = self.pattern_key
+        pattern = self.pattern
+        test_value = self.test_input.get()
+        
+        if not test_value:
+            self.results_display.delete(1.0, tk.END)
+            self.results_display.insert(tk.END, "Enter text to test...")
+            return
+        
+        # Test the pattern
+        is_valid = self.compiled_pattern.match(test_value) is not None
+        
+        result_text = f"Input: '{test_value}'\n"
+        result_text += f"Pattern: {pattern}\n\n"
+        
+        if is_valid:
+            result_text += "✅ MATCH: Input matches the pattern!\n\n"
+        else:
+            result_text += "❌ NO MATCH: Input does not match the pattern.\n\n"
+        
+        # Show pattern breakdown
+        result_text += "Pattern Breakdown:\n"
+        if pattern_key == "PLANT_NAME":
+            result_text += "• ^ = Start of string\n"
+            result_text += "• [A-Za-z0-9\\s\\-'] = Letters, numbers, spaces, hyphens, apostrophes\n"
+            result_text += "• {2,30} = Length between 2 and 30 characters\n"
+            result_text += "• $ = End of string\n"
+        elif pattern_key == "EMAIL":
+            result_text += "• [a-zA-Z0-9._%+-]+ = One or more alphanumeric chars or symbols\n"
+            result_text += "• @ = Literal @ symbol\n"
+            result_text += "• [a-zA-Z0-9.-]+ = Domain name characters\n"
+            result_text += "• \\. = Literal dot\n"
+            result_text += "• [a-zA-Z]{2,} = Two or more letters for TLD\n"
+        # Add more breakdowns as needed...
+        
+        self.results_display.delete(1.0, tk.END)
+        self.results_display.insert(tk.END, result_text)
+    
+    def load_examples(self):
+        """Load example test cases for the selected pattern"""
+        pattern_key = self.pattern_var.get()
+        
+        examples = {
+            "PLANT_NAME": [
+                "Rose Garden",      # Valid
+                "Basil-Supreme",    # Valid
+                "O'Malley's Oak",   # Valid
+                "123 Plant",        # Valid
+                "X",                # Invalid - too short
+                "A" * 31,          # Invalid - too long
+                "Plant@Home",       # Invalid - special character
+            ],
+            "EMAIL": [
+                "donlj@example.com",           # Valid
+                "user.name+tag@domain.org",    # Valid
+                "test@sub.domain.com",         # Valid
+                "invalid.email",               # Invalid - no @
+                "@domain.com",                 # Invalid - no local part
+                "user@",                       # Invalid - no domain
+            ],
+            "LOCATION": [
+                "San Francisco, California",   # Valid
+                "Dublin, Ireland",             # Valid
+                "New York City, New York",     # Valid
+                "San Francisco",               # Invalid - no comma
+                "California, ",                # Invalid - empty after comma
+                "123 Main St, CA",            # Invalid - numbers
+            ],
+            "DISEASE_NAME": [
+                "Root Rot",                    # Valid
+                "Aphids",                      # Valid
+                "Fungal Infection",            # Valid
+                "Nutrient Deficiency",         # Valid
+                "Plant Cancer",                # Invalid - not recognized
+                "Unknown Disease",             # Invalid - not recognized
+            ]
+        }
+        
+        if pattern_key in examples:
+            # Evaluate every example with the compiled pattern, then render once
+            example_text = f"\nExample test cases for {pattern_key}:\n\n"
+            for example, is_valid, _ in evaluate_pattern_batch(self.compiled_pattern, examples[pattern_key]):
+                status = "✅ VALID" if is_valid else "❌ INVALID"
+                example_text += f"'{example}' - {status}\n"
+            
+            self.results_display.delete(1.0, tk.END)
+            self.results_display.insert(tk.END, example_text)
+    
+    def open_batch_tester(self):
+        """Open a batch tester for a file of test strings against the selected pattern"""
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            title=f"Test strings for {self.pattern_key} (one per line)",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if path:
+            BatchPatternTesterWindow(self.window, self.pattern_key, path)
+
+def evaluate_pattern_batch(pattern, values):
+    """
+    Match each value against a pattern, yielding (value, matched, match time in µs)
+    pattern may be a pattern string or an already compiled pattern.
+    """
+    match = re.compile(pattern).match
+    clock = time.perf_counter_ns
+    for value in values:
+        started = clock()
+        matched = match(value) is not None
+        yield value, matched, (clock() - started) / 1000
+
+class VirtualTreeview(tk.Frame):
+    """
+    ttk.Treeview that only materializes the rows currently in view
+    
+    Rows live in a data source reached through row_count() and
+    get_rows(start, count); the widget holds a fixed set of Treeview items
+    and rewrites their values as the view scrolls, so showing millions of
+    rows costs the same as showing one screenful.
+    """
+    
+    def __init__(self, parent, columns, row_count, get_rows, visible_rows: int = 20,
+                 on_select=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.row_count = row_count
+        self.get_rows = get_rows
+        self.visible_rows = visible_rows
+        self.on_select = on_select
+        self.offset = 0
+        
+        column_ids = [column_id for column_id, _, _ in columns]
+        self.tree = ttk.Treeview(self, columns=column_ids, show="headings",
+                                 height=visible_rows, selectmode="browse")
+        for column_id, heading, width in columns:
+            self.tree.heading(column_id, text=heading)
+            self.tree.column(column_id, width=width, stretch=(width >= 200))
+        
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self._items = [self.tree.insert("", tk.END, values=()) for _ in range(visible_rows)]
+        
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll(1, "pages"))
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.row_count()))
+        else:
+            self.scroll(int(amount), unit)
+    
+    def scroll(self, amount: int, unit: str = "units"):
+        step = self.visible_rows if unit == "pages" else 3
+        self.scroll_to(self.offset + amount * step)
+        return "break"
+    
+    def scroll_to(self, offset: int):
+        total = self.row_count()
+        self.offset = max(0, min(offset, total - self.visible_rows))
+        self.refresh()
+    
+    def refresh(self):
+        """Re-render the visible window from the data source"""
+        total = self.row_count()
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        rows = self.get_rows(self.offset, self.visible_rows) if total else []
+        
+        for i, item in enumerate(self._items):
+            self.tree.item(item, values=rows[i] if i < len(rows) else ())
+        
+        if total:
+            first = self.offset / total
+            last = min(1.0, (self.offset + self.visible_rows) / total)
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+    
+    def _on_tree_select(self, event=None):
+        selection = self.tree.selection()
+        if not selection or not self.on_select:
+            return
+        index = self.offset + self._items.index(selection[0])
+        if index < self.row_count():
+            self.on_select(index)
+
+class BatchPatternTesterWindow:
+    """
+    Batch pattern tester: evaluates a file of test strings off the UI thread
+    and shows pass/fail and match time per row in a virtualized table
+    """
+    
+    CHUNK_SIZE = 2000
+    
+    def __init__(self, parent, pattern_key: str, path: str):
+        self.pattern_key = pattern_key
+        self.pattern = getattr(PlantValidationPatterns, pattern_key)
+        self.path = path
+        self.rows = []
+        self.passed = 0
+        self.total_micros = 0.0
+        self.results = queue.Queue()
+        self.cancelled = threading.Event()
+        self.finished = False
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title(f"🔍 Batch Test - {pattern_key}")
+        self.window.geometry("760x560")
+        self.window.configure(bg="#f4f9f4")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        
+        self.setup_batch_ui()
+        
+        self.worker = threading.Thread(target=self._evaluate_file, daemon=True)
+        self.worker.start()
+        self.window.after(50, self._drain_results)
+    
+    def setup_batch_ui(self):
+        tk.Label(self.window, text=f"Pattern {self.pattern_key}: {self.pattern}", 
+                font=("Courier", 10), bg="#f4f9f4", fg="#526d82",
+                wraplength=720, justify=tk.LEFT).pack(anchor="w", padx=20, pady=(15, 5))
+        
+        self.summary_label = tk.Label(self.window, text=f"Testing {os.path.basename(self.path)}...", 
+                                     font=("Helvetica", 11, "bold"), 
+                                     bg="#f4f9f4", fg="#2c3639")
+        self.summary_label.pack(anchor="w", padx=20, pady=5)
+        
+        self.table = VirtualTreeview(
+            self.window,
+            columns=[("row", "#", 70), ("status", "Result", 90),
+                     ("time", "Match µs", 90), ("value", "Test String", 460)],
+            row_count=lambda: len(self.rows),
+            get_rows=self._get_rows,
+            visible_rows=20
+        )
+        self.table.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+    
+    def _get_rows(self, start: int, count: int) -> list:
+        return [
+            (index + 1, "✅ PASS" if matched else "❌ FAIL", f"{elapsed:.2f}", value)
+            for index, (value, matched, elapsed) in enumerate(self.rows[start:start + count], start)
+        ]
+    
+    def _evaluate_file(self):
+        """Worker thread: evaluate the file in chunks and hand them to the UI"""
+        try:
+            with open(self.path, 'r', encoding='utf-8', errors='replace') as handle:
+                values = (line.rstrip('\r\n') for line in handle)
+                chunk = []
+                for row in evaluate_pattern_batch(self.pattern, values):
+                    if self.cancelled.is_set():
+                        return
+                    chunk.append(row)
+                    if len(chunk) >= self.CHUNK_SIZE:
+                        self.results.put(chunk)
+                        chunk = []
+                if chunk:
+                    self.results.put(chunk)
+        except OSError as e:
+            self.results.put(e)
+        self.results.put(None)
+    
+    def _drain_results(self):
+        """UI thread: append finished chunks and refresh the visible rows once"""
+        if self.cancelled.is_set():
+            return
+        
+        received = False
+        try:
+            while True:
+                chunk = self.results.get_nowait()
+                if chunk is None:
+                    self.finished = True
+                    break
+                if isinstance(chunk, OSError):
+                    messagebox.showerror("Batch Test", f"Could not read file: {chunk}", parent=self.window)
+                    continue
+                self.rows.extend(chunk)
+                self.passed += sum(1 for _, matched, _ in chunk if matched)
+                self.total_micros += sum(elapsed for _, _, elapsed in chunk)
+                received = True
+        except queue.Empty:
+            pass
+        
+        if received or self.finished:
+            self.table.refresh()
+            self._update_summary()
+        if not self.finished:
+            self.window.after(50, self._drain_results)
+    
+    def _update_summary(self):
+        total = len(self.rows)
+        failed = total - self.passed
+        state = "Done" if self.finished else "Testing"
+        average = self.total_micros / total if total else 0.0
+        self.summary_label.config(
+            text=f"{state}: {total} strings - ✅ {self.passed} passed, ❌ {failed} failed, "
+                 f"avg {average:.2f} µs per match"
+        )
+    
+    def close(self):
+        self.cancelled.set()
+        self.window.destroy()
+
+# ==================== PLANT BROWSER ====================
+
+class _Descending:
+    """Sort key wrapper that orders values from largest to smallest"""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __lt__(self, other):
+        return other.value < self.value
+
+class GardenPageSource:
+    """
+    Filtered, sorted and paged view of a plant collection for the browser
+    
+    Filtering and sorting happen here, on plain Python objects, never in
+    widgets: the filtered order is computed once per filter or sort and
+    display rows are formatted a page at a time on demand, so the table only
+    ever asks for the rows it shows. On a VersionedGarden only writes to the
+    fields the current sort and filters read force a rebuild; appended
+    plants are filtered and inserted into the existing order, and writes to
+    displayed fields only drop the formatted pages.
+    """
+    
+    SORT_KEYS = {
+        'plant_id': lambda plant: plant.plant_id,
+        'name': lambda plant: plant.name.lower(),
+        'type': lambda plant: plant.plant_type,
+        'health': lambda plant: plant.health,
+        'location': lambda plant: plant.location.lower(),
+        'diseases': lambda plant: len(plant.diseases),
+    }
+    
+    # Written fields each sort key and filter reads (plant_id and health are
+    # never written after a plant is created)
+    SORT_FIELDS = {'name': ('name',), 'type': ('plant_type',), 'location': ('location',),
+                   'diseases': ('diseases',)}
+    FILTER_FIELDS = {'plant_type': ('plant_type',), 'location': ('location',),
+                     'disease': ('diseases',)}
+    ROW_FIELDS = ('name', 'plant_type', 'location', 'diseases')
+    
+    # Appending more plants than this rebuilds the order instead of inserting
+    MAX_INSERTS = 256
+    
+    def __init__(self, plants, page_size: int = 200):
+        self.plants = plants
+        self.page_size = page_size
+        self.sort_key = 'name'
+        self.descending = False
+        self.filters = {}
+        self._order = None
+        self._keys = None
+        self._order_version = None
+        self._rows_version = None
+        self._seen = 0
+        self._pages = {}
+        self._diseases = set()
+        self._diseases_version = None
+        self._diseases_seen = 0
+    
+    def _field_version(self, fields) -> tuple:
+        # Plain lists carry no write tracking; only their length is watched
+        versions = getattr(self.plants, 'field_versions', None)
+        if versions is None:
+            return ()
+        return getattr(self.plants, 'removals', 0), tuple(versions.get(name) for name in fields)
+    
+    def _watched_fields(self) -> list:
+        fields = list(self.SORT_FIELDS.get(self.sort_key, ()))
+        for name in self.filters:
+            fields.extend(self.FILTER_FIELDS.get(name, ()))
+        return fields
+    
+    @property
+    def stale(self) -> bool:
+        return (self._order is None or self._seen != len(self.plants)
+                or self._order_version != self._field_version(self._watched_fields())
+                or self._rows_version != self._field_version(self.ROW_FIELDS))
+    
+    def invalidate(self):
+        self._order = None
+        self._pages = {}
+    
+    def set_filter(self, plant_type: Optional[str] = None, min_health: Optional[int] = None,
+                   location: Optional[str] = None, disease: Optional[str] = None):
+        """Replace the filters; empty values switch a filter off"""
+        self.filters = {name: value for name, value in (
+            ('plant_type', plant_type), ('min_health', min_health),
+            ('location', location.strip().lower() if location else None),
+            ('disease', normalize_disease_name(disease) if disease else None)) if value not in (None, "")}
+        self.invalidate()
+    
+    def set_sort(self, key: str, descending: Optional[bool] = None):
+        """Sort by key; without descending, picking the current key again flips the order"""
+        if key not in self.SORT_KEYS:
+            raise ValueError(f"Sort key must be one of: {', '.join(self.SORT_KEYS)}")
+        if descending is None:
+            descending = not self.descending if key == self.sort_key else False
+        self.sort_key = key
+        self.descending = descending
+        self.invalidate()
+    
+    def _predicates(self):
+        filters = self.filters
+        predicates = []
+        if 'plant_type' in filters:
+            plant_type = filters['plant_type']
+            predicates.append(lambda plant: plant.plant_type == plant_type)
+        if 'min_health' in filters:
+            min_health = filters['min_health']
+            predicates.append(lambda plant: plant.health >= min_health)
+        if 'location' in filters:
+            location = filters['location']
+            predicates.append(lambda plant: location in plant.location.lower())
+        if 'disease' in filters:
+            disease = filters['disease']
+            predicates.append(lambda plant: any(normalize_disease_name(entry['name']) == disease
+                                                for entry in plant.diseases))
+        return predicates
+    
+    def _sort_key(self):
+        key = self.SORT_KEYS[self.sort_key]
+        if not self.descending:
+            return key
+        # Descending keys that bisect can use; keeps equal plants in garden order
+        return lambda plant: _Descending(key(plant))
+    
+    def _ensure_order(self) -> list:
+        order_version = self._field_version(self._watched_fields())
+        count = len(self.plants)
+        if self._order is not None and self._order_version == order_version and self._seen != count:
+            if count - self._seen > self.MAX_INSERTS or count < self._seen:
+                self._order = None
+            else:
+                # Only appends since the last build: filter and insert the new plants
+                predicates = self._predicates()
+                key = self._sort_key()
+                for index in range(self._seen, count):
+                    plant = self.plants[index]
+                    if all(test(plant) for test in predicates):
+                        sort_value = key(plant)
+                        position = bisect.bisect_right(self._keys, sort_value)
+                        self._keys.insert(position, sort_value)
+                        self._order.insert(position, plant)
+                self._seen = count
+                self._pages = {}
+        if self._order is None or self._order_version != order_version:
+            predicates = self._predicates()
+            key = self._sort_key()
+            order = [plant for plant in self.plants if all(test(plant) for test in predicates)]
+            keys = [key(plant) for plant in order]
+            ranked = sorted(range(len(order)), key=keys.__getitem__)
+            self._order = [order[index] for index in ranked]
+            self._keys = [keys[index] for index in ranked]
+            self._order_version = order_version
+            self._seen = len(self.plants)
+            self._pages = {}
+        rows_version = self._field_version(self.ROW_FIELDS)
+        if self._rows_version != rows_version:
+            self._rows_version = rows_version
+            self._pages = {}
+        return self._order
+    
+    def __len__(self):
+        return len(self._ensure_order())
+    
+    def plant_at(self, index: int) -> ValidatedPlant:
+        return self._ensure_order()[index]
+    
+    @staticmethod
+    def format_row(plant: ValidatedPlant) -> tuple:
+        return (plant.plant_id, plant.name, plant.plant_type, plant.health, plant.location,
+                ", ".join(entry['name'] for entry in plant.diseases))
+    
+    def rows(self, start: int, count: int) -> list:
+        """Display rows start..start+count, formatting only the pages they fall in"""
+        order = self._ensure_order()
+        rows = []
+        page_size = self.page_size
+        for page in range(start // page_size, (start + count - 1) // page_size + 1):
+            cached = self._pages.get(page)
+            if cached is None:
+                cached = self._pages[page] = [self.format_row(plant) for plant in
+                                              order[page * page_size:(page + 1) * page_size]]
+            rows.extend(cached)
+        offset = start - (start // page_size) * page_size
+        return rows[offset:offset + count]
+    
+    def disease_names(self) -> List[str]:
+        """Normalized disease names in the garden, scanning only plants added since the last call"""
+        version = self._field_version(('diseases',))
+        if version != self._diseases_version or self._diseases_seen > len(self.plants):
+            self._diseases = set()
+            self._diseases_seen = 0
+            self._diseases_version = version
+        count = len(self.plants)
+        for index in range(self._diseases_seen, count):
+            self._diseases.update(normalize_disease_name(entry['name'])
+                                  for entry in self.plants[index].diseases)
+        self._diseases_seen = count
+        return sorted(self._diseases)
+
+class PlantBrowserWindow:
+    """
+    Browse the garden in a virtualized table with data-side sort and filters
+    Selecting a row fills the details pane without touching the table.
+    """
+    
+    COLUMNS = [("plant_id", "ID", 90), ("name", "Name", 160), ("type", "Type", 90),
+               ("health", "Health", 60), ("location", "Location", 200), ("diseases", "Diseases", 200)]
+    POLL_INTERVAL_MS = 1000
+    
+    def __init__(self, parent, plants):
+        self.source = GardenPageSource(plants)
+        self.selected = None
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("🌿 Plant Browser")
+        self.window.geometry("1150x600")
+        self.window.configure(bg="#f4f9f4")
+        
+        self.setup_browser_ui()
+        self.refresh()
+        self.window.after(self.POLL_INTERVAL_MS, self._poll_garden)
+    
+    def setup_browser_ui(self):
+        filters_frame = tk.Frame(self.window, bg="#f4f9f4")
+        filters_frame.pack(fill=tk.X, padx=20, pady=(15, 5))
+        
+        tk.Label(filters_frame, text="Type:", bg="#f4f9f4").pack(side=tk.LEFT)
+        self.type_var = tk.StringVar(value="All")
+        type_box = ttk.Combobox(filters_frame, textvariable=self.type_var, state="readonly", width=11,
+                                values=["All"] + PLANT_TYPES)
+        type_box.pack(side=tk.LEFT, padx=(5, 15))
+        type_box.bind("<<ComboboxSelected>>", lambda e: self.apply_filters())
+        
+        tk.Label(filters_frame, text="Min health:", bg="#f4f9f4").pack(side=tk.LEFT)
+        self.health_var = tk.StringVar(value="0")
+        tk.Spinbox(filters_frame, from_=0, to=100, increment=10, width=5,
+                   textvariable=self.health_var, command=self.apply_filters).pack(side=tk.LEFT, padx=(5, 15))
+        
+        tk.Label(filters_frame, text="Location:", bg="#f4f9f4").pack(side=tk.LEFT)
+        self.location_var = tk.StringVar()
+        location_entry = tk.Entry(filters_frame, textvariable=self.location_var, width=18)
+        location_entry.pack(side=tk.LEFT, padx=(5, 15))
+        location_entry.bind("<Return>", lambda e: self.apply_filters())
+        
+        tk.Label(filters_frame, text="Disease:", bg="#f4f9f4").pack(side=tk.LEFT)
+        self.disease_var = tk.StringVar(value="All")
+        # The disease list needs a scan of the garden, so it is filled when the list opens
+        disease_box = ttk.Combobox(filters_frame, textvariable=self.disease_var, state="readonly", width=18,
+                                   values=["All"])
+        disease_box.configure(postcommand=lambda: disease_box.configure(
+            values=["All"] + self.source.disease_names()))
+        disease_box.pack(side=tk.LEFT, padx=(5, 15))
+        disease_box.bind("<<ComboboxSelected>>", lambda e: self.apply_filters())
+        
+        tk.Button(filters_frame, text="Apply", bg="#8ac586", fg="white",
+                 command=self.apply_filters).pack(side=tk.LEFT)
+        
+        self.summary_label = tk.Label(self.window, text="", font=("Helvetica", 11, "bold"),
+                                     bg="#f4f9f4", fg="#2c3639")
+        self.summary_label.pack(anchor="w", padx=20, pady=5)
+        
+        body = tk.Frame(self.window, bg="#f4f9f4")
+        body.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
+        
+        self.table = VirtualTreeview(body, columns=self.COLUMNS, row_count=lambda: len(self.source),
+                                     get_rows=self.source.rows, visible_rows=22,
+                                     on_select=self.show_details)
+        self.table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        for column_id, _, _ in self.COLUMNS:
+            self.table.tree.heading(column_id, command=lambda key=column_id: self.sort_by(key))
+        
+        self.details_text = tk.Text(body, width=38, font=("Courier", 10), wrap=tk.WORD, bg="#ffffff")
+        self.details_text.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0))
+    
+    def apply_filters(self):
+        try:
+            min_health = int(self.health_var.get() or 0)
+        except ValueError:
+            min_health = 0
+        self.source.set_filter(
+            plant_type=None if self.type_var.get() == "All" else self.type_var.get(),
+            min_health=min_health or None,
+            location=self.location_var.get(),
+            disease=None if self.disease_var.get() == "All" else self.disease_var.get())
+        self.table.offset = 0
+        self.refresh()
+    
+    def sort_by(self, key: str):
+        self.source.set_sort(key)
+        self.refresh()
+    
+    def refresh(self):
+        """Re-render the visible rows and the summary line"""
+        self.table.refresh()
+        arrow = "▼" if self.source.descending else "▲"
+        self.summary_label.config(text=f"{len(self.source):,} of {len(self.source.plants):,} plants, "
+                                       f"sorted by {self.source.sort_key} {arrow}")
+    
+    def show_details(self, index: int):
+        plant = self.source.plant_at(index)
+        self.selected = plant
+        diseases = "\n".join(f"  {entry['name']} (severity {entry['severity']}, {entry['diagnosed_date']})"
+                             for entry in plant.diseases) or "  none"
+        recent = "\n".join(f"  {entry.get('timestamp', '')} {entry.get('note', '')}"
+                           for entry in plant.care_history[-5:]) or "  none"
+        details = (f"{plant.name} ({plant.plant_id})\n"
+                   f"Type: {plant.plant_type}\n"
+                   f"Location: {plant.location or '-'}\n"
+                   f"Owner: {plant.owner_email or '-'}\n\n"
+                   f"Health {plant.health}  Water {plant.water_level}\n"
+                   f"Nutrients {plant.nutrients}  Sunlight {plant.sunlight}\n\n"
+                   f"Traits: {', '.join(plant.special_traits) or 'none'}\n"
+                   f"Diseases:\n{diseases}\n\n"
+                   f"Care notes: {plant.care_notes or '-'}\n"
+                   f"Recent care:\n{recent}\n")
+        self.details_text.delete("1.0", tk.END)
+        self.details_text.insert("1.0", details)
+    
+    def _poll_garden(self):
+        """Pick up garden changes; only the visible rows are re-rendered"""
+        if not self.window.winfo_exists():
+            return
+        if self.source.stale:
+            self.refresh()
+        self.window.after(self.POLL_INTERVAL_MS, self._poll_garden)
+
+# ==================== UI RESPONSIVENESS ====================
+
+def _callback_name(func) -> str:
+    """Qualified name of a Tk callback, looking through the wrapper after() registers"""
+    code = getattr(func, '__code__', None)
+    if code is not None and code.co_name == 'callit' and 'func' in code.co_freevars:
+        func = func.__closure__[code.co_freevars.index('func')].cell_contents
+    return getattr(func, '__qualname__', None) or repr(func)
+
+class _TimedCallWrapper(tk.CallWrapper):
+    """
+    tkinter callback wrapper that reports each callback's run time to the active monitor
+    Callbacks of other Tk interpreters in the process run untimed.
+    """
+    
+    monitor = None
+    
+    def __call__(self, *args):
+        monitor = self.monitor
+        if monitor is None or getattr(self.widget, 'tk', None) is not monitor.interpreter:
+            return super().__call__(*args)
+        beats = monitor.beats
+        started = time.perf_counter()
+        try:
+            return super().__call__(*args)
+        finally:
+            monitor._callback_finished(self.func, time.perf_counter() - started, beats)
+
+class EventLoopMonitor:
+    """
+    Tk event-loop latency monitor
+    
+    A heartbeat rescheduled with after(interval_ms) measures how late each
+    beat fires; the lag samples give percentiles of how long the loop was
+    unable to respond. While installed, every Tk callback registered from
+    then on is timed, and the slowest ones that blocked the loop are kept
+    (callbacks that ran a nested event loop, such as modal dialogs, let the
+    heartbeat run and are not counted). Beats later than stall_ms are
+    logged through report() along with the last slow callback, and a
+    summary line is logged every log_interval seconds.
+    """
+    
+    ENVIRONMENT_VARIABLE = "GROWBUDDY_UI_MONITOR"
+    
+    def __init__(self, interval_ms: int = 10, stall_ms: float = 100.0, max_samples: int = 10_000,
+                 top_callbacks: int = 10, log_interval: Optional[float] = 60.0):
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.top_callbacks = top_callbacks
+        self.log_interval = log_interval
+        self.report = print
+        self.lag_ms = deque(maxlen=max_samples)
+        self.beats = 0
+        self.stalls = 0
+        self.operations = {}
+        self.widget = None
+        self.interpreter = None
+        self._slowest = []
+        self._sequence = 0
+        self._last_slow_callback = None
+        self._expected = None
+        self._jobs = {}
+        self._previous_wrapper = None
+    
+    @classmethod
+    def from_environment(cls) -> Optional['EventLoopMonitor']:
+        """Monitor to install when GROWBUDDY_UI_MONITOR is set, else None"""
+        value = os.environ.get(cls.ENVIRONMENT_VARIABLE, "").strip().lower()
+        if value and value not in ("0", "false", "no"):
+            return cls()
+        return None
+    
+    # ---------- lifecycle ----------
+    
+    def install(self, widget):
+        """
+        Start the heartbeat on widget's event loop and time callbacks registered from now on
+        Callback timing replaces tkinter.CallWrapper until uninstall(); prefer
+        installed(), which always restores it.
+        """
+        self.widget = widget
+        self.interpreter = widget.tk
+        self._previous_wrapper = tk.CallWrapper
+        _TimedCallWrapper.monitor = self
+        tk.CallWrapper = _TimedCallWrapper
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._jobs['beat'] = widget.after(self.interval_ms, self._heartbeat)
+        if self.log_interval:
+            self._jobs['log'] = widget.after(int(self.log_interval * 1000), self._log_summary)
+    
+    def uninstall(self):
+        if self.widget is None:
+            return
+        for job in self._jobs.values():
+            try:
+                self.widget.after_cancel(job)
+            except tk.TclError:
+                pass
+        self._jobs = {}
+        if tk.CallWrapper is _TimedCallWrapper:
+            tk.CallWrapper = self._previous_wrapper
+        if _TimedCallWrapper.monitor is self:
+            _TimedCallWrapper.monitor = None
+        self.widget = None
+        self.interpreter = None
+    
+    @contextmanager
+    def installed(self, widget):
+        """Monitor widget's event loop for the duration of the block"""
+        self.install(widget)
+        try:
+            yield self
+        finally:
+            self.uninstall()
+    
+    # ---------- measurement ----------
+    
+    def _heartbeat(self):
+        now = time.perf_counter()
+        lag = max(0.0, (now - self._expected) * 1000)
+        self.lag_ms.append(lag)
+        self.beats += 1
+        if lag >= self.stall_ms:
+            self.stalls += 1
+            culprit = f" (last slow callback: {self._last_slow_callback})" if self._last_slow_callback else ""
+            self.report(f"[ui] event loop blocked for {lag:.0f} ms{culprit}")
+        self._expected = now + self.interval_ms / 1000
+        self._jobs['beat'] = self.widget.after(self.interval_ms, self._heartbeat)
+    
+    def _callback_finished(self, func, seconds: float, beats_before: int):
+        # The heartbeat itself, and callbacks that let it run, did not block the loop
+        if self.beats != beats_before:
+            return
+        elapsed_ms = seconds * 1000
+        if elapsed_ms < 1.0:
+            return
+        name = _callback_name(func)
+        self._last_slow_callback = name
+        self._sequence += 1
+        entry = (elapsed_ms, self._sequence, name)
+        if len(self._slowest) < self.top_callbacks:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+    
+    @contextmanager
+    def operation(self, name: str):
+        """Time the enclosed block as one run of a named UI operation"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.operations.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+    
+    # ---------- reporting ----------
+    
+    @staticmethod
+    def percentiles(samples) -> dict:
+        ordered = sorted(samples)
+        if not ordered:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+        pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+        return {'p50': pick(0.50), 'p95': pick(0.95), 'p99': pick(0.99), 'max': ordered[-1]}
+    
+    def slowest_callbacks(self) -> List[Tuple[str, float]]:
+        return [(name, elapsed) for elapsed, _, name in sorted(self._slowest, reverse=True)]
+    
+    def summary_line(self) -> str:
+        lag = self.percentiles(self.lag_ms)
+        return (f"Event loop lag p50 {lag['p50']:.1f} ms, p95 {lag['p95']:.1f} ms, "
+                f"p99 {lag['p99']:.1f} ms, max {lag['max']:.0f} ms; {self.stalls} stalls")
+    
+    def report_text(self) -> str:
+        lines = ["📈 UI RESPONSIVENESS", self.summary_line(), "",
+                 f"Slowest blocking callbacks (of those over 1 ms):"]
+        lines += [f"  {elapsed:8.1f} ms  {name}" for name, elapsed in self.slowest_callbacks()] or ["  none"]
+        if self.operations:
+            lines += ["", "Timed operations:"]
+            for name, timings in self.operations.items():
+                stats = self.percentiles(timings)
+                lines.append(f"  {name}: {len(timings)} runs, p50 {stats['p50']:.1f} ms, max {stats['max']:.1f} ms")
+        return "\n".join(lines)
+    
+    def _log_summary(self):
+        self.report(f"[ui] {self.summary_line()}")
+        self._jobs['log'] = self.widget.after(int(self.log_interval * 1000), self._log_summary)
+    
+    def attach_label(self, label, interval_ms: int = 1000):
+        """Keep a Tk label showing the current lag summary"""
+        def update():
+            label.config(text=self.summary_line())
+            self._jobs['label'] = label.after(interval_ms, update)
+        self._jobs['label'] = label.after(interval_ms, update)
+
+# ==================== SYNTHETIC DATA ====================
+
+class SyntheticGardenGenerator:
+    """
+    Seeded, deterministic generator of plant records for load and regression tests
+    
+    Records are built a batch at a time, one column per field drawn with
+    random.choices over weighted pools, and look like bulk import input
+    (name, type, care_notes, location, owner_email, special_traits, diseases,
+    care_history). invalid_rate and adversarial_rate set the share of values
+    per field replaced with plainly invalid or adversarial inputs (trailing
+    newlines that slip past '$', look-alike Unicode, zero-width and control
+    characters, very long and backtracking-heavy strings); field_rates
+    overrides them per field as {field: (invalid_rate, adversarial_rate)}.
+    The same seed always produces the same records.
+    """
+    
+    TYPE_WEIGHTS = {"Flower": 30, "Herb": 25, "Vegetable": 20, "Succulent": 15, "Tree": 10}
+    TRAITS = ["Fast Growing", "Drought Resistant", "Disease Resistant", "High Yield", "Colorful",
+              "Fragrant", "Cold Hardy", "Heat Tolerant", "Low Maintenance", "Decorative"]
+    DISEASES = ["Root Rot", "Aphids", "Fungal Infection", "Nutrient Deficiency", "Overwatering",
+                "Sunburn", "Leaf Spot", "Powdery Mildew"]
+    PLACES = [("San Francisco", "California"), ("Los Angeles", "California"), ("Portland", "Oregon"),
+              ("Seattle", "Washington"), ("Phoenix", "Arizona"), ("Austin", "Texas"),
+              ("Houston", "Texas"), ("Denver", "Colorado"), ("Chicago", "Illinois"),
+              ("New York City", "New York"), ("Boston", "Massachusetts"), ("Miami", "Florida"),
+              ("Dublin", "Ireland"), ("London", "England"), ("Toronto", "Canada"),
+              ("Sydney", "Australia"), ("Berlin", "Germany"), ("Paris", "France")]
+    DOMAINS = {"gmail.com": 40, "example.com": 15, "outlook.com": 12, "yahoo.com": 10,
+               "greenthumb.org": 8, "garden.net": 5, "example.co.uk": 5, "icloud.com": 5}
+    NAME_WORDS = ["Rose", "Basil", "Mint", "Fern", "Oak", "Maple", "Tomato", "Pepper", "Lily",
+                  "Aloe", "Cactus", "Sage", "Thyme", "Ivy", "Orchid", "Tulip", "Daisy", "Lavender"]
+    NAME_SUFFIXES = ["", "", "", " Garden", " Supreme", "-Prime", " Beauty", "'s Pride", " Jr", " 2"]
+    CARE_NOTES = ["", "", "Needs daily watering and weekly fertilizer.", "Water sparingly, once per week.",
+                  "Harvest leaves regularly for best flavor!", "Keep in partial shade.",
+                  "Rotate the pot every few days.", "Mist leaves in dry weather."]
+    WATER_AMOUNTS = ["5", "10", "12.5", "15", "20", "25.75"]
+    
+    INVALID_VALUES = {
+        'name': ["X", "A" * 31, "Plant@Home", "Rose<3", "", "   "],
+        'type': ["Cactus", "flower", "Shrub", "", "Herbs"],
+        'care_notes': ["<script>alert(1)</script>", "n" * 201, "Use 50% less {water}", "Tab\there\x00"],
+        'location': ["San Francisco", "California, ", "123 Main St, CA", ", Oregon", "Paris; France"],
+        'owner_email': ["invalid.email", "@domain.com", "user@", "user@domain", "a b@example.com"],
+        'special_traits': ["Glowing", "fragrant", "Fast-Growing"],
+        'diseases': ["Plant Cancer", "Unknown Disease", "Root  Rot!"],
+    }
+    
+    def __init__(self, seed: int = 0, invalid_rate: float = 0.0, adversarial_rate: float = 0.0,
+                 field_rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 max_history: int = 20, start_date: datetime = datetime(2023, 1, 1)):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.invalid_rate = invalid_rate
+        self.adversarial_rate = adversarial_rate
+        self.field_rates = field_rates or {}
+        self.max_history = max_history
+        self.start_date = start_date
+        self.generated = 0
+        self._history_dates: List[str] = []
+        
+        # Heavy-tailed pools: a few places, owners and domains dominate
+        self.locations = [f"{city}, {region}" for city, region in self.PLACES]
+        self.location_weights = [1 / (rank + 1) for rank in range(len(self.locations))]
+        self.owners = [f"{word.lower()}{n}" for n in range(300) for word in ("gardener", "grower", "plantfan")]
+        self.owner_weights = [1 / (rank + 1) ** 0.8 for rank in range(len(self.owners))]
+    
+    # ---------- value pools ----------
+    
+    def _names(self, n: int) -> List[str]:
+        rng = self.rng
+        words = rng.choices(self.NAME_WORDS, k=n)
+        suffixes = rng.choices(self.NAME_SUFFIXES, k=n)
+        return [word + suffix for word, suffix in zip(words, suffixes)]
+    
+    def _emails(self, n: int) -> List[str]:
+        rng = self.rng
+        owners = rng.choices(self.owners, weights=self.owner_weights, k=n)
+        domains = rng.choices(list(self.DOMAINS), weights=list(self.DOMAINS.values()), k=n)
+        present = rng.choices((True, False), weights=(85, 15), k=n)
+        return [f"{owner}@{domain}" if has else "" for owner, domain, has in zip(owners, domains, present)]
+    
+    def _traits(self, n: int) -> List[List[str]]:
+        rng = self.rng
+        counts = rng.choices((0, 1, 2, 3), weights=(30, 35, 25, 10), k=n)
+        return [rng.sample(self.TRAITS, count) for count in counts]
+    
+    def _diseases(self, n: int) -> List[List[str]]:
+        rng = self.rng
+        counts = rng.choices((0, 1, 2), weights=(80, 16, 4), k=n)
+        return [rng.sample(self.DISEASES, count) for count in counts]
+    
+    def _histories(self, n: int) -> List[List[dict]]:
+        rng = self.rng
+        lengths = rng.choices(range(self.max_history + 1), k=n)
+        events = sum(lengths)
+        # Draw every event of the batch at once, then slice per plant
+        gaps = rng.choices((1, 1, 2, 3, 7), k=events)
+        minutes = rng.choices(range(6 * 60, 21 * 60), k=events)
+        watering = [f"Watered with {float(amount)} units" for amount in self.WATER_AMOUNTS]
+        notes = rng.choices(watering + self.CARE_NOTES[2:],
+                            weights=[80 / len(watering)] * len(watering)
+                                    + [20 / len(self.CARE_NOTES[2:])] * len(self.CARE_NOTES[2:]),
+                            k=events)
+        dates = self._history_dates
+        histories = []
+        position = 0
+        for length in lengths:
+            day = rng.randrange(365)
+            history = []
+            for i in range(position, position + length):
+                day += gaps[i]
+                if day >= len(dates):
+                    dates.extend((self.start_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+                                 for offset in range(len(dates), day + 366))
+                minute = minutes[i]
+                history.append({'timestamp': f"{dates[day]} {minute // 60:02d}:{minute % 60:02d}",
+                                'note': notes[i], 'type': 'manual_note'})
+            position += length
+            histories.append(history)
+        return histories
+    
+    # ---------- invalid and adversarial values ----------
+    
+    def _adversarial(self, value: str) -> str:
+        rng = self.rng
+        value = value or "Rose"
+        attack = rng.randrange(8)
+        if attack == 0:
+            return value + "\n"                                    # '$' matches before a final newline
+        if attack == 1:
+            return value.replace("o", "\u043e").replace("a", "\u0430")  # Cyrillic look-alikes
+        if attack == 2:
+            middle = len(value) // 2
+            return value[:middle] + "\u200b" + value[middle:]      # zero-width space
+        if attack == 3:
+            return "\u202e" + value                                 # right-to-left override
+        if attack == 4:
+            return value + "\x00"
+        if attack == 5:
+            return value * (10_000 // max(len(value), 1) + 1)       # very long input
+        if attack == 6:
+            return "a@" + "a." * 2_000 + "!"                       # backtracking-heavy for EMAIL
+        return "\u3000" + value.replace(" ", "\u00a0")           # Unicode whitespace variants
+    
+    def _corrupt(self, field: str, column: list, invalid_pool: list):
+        invalid_rate, adversarial_rate = self.field_rates.get(
+            field, (self.invalid_rate, self.adversarial_rate))
+        if not invalid_rate and not adversarial_rate:
+            return
+        rng = self.rng
+        outcomes = rng.choices(("keep", "invalid", "adversarial"),
+                               weights=(max(0.0, 1 - invalid_rate - adversarial_rate),
+                                        invalid_rate, adversarial_rate),
+                               k=len(column))
+        for i, outcome in enumerate(outcomes):
+            if outcome == "keep":
+                continue
+            current = column[i]
+            if isinstance(current, list):
+                base = current[0] if current else ""
+                bad = rng.choice(invalid_pool) if outcome == "invalid" else self._adversarial(base)
+                column[i] = current[1:] + [bad]
+            else:
+                column[i] = rng.choice(invalid_pool) if outcome == "invalid" else self._adversarial(current)
+    
+    # ---------- output ----------
+    
+    def batch(self, n: int) -> List[dict]:
+        """Generate n records as one columnar batch"""
+        rng = self.rng
+        columns = {
+            'name': self._names(n),
+            'type': rng.choices(list(self.TYPE_WEIGHTS), weights=list(self.TYPE_WEIGHTS.values()), k=n),
+            'care_notes': rng.choices(self.CARE_NOTES, k=n),
+            'location': [location if has else "" for location, has in zip(
+                rng.choices(self.locations, weights=self.location_weights, k=n),
+                rng.choices((True, False), weights=(90, 10), k=n))],
+            'owner_email': self._emails(n),
+            'special_traits': self._traits(n),
+            'diseases': self._diseases(n),
+        }
+        for field, invalid_pool in self.INVALID_VALUES.items():
+            self._corrupt(field, columns[field], invalid_pool)
+        columns['care_history'] = self._histories(n)
+        
+        self.generated += n
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+    
+    def batches(self, total: int, batch_size: int = 10_000):
+        """Yield batches of records until total records have been generated"""
+        remaining = total
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            remaining -= size
+            yield self.batch(size)
+    
+    def records(self, total: int, batch_size: int = 10_000):
+        for batch in self.batches(total, batch_size):
+            yield from batch
+    
+    def write_jsonl(self, path: str, total: int, batch_size: int = 10_000,
+                    compress: Optional[bool] = None) -> int:
+        """Stream total records to a JSON-lines file (gzip when compress or *.gz)"""
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        with open_export_file(path, compress) as handle:
+            for batch in self.batches(total, batch_size):
+                handle.write("\n".join(map(encode, batch)) + "\n")
+        return total
+    
+    def pattern_values(self, pattern_key: str, n: int) -> List[str]:
+        """
+        Test strings for one PlantValidationPatterns field, for the pattern
+        tester and validator regression runs, with the configured share of
+        invalid and adversarial values
+        """
+        rng = self.rng
+        valid = {
+            'PLANT_NAME': lambda: self._names(1)[0],
+            'PLANT_TYPE': lambda: rng.choice(list(self.TYPE_WEIGHTS)),
+            'CARE_NOTES': lambda: rng.choice(self.CARE_NOTES),
+            'STAT_VALUE': lambda: str(rng.randint(0, 100)),
+            'PLANT_ID': lambda: f"PLT-{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}"
+                                f"{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{rng.randrange(10000):04d}",
+            'DATE_FORMAT': lambda: (self.start_date + timedelta(days=rng.randrange(1000))).strftime("%Y-%m-%d"),
+            'TIME_FORMAT': lambda: f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            'EMAIL': lambda: self._emails(1)[0] or "donlj@example.com",
+            'LOCATION': lambda: rng.choice(self.locations),
+            'DISEASE_NAME': lambda: rng.choice(self.DISEASES),
+            'WATER_AMOUNT': lambda: rng.choice(self.WATER_AMOUNTS),
+            'HEX_COLOR': lambda: f"#{rng.randrange(1 << 24):06x}",
+            'PLANT_TRAIT': lambda: rng.choice(self.TRAITS),
+            'SEASON': lambda: rng.choice(["Spring", "Summer", "Fall", "Autumn", "Winter"]),
+            'WEATHER': lambda: rng.choice(["Sunny", "Rainy", "Cloudy", "Windy", "Stormy", "Foggy", "Snow"]),
+        }
+        invalid = {
+            'STAT_VALUE': ["101", "-1", "007", "50.5", "abc"],
+            'PLANT_ID': ["PLT-ab1234", "PLT-AB123", "XYZ-AB1234", "PLT-AB12345"],
+            'DATE_FORMAT': ["2024/01/01", "24-01-01", "2024-1-1", "9999-99-99"],
+            'TIME_FORMAT': ["24:00", "29:59", "9:30", "12:60"],
+            'WATER_AMOUNT': ["0", "101", "5.123", "-5", "ten"],
+            'HEX_COLOR': ["#12345", "123456", "#GGGGGG", "#1234567"],
+            'SEASON': ["spring", "Monsoon"], 'WEATHER': ["Hail", "sunny"],
+            'PLANT_NAME': self.INVALID_VALUES['name'], 'PLANT_TYPE': self.INVALID_VALUES['type'],
+            'CARE_NOTES': self.INVALID_VALUES['care_notes'], 'LOCATION': self.INVALID_VALUES['location'],
+            'EMAIL': self.INVALID_VALUES['owner_email'], 'DISEASE_NAME': self.INVALID_VALUES['diseases'],
+            'PLANT_TRAIT': self.INVALID_VALUES['special_traits'],
+        }
+        if pattern_key not in valid:
+            raise ValueError(f"Unknown pattern key: {pattern_key}")
+        column = [valid[pattern_key]() for _ in range(n)]
+        invalid_rate, adversarial_rate = self.field_rates.get(
+            pattern_key, (self.invalid_rate, self.adversarial_rate))
+        saved, self.field_rates = self.field_rates, {pattern_key: (invalid_rate, adversarial_rate)}
+        try:
+            self._corrupt(pattern_key, column, invalid[pattern_key])
+        finally:
+            self.field_rates = saved
+        return column
+
+# ==================== BENCHMARKS ====================
+
+def _build_benchmark_garden(plant_count: int, waterings: int, seed: int = 42) -> List[ValidatedPlant]:
+    """Synthetic garden whose repeated strings are all distinct str objects"""
+    rng = random.Random(seed)
+    cities = [("San Francisco", "California"), ("Portland", "Oregon"), ("Phoenix", "Arizona"),
+              ("Dublin", "Ireland"), ("Austin", "Texas"), ("Denver", "Colorado")]
+    domains = ["example.com", "greenthumb.org", "gmail.com", "garden.net"]
+    owners = [f"gardener{i}" for i in range(200)]
+    
+    plants = []
+    for i in range(plant_count):
+        city, region = rng.choice(cities)
+        plant = ValidatedPlant(
+            f"Plant {i}",
+            rng.choice(["Flower", "Herb", "Succulent", "Vegetable", "Tree"]),
+            care_notes="".join(["Needs daily watering ", "and weekly fertilizer."]),
+            location=f"{city}, {region}",
+            owner_email=f"{rng.choice(owners)}@{rng.choice(domains)}"
+        )
+        for _ in range(waterings):
+            plant.water_plant(rng.choice(["5", "10", "12.5", "20"]))
+        plants.append(plant)
+    return plants
+
+def benchmark_string_interning(plant_count: int = 50_000, waterings: int = 10) -> dict:
+    """Report memory held by a synthetic garden with and without the string pool"""
+    results = {}
+    for label, enabled in (("plain", False), ("interned", True)):
+        GARDEN_STRINGS.enabled = enabled
+        tracemalloc.start()
+        try:
+            garden = _build_benchmark_garden(plant_count, waterings)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            GARDEN_STRINGS.enabled = True
+        results[label] = current
+        del garden
+    
+    reduction = 1 - results["interned"] / results["plain"]
+    print(f"String interning: {plant_count} plants x {waterings} waterings")
+    print(f"  plain:    {results['plain'] / 1e6:.1f} MB")
+    print(f"  interned: {results['interned'] / 1e6:.1f} MB")
+    print(f"  reduction: {reduction:.1%} (pool holds {len(GARDEN_STRINGS)} strings)")
+    results["reduction"] = reduction
+    return results
+
+def _reference_validate_plant_data(plant_data: dict) -> Tuple[bool, List[str]]:
+    """Hand-written per-field validation that PLANT_RECORD_VALIDATOR replaced"""
+    errors = []
+    
+    # Validate plant name
+    if 'name' in plant_data:
+        is_valid, error = RegexValidator.validate_pattern(
+            plant_data['name'], 
+            PlantValidationPatterns.PLANT_NAME, 
+            "Plant name"
+        )
+        if not is_valid:
+            errors.append("Plant name must be 2-30 characters, letters, numbers, spaces, hyphens, or apostrophes only")
+    
+    # Validate plant type
+    if 'type' in plant_data:
+        is_valid, error = RegexValidator.validate_pattern(
+            plant_data['type'], 
+            PlantValidationPatterns.PLANT_TYPE, 
+            "Plant type"
+        )
+        if not is_valid:
+            errors.append("Plant type must be one of: Flower, Herb, Succulent, Vegetable, Tree")
+    
+    # Validate care notes if present
+    if 'care_notes' in plant_data and plant_data['care_notes']:
+        is_valid, error = RegexValidator.validate_pattern(
+            plant_data['care_notes'], 
+            PlantValidationPatterns.CARE_NOTES, 
+            "Care notes"
+        )
+        if not is_valid:
+            errors.append("Care notes can only contain letters, numbers, spaces, and basic punctuation (max 200 characters)")
+    
+    # Validate location if present
+    if 'location' in plant_data and plant_data['location']:
+        is_valid, error = RegexValidator.validate_pattern(
+            plant_data['location'], 
+            PlantValidationPatterns.LOCATION, 
+            "Location"
+        )
+        if not is_valid:
+            errors.append("Location must be in format: City, State/Country")
+    
+    # Validate email if present
+    if 'owner_email' in plant_data and plant_data['owner_email']:
+        is_valid, error = RegexValidator.validate_pattern(
+            plant_data['owner_email'], 
+            PlantValidationPatterns.EMAIL, 
+            "Email"
+        )
+        if not is_valid:
+            errors.append("Email format is invalid")
+    
+    return len(errors) == 0, errors
+
+def benchmark_record_validator(record_count: int = 200_000) -> dict:
+    """Records per second: schema-compiled validator vs the hand-written function"""
+    rng = random.Random(7)
+    names = ["Rose Garden", "Basil-Supreme", "O'Malley's Oak", "X", "Plant@Home", "A" * 40]
+    notes = ["", "Water twice a week.", "Great for salads & sandwiches!", "n" * 250]
+    locations = ["", "Portland, Oregon", "San Francisco", "123 Main St, CA"]
+    emails = ["", "donlj@example.com", "invalid.email", "test.user+garden@example.co.uk"]
+    records = [
+        {
+            'name': rng.choice(names),
+            'type': rng.choice(["Flower", "Herb", "Tree", "Cactus"]),
+            'care_notes': rng.choice(notes),
+            'location': rng.choice(locations),
+            'owner_email': rng.choice(emails)
+        }
+        for _ in range(record_count)
+    ]
+    
+    results = {}
+    outputs = {}
+    for label, validate in (("hand-written", _reference_validate_plant_data),
+                            ("schema-compiled", PLANT_RECORD_VALIDATOR)):
+        started = time.perf_counter()
+        outputs[label] = [validate(record) for record in records]
+        results[label] = record_count / (time.perf_counter() - started)
+    
+    mismatches = sum(a != b for a, b in zip(outputs["hand-written"], outputs["schema-compiled"]))
+    print(f"Record validation: {record_count} records")
+    for label in ("hand-written", "schema-compiled"):
+        print(f"  {label:16} {results[label]:>12,.0f} records/s")
+    print(f"  speedup: {results['schema-compiled'] / results['hand-written']:.2f}x, mismatches: {mismatches}")
+    results["mismatches"] = mismatches
+    return results
+
+def benchmark_care_scheduler(plant_count: int = 1_000_000) -> dict:
+    """Schedule, reschedule and drain care reminders for a very large garden"""
+    rng = random.Random(11)
+    now = [0.0]
+    scheduler = CareScheduler(clock=lambda: now[0])
+    results = {}
+    
+    started = time.perf_counter()
+    for key in range(plant_count):
+        scheduler.schedule(key, 'water', rng.uniform(0, 7 * DAY_SECONDS))
+    results['schedule_per_second'] = plant_count / (time.perf_counter() - started)
+    
+    # Simulate a week hour by hour: drain due tasks and water 90% of them again
+    popped = 0
+    pop_seconds = 0.0
+    reschedule_seconds = 0.0
+    for hour in range(1, 7 * 24 + 1):
+        now[0] = hour * 3600.0
+        started = time.perf_counter()
+        due_tasks = scheduler.pop_due()
+        pop_seconds += time.perf_counter() - started
+        popped += len(due_tasks)
+        
+        started = time.perf_counter()
+        for key, task, _ in due_tasks:
+            if rng.random() < 0.9:
+                scheduler.schedule(key, task, now[0] + rng.uniform(1, 7) * DAY_SECONDS)
+        reschedule_seconds += time.perf_counter() - started
+    
+    results['popped'] = popped
+    results['pop_microseconds_per_task'] = pop_seconds / max(popped, 1) * 1e6
+    results['reschedule_per_second'] = popped * 0.9 / max(reschedule_seconds, 1e-9)
+    print(f"Care scheduler: {plant_count:,} plants, one simulated week in hourly ticks")
+    print(f"  initial schedule: {results['schedule_per_second']:>12,.0f} tasks/s")
+    print(f"  pop_due:          {results['pop_microseconds_per_task']:>12.2f} µs per due task ({popped:,} popped)")
+    print(f"  reschedule:       {results['reschedule_per_second']:>12,.0f} tasks/s")
+    return results
+
+def _synthetic_plant_dicts(plant_count: int, events: int = 5, seed: int = 5):
+    """Plant state dicts (as written by to_dict) for building large gardens quickly"""
+    rng = random.Random(seed)
+    traits = ["Fast Growing", "Drought Resistant", "Colorful", "Fragrant", "Low Maintenance"]
+    diseases = ["Aphids", "Root Rot", "Leaf Spot", "Sunburn"]
+    places = ["Portland, Oregon", "Austin, Texas", "Dublin, Ireland", "Phoenix, Arizona"]
+    created = datetime(2024, 1, 1).isoformat()
+    for i in range(plant_count):
+        yield {
+            'plant_id': f"PLT-{chr(65 + i % 26)}{chr(65 + i // 26 % 26)}{i % 10000:04d}",
+            'name': f"Plant {i}",
+            'type': rng.choice(["Flower", "Herb", "Succulent", "Vegetable", "Tree"]),
+            'created_date': created,
+            'care_notes': "Needs daily watering and weekly fertilizer.",
+            'location': rng.choice(places),
+            'owner_email': f"gardener{i % 500}@example.com",
+            'diseases': [{'name': name, 'diagnosed_date': "2024-02-01", 'severity': 3}
+                         for name in rng.sample(diseases, rng.randint(0, 2))],
+            'care_history': [{'timestamp': f"2024-03-{day + 1:02d} 08:00",
+                              'note': f"Watered with {rng.choice([5.0, 10.0, 12.5])} units",
+                              'type': 'manual_note'} for day in range(events)],
+            'special_traits': rng.sample(traits, 2),
+        }
+
+def benchmark_csv_export(plant_count: int = 1_000_000) -> dict:
+    """Throughput and peak memory of export_garden, plain and gzip"""
+    import tempfile
+    garden = [ValidatedPlant.from_dict(data) for data in _synthetic_plant_dicts(plant_count)]
+    results = {}
+    print(f"Streaming export: {plant_count:,} plants")
+    for label, compress in (("csv", False), ("csv.gz", True)):
+        with tempfile.TemporaryDirectory() as directory:
+            started = time.perf_counter()
+            counts = export_garden(garden, directory, compress=compress)
+            elapsed = time.perf_counter() - started
+            rows = sum(counts.values())
+            size = sum(os.path.getsize(path) for path in counts)
+        
+        # Peak memory is measured on a separate run, since tracing slows it down
+        with tempfile.TemporaryDirectory() as directory:
+            tracemalloc.start()
+            try:
+                export_garden(garden[:min(plant_count, 100_000)], directory, compress=compress)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        
+        results[label] = {'rows': rows, 'seconds': elapsed, 'rows_per_second': rows / elapsed,
+                          'bytes': size, 'peak_bytes': peak}
+        print(f"  {label:7} {rows:,} rows in {elapsed:.1f} s = {rows / elapsed:,.0f} rows/s, "
+              f"{size / 1e6:.0f} MB written, peak traced memory {peak / 1e6:.2f} MB")
+    return results
+
+def benchmark_synthetic_generator(record_count: int = 1_000_000) -> dict:
+    """Records per second from SyntheticGardenGenerator, in memory and streamed to JSONL"""
+    import tempfile
+    generator = SyntheticGardenGenerator(seed=1, invalid_rate=0.05, adversarial_rate=0.01)
+    started = time.perf_counter()
+    for _ in generator.batches(record_count):
+        pass
+    generate_seconds = time.perf_counter() - started
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "synthetic.jsonl")
+        generator = SyntheticGardenGenerator(seed=1, invalid_rate=0.05, adversarial_rate=0.01)
+        started = time.perf_counter()
+        generator.write_jsonl(path, record_count)
+        write_seconds = time.perf_counter() - started
+        size = os.path.getsize(path)
+    
+    print(f"Synthetic garden: {record_count:,} records")
+    print(f"  generate     {generate_seconds:.1f} s = {record_count / generate_seconds:,.0f} records/s")
+    print(f"  write JSONL  {write_seconds:.1f} s = {record_count / write_seconds:,.0f} records/s, "
+          f"{size / 1e6:.0f} MB")
+    return {'records': record_count, 'generate_seconds': generate_seconds,
+            'write_seconds': write_seconds, 'bytes': size}
+
+def benchmark_charclass_validators(iterations: int = 200_000) -> dict:
+    """Fuzz CHARCLASS_VALIDATORS against re.match, then time both on short and long inputs"""
+    mismatches = fuzz_charclass_validators(min(iterations, 100_000))
+    print(f"Differential fuzz: {len(mismatches)} mismatches")
+    for key, value, expected in mismatches[:10]:
+        print(f"  {key}: {value!r} regex={expected}")
+    
+    inputs = {
+        'CARE_NOTES': {'short': "Water weekly.",
+                       'long': ("Needs daily watering, weekly fertilizer and partial shade! " * 4)[:200]},
+    }
+    results = {'mismatches': len(mismatches)}
+    for key, cases in inputs.items():
+        validator = CHARCLASS_VALIDATORS[key]
+        match = re.compile(validator.pattern).match
+        check = validator.check
+        for length, value in cases.items():
+            started = time.perf_counter()
+            for _ in range(iterations):
+                match(value)
+            regex_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            for _ in range(iterations):
+                check(value)
+            charclass_seconds = time.perf_counter() - started
+            results[f"{key}_{length}"] = {'regex_seconds': regex_seconds,
+                                          'charclass_seconds': charclass_seconds}
+            print(f"  {key:11} {length:5} ({len(value):3} chars): regex {regex_seconds / iterations * 1e9:6.0f} ns, "
+                  f"char-class {charclass_seconds / iterations * 1e9:6.0f} ns "
+                  f"({regex_seconds / charclass_seconds:.2f}x)")
+    return results
+
+def benchmark_sanitizer(record_count: int = 200_000) -> dict:
+    """re.findall joins against translate-table sanitization, per value and per column"""
+    generator = SyntheticGardenGenerator(seed=2, invalid_rate=0.1, adversarial_rate=0.05)
+    records = generator.batch(record_count)
+    results = {}
+    print(f"Sanitization: {record_count:,} records")
+    for name, pattern_key in (('name', 'PLANT_NAME'), ('care_notes', 'CARE_NOTES'),
+                              ('location', 'LOCATION'), ('owner_email', 'EMAIL')):
+        pattern = FIELD_CHARACTER_CLASSES[pattern_key]
+        findall = re.compile(pattern).findall
+        values = [record[name] for record in records]
+        
+        started = time.perf_counter()
+        expected = [''.join(findall(value)) for value in values]
+        findall_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        column = FIELD_SANITIZERS[pattern_key].sanitize_column(values)
+        column_seconds = time.perf_counter() - started
+        
+        results[name] = {'findall_seconds': findall_seconds, 'column_seconds': column_seconds,
+                         'identical': column == expected}
+        print(f"  {name:12} findall {findall_seconds:.3f} s, translate column {column_seconds:.3f} s "
+              f"({findall_seconds / column_seconds:.1f}x), identical: {column == expected}")
+    
+    long_note = ("Water twice weekly; <b>avoid</b> wet leaves & feed monthly! " * 100)
+    pattern = FIELD_CHARACTER_CLASSES['CARE_NOTES']
+    started = time.perf_counter()
+    for _ in range(1000):
+        ''.join(re.findall(pattern, long_note))
+    findall_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(1000):
+        RegexValidator.sanitize_input(long_note, pattern)
+    sanitize_seconds = time.perf_counter() - started
+    results['long_note'] = {'findall_seconds': findall_seconds, 'sanitize_seconds': sanitize_seconds}
+    print(f"  {len(long_note):,}-character note: findall {findall_seconds:.3f} s, "
+          f"sanitize_input {sanitize_seconds:.3f} s per 1000 ({findall_seconds / sanitize_seconds:.1f}x)")
+    return results
+
+def benchmark_datetime_parsing(value_count: int = 1_000_000) -> dict:
+    """Looping datetime.strptime against parse_datetime_column on care history timestamps"""
+    generator = SyntheticGardenGenerator(seed=4)
+    timestamps = []
+    while len(timestamps) < value_count:
+        for record in generator.batch(10_000):
+            timestamps.extend(entry['timestamp'] for entry in record['care_history'])
+    timestamps = timestamps[:value_count]
+    rng = random.Random(4)
+    for index in rng.sample(range(value_count), value_count // 100):
+        timestamps[index] = rng.choice(["2024-02-30 10:00", "2023-13-01 08:15", "2024-01-01 29:59",
+                                        "9999-99-99 00:00", "2024-01-01"])
+    
+    strptime = datetime.strptime
+    epoch = datetime(1970, 1, 1)
+    started = time.perf_counter()
+    expected = []
+    for value in timestamps:
+        try:
+            expected.append(int((strptime(value, "%Y-%m-%d %H:%M") - epoch).total_seconds()))
+        except ValueError:
+            expected.append(None)
+    strptime_seconds = time.perf_counter() - started
+    
+    results = {'values': value_count, 'strptime_seconds': strptime_seconds}
+    print(f"Timestamp parsing: {value_count:,} values, {expected.count(None):,} invalid")
+    print(f"  strptime loop     {strptime_seconds:.2f} s")
+    modes = [('lists', False)] + ([('numpy', True)] if np is not None else [])
+    for label, use_numpy in modes:
+        started = time.perf_counter()
+        column = parse_datetime_column(timestamps, 'timestamp', use_numpy=use_numpy)
+        elapsed = time.perf_counter() - started
+        values = column.values.tolist() if use_numpy else column.values
+        identical = [None if value == INVALID_EPOCH else value for value in values] == expected
+        results[label] = {'seconds': elapsed, 'identical': identical}
+        print(f"  column ({label:5})   {elapsed:.2f} s ({strptime_seconds / elapsed:.1f}x), identical: {identical}")
+    return results
+
+def benchmark_outbreak_detector(event_count: int = 2_000_000) -> dict:
+    """Events per second through OutbreakDetector for one simulated hour of diagnoses"""
+    rng = random.Random(6)
+    regions = [region for _, region in SyntheticGardenGenerator.PLACES] + [f"Region {i}" for i in range(500)]
+    region_weights = [1 / (rank + 1) for rank in range(len(regions))]
+    diseases = SyntheticGardenGenerator.DISEASES
+    start = 1_700_000_000.0
+    events = list(zip(rng.choices(diseases, k=event_count),
+                      rng.choices(regions, weights=region_weights, k=event_count),
+                      sorted(start + rng.random() * 3600 for _ in range(event_count)),
+                      rng.choices(range(1, 11), k=event_count)))
+    
+    alerts = []
+    detector = OutbreakDetector(window_seconds=3600, bucket_seconds=60, rate_threshold=1000,
+                                on_alert=alerts.append, clock=lambda: start + 3600)
+    started = time.perf_counter()
+    detector.record_many(events)
+    elapsed = time.perf_counter() - started
+    
+    print(f"Outbreak detection: {event_count:,} events in one simulated hour")
+    print(f"  {elapsed:.2f} s = {event_count / elapsed:,.0f} events/s "
+          f"({event_count / elapsed * 3600 / 1e6:,.0f}M events/hour on one core)")
+    print(f"  {len(detector):,} (disease, region) pairs, {len(alerts):,} alerts, "
+          f"top: {detector.hotspots(3)}")
+    return {'events': event_count, 'seconds': elapsed, 'pairs': len(detector), 'alerts': len(alerts)}
+
+def benchmark_trait_similarity(plant_count: int = 1_000_000) -> dict:
+    """Top-K similarity and superset filters over TraitIndex, NumPy and array fallback"""
+    garden = [ValidatedPlant.from_dict(data) for data in _synthetic_plant_dicts(plant_count, events=0)]
+    generator = SyntheticGardenGenerator(seed=8)
+    for plant, traits in zip(garden, generator._traits(plant_count)):
+        plant.special_traits = traits
+    queries = random.Random(8).sample(garden, 20)
+    
+    results = {}
+    print(f"Trait similarity: {plant_count:,} plants, {len(queries)} queries")
+    modes = ([('numpy', True)] if np is not None else []) + [('array', False)]
+    for label, use_numpy in modes:
+        index = TraitIndex(use_numpy=use_numpy)
+        started = time.perf_counter()
+        index.add_plants(garden)
+        build_seconds = time.perf_counter() - started
+        
+        timings = {}
+        for metric in TraitIndex.METRICS:
+            started = time.perf_counter()
+            for query in queries:
+                index.similar(query, 10, metric)
+            timings[metric] = (time.perf_counter() - started) / len(queries)
+        started = time.perf_counter()
+        matches = len(index.with_traits(["Fragrant", "Cold Hardy"]))
+        timings['superset'] = time.perf_counter() - started
+        
+        for plant in garden:
+            plant.unsubscribe(index._on_mutation)
+        results[label] = dict(timings, build_seconds=build_seconds)
+        print(f"  {label:5}: build {build_seconds:.2f} s, top-10 jaccard {timings['jaccard'] * 1000:.1f} ms, "
+              f"hamming {timings['hamming'] * 1000:.1f} ms, superset filter {timings['superset'] * 1000:.1f} ms "
+              f"({matches:,} matches)")
+    return results
+
+def _start_virtual_display():
+    """Start Xvfb when there is no display (returns the process, or None if not needed)"""
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    if not shutil.which("Xvfb"):
+        raise RuntimeError("No display: set DISPLAY, install Xvfb, or run under xvfb-run")
+    display = f":{90 + os.getpid() % 100}"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(1.0)
+    os.environ["DISPLAY"] = display
+    return process
+
+def benchmark_ui_responsiveness(plant_count: int = 5000) -> dict:
+    """
+    Drive the GUI headlessly and report event-loop latency per operation
+    
+    Each operation runs as a Tk callback would; afterwards the event loop is
+    pumped for settle_ms while the monitor's heartbeat measures lag, so the
+    worst lag includes the operation's own blocking time and any follow-up
+    work (like the add-plant dialog's polling loop) it left scheduled.
+    """
+    try:
+        display = _start_virtual_display()
+    except RuntimeError as e:
+        print(f"UI benchmark skipped: {e}")
+        return {}
+    
+    monitor = EventLoopMonitor(interval_ms=5, stall_ms=50, log_interval=None)
+    monitor.report = lambda message: None
+    app = RegexDemoApp()
+    root = app.root
+    
+    def pump(milliseconds: int):
+        root.after(milliseconds, root.quit)
+        root.mainloop()
+    
+    state = {}
+    
+    def open_add_dialog():
+        state['dialog'] = ValidatedAddPlantDialog(root, app.plant_added_callback)
+    
+    def fill_and_add():
+        dialog = state.pop('dialog')
+        dialog.name_entry.insert(0, "Benchmark Rose")
+        dialog.care_notes_entry.insert("1.0", "Water weekly and feed monthly.")
+        dialog.location_entry.insert(0, "Portland, Oregon")
+        dialog.email_entry.insert(0, "bench@example.com")
+        for field_name in ('name_entry', 'care_notes_entry', 'location_entry', 'email_entry'):
+            dialog.validate_field(field_name)
+        dialog.add_plant()
+    
+    def open_tester():
+        state['tester'] = PatternTesterWindow(root)
+    
+    def load_all_examples():
+        tester = state['tester']
+        for pattern_key in ("PLANT_NAME", "EMAIL", "LOCATION", "DISEASE_NAME"):
+            tester.pattern_var.set(pattern_key)
+            tester.load_examples()
+    
+    def open_browser():
+        state['browser'] = PlantBrowserWindow(root, app.plants)
+    
+    def scroll_browser():
+        for _ in range(50):
+            state['browser'].table.scroll(1, "pages")
+    
+    def filter_browser():
+        state['browser'].type_var.set("Herb")
+        state['browser'].apply_filters()
+    
+    operations = [
+        ("load_demo_data", app.load_demo_data),
+        ("generate_validation_report", app.generate_validation_report),
+        ("open_add_plant_dialog", open_add_dialog),
+        ("add_plant_dialog_idle", lambda: None),
+        ("fill_and_add_plant", fill_and_add),
+        ("open_pattern_tester", open_tester),
+        ("load_examples_x4", load_all_examples),
+        ("open_plant_browser", open_browser),
+        ("browser_sort_by_health", lambda: state['browser'].sort_by('health')),
+        ("browser_filter_herbs", filter_browser),
+        ("browser_scroll_50_pages", scroll_browser),
+        ("browser_show_details", lambda: state['browser'].show_details(0)),
+    ]
+    
+    results = {}
+    try:
+        with monitor.installed(root):
+            for record in SyntheticGardenGenerator(seed=10).batch(plant_count):
+                plant = ValidatedPlant.from_record(record)
+                app.add_plant_to_garden(plant)
+            pump(300)
+            
+            print(f"UI responsiveness: {plant_count:,} plants, heartbeat {monitor.interval_ms} ms")
+            print(f"  {'operation':28} {'run ms':>8} {'lag p50':>8} {'lag p95':>8} {'lag max':>8}")
+            for name, operation in operations:
+                beats_before = monitor.beats
+                with monitor.operation(name):
+                    operation()
+                pump(600)
+                samples = list(monitor.lag_ms)[-(monitor.beats - beats_before):] if monitor.beats > beats_before else []
+                lag = monitor.percentiles(samples)
+                run_ms = monitor.operations[name][-1]
+                results[name] = dict(lag, run_ms=run_ms)
+                print(f"  {name:28} {run_ms:8.1f} {lag['p50']:8.1f} {lag['p95']:8.1f} {lag['max']:8.1f}")
+            
+            print(f"  overall: {monitor.summary_line()}")
+            print("  slowest blocking callbacks:")
+            for callback, elapsed in monitor.slowest_callbacks()[:5]:
+                print(f"    {elapsed:8.1f} ms  {callback}")
+            results['slowest_callbacks'] = monitor.slowest_callbacks()
+    finally:
+        root.destroy()
+        if display is not None:
+            display.terminate()
+    return results
+
+BENCHMARKS = {
+    'interning': benchmark_string_interning,
+    'validator': benchmark_record_validator,
+    'scheduler': benchmark_care_scheduler,
+    'export': benchmark_csv_export,
+    'synthetic': benchmark_synthetic_generator,
+    'charclass': benchmark_charclass_validators,
+    'sanitize': benchmark_sanitizer,
+    'datetime': benchmark_datetime_parsing,
+    'outbreak': benchmark_outbreak_detector,
+    'traits': benchmark_trait_similarity,
+    'ui': benchmark_ui_responsiveness,
+}
+
+# ==================== MAIN DEMO EXECUTION ====================
+
+def main():
+    """
+    Main function to demonstrate regex validation in GrowBuddy
+    """
+    parser = argparse.ArgumentParser(description="GrowBuddy regex validation demo")
+    parser.add_argument("--benchmark", choices=sorted(BENCHMARKS),
+                        help="run a benchmark instead of the GUI")
+    parser.add_argument("--size", type=int,
+                        help="problem size passed to the benchmark")
+    parser.add_argument("--generate", metavar="FILE",
+                        help="write --size synthetic plant records to a JSON-lines FILE (.gz to compress)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed for --generate")
+    parser.add_argument("--invalid-rate", type=float, default=0.0,
+                        help="share of invalid values per field for --generate")
+    parser.add_argument("--adversarial-rate", type=float, default=0.0,
+                        help="share of adversarial values per field for --generate")
+    parser.add_argument("--journal", metavar="DIR",
+                        help="persist the garden in a write-ahead journal in DIR")
+    parser.add_argument("--monitor", action="store_true",
+                        help=f"monitor event-loop latency in the GUI (or set {EventLoopMonitor.ENVIRONMENT_VARIABLE})")
+    parser.add_argument("--profile", nargs="?", metavar="DIR", const=OperationProfiler.DEFAULT_DIRECTORY,
+                        help=f"profile major operations into DIR (or set {OperationProfiler.ENVIRONMENT_VARIABLE})")
+    args = parser.parse_args()
+    
+    if args.profile:
+        PROFILER.enable(args.profile)
+    
+    if args.generate:
+        generator = SyntheticGardenGenerator(args.seed, args.invalid_rate, args.adversarial_rate)
+        count = generator.write_jsonl(args.generate, args.size or 10_000)
+        print(f"Wrote {count:,} synthetic plant records to {args.generate}")
+        return
+    
+    if args.benchmark:
+        benchmark = BENCHMARKS[args.benchmark]
+        if args.size:
+            benchmark(args.size)
+        else:
+            benchmark()
+        return
+    
+    print("🌿 GrowBuddy Regex Validation Demo")
+    print("=" * 50)
+    print(f"Started by user: donlj")
+    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print()
+    
+    # Run the demo application
+    monitor = EventLoopMonitor() if args.monitor else EventLoopMonitor.from_environment()
+    app = RegexDemoApp(journal_dir=args.journal, monitor=monitor)
+    app.run()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+WORDS = "water prune mist feed repot aphids leaves yellow spots soil dry wet sunny shade found".split()
+
+
+def make_plant(rng, plant_id, events):
+    plant = growbuddy.ValidatedPlant("Fern", "Herb")
+    plant.plant_id = plant_id
+    for _ in range(events):
+        plant.care_history.append({'timestamp': "2024-01-01 08:00", 'type': 'manual_note',
+                                   'note': " ".join(rng.choice(WORDS) for _ in range(4))})
+    return plant
+
+
+def brute_force(plants, phrase):
+    """(plant ID, event) of every live text containing phrase, by scanning the plants"""
+    wanted = " ".join(growbuddy.CareNoteIndex.tokenize(phrase))
+    matches = []
+    for plant in plants:
+        texts = [(growbuddy.CareNoteIndex.CARE_NOTES_EVENT, plant.care_notes or '')]
+        texts += [(event, entry.get('note', ''))
+                  for event, entry in enumerate(plant.care_history, plant.care_history_offset)]
+        for event, text in texts:
+            if f" {wanted} " in f" {' '.join(growbuddy.CareNoteIndex.tokenize(text))} ":
+                matches.append((plant.plant_id, event))
+    return sorted(matches)
+
+
+class CareNoteIndexTest(unittest.TestCase):
+
+    def assertMatchesBruteForce(self, index, plants):
+        for term in ("aphids", "found", "water"):
+            self.assertEqual(sorted(index.term(term)), brute_force(plants, term))
+        self.assertEqual(sorted(index.prefix("aph")), brute_force(plants, "aphids"))
+        self.assertEqual(sorted(index.phrase("aphids found")), brute_force(plants, "aphids found"))
+
+    def test_mutations_removals_and_merges(self):
+        rng = random.Random(7)
+        index = growbuddy.CareNoteIndex()
+        index.MERGE_MIN = 200
+        plants = [make_plant(rng, f"p{number}", 20) for number in range(100)]
+        for plant in plants:
+            index.add_plant(plant)
+        self.assertMatchesBruteForce(index, plants)
+
+        merges = 0
+        for step in range(3000):
+            stats = index.stats()
+            numbered = stats['documents'] + stats['dead_documents']
+            plant = rng.choice(plants)
+            roll = rng.random()
+            if roll < 0.6:
+                plant.add_care_note(" ".join(rng.choice(WORDS) for _ in range(3)))
+            elif roll < 0.7:
+                plant.care_notes = rng.choice(["", "aphids found", "dry soil"])
+            elif roll < 0.8:
+                plant.compact_care_history(rng.randint(0, len(plant.care_history)))
+            elif roll < 0.9 and len(plants) > 20:
+                plants.remove(plant)
+                index.remove_plant(plant)
+            else:
+                plant = make_plant(rng, f"n{step}", rng.randint(0, 5))
+                plants.append(plant)
+                index.add_plant(plant)
+            stats = index.stats()
+            if stats['documents'] + stats['dead_documents'] < numbered:
+                merges += 1
+            if step % 500 == 0:
+                self.assertMatchesBruteForce(index, plants)
+        self.assertGreater(merges, 0)
+        self.assertMatchesBruteForce(index, plants)
+
+        index.merge()
+        self.assertMatchesBruteForce(index, plants)
+        stats = index.stats()
+        self.assertEqual(stats['dead_documents'], 0)
+        self.assertEqual(stats['documents'], sum(len(plant.care_history) + bool(plant.care_notes)
+                                                 for plant in plants))
+
+    def test_index_is_smaller_than_corpus(self):
+        rng = random.Random(3)
+        index = growbuddy.CareNoteIndex()
+        for number in range(200):
+            index.add_plant(make_plant(rng, f"p{number}", 50))
+        stats = index.stats()
+        self.assertLess(stats['document_bytes'], stats['posting_bytes'] / 10)
+        self.assertLess(stats['ratio'], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+
+def clock_at(start):
+    """datetime stand-in whose now() is start plus the days set on it"""
+    class Clock(growbuddy.datetime):
+        days = 0
+
+        @classmethod
+        def now(cls, tz=None):
+            return start + timedelta(days=cls.days)
+    return Clock
+
+
+def water_daily(plant, days, clock):
+    for day in range(days):
+        clock.days = day
+        plant.water_plant("5")
+
+
+def watered_units(plant):
+    total = sum(entry.get('water_units', 5.0) for entry in plant.care_summaries
+                if entry.get('type') == 'care_summary' or entry['note'].startswith("Watered"))
+    return total + 5.0 * len(plant.care_history)
+
+
+class CareRetentionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = clock_at(growbuddy.datetime(2020, 1, 1, 8, 0))
+        patcher = mock.patch.object(growbuddy, 'datetime', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_compaction_shrinks_daily_waterings(self):
+        plant = growbuddy.ValidatedPlant("Basil", "Herb")
+        compactor = growbuddy.CareHistoryCompactor()
+        compactor.track(plant)
+        water_daily(plant, 2000, self.clock)
+        compactor.run_pending()
+
+        policy = compactor.policy
+        self.assertLessEqual(len(plant.care_summaries), policy.max_summaries)
+        self.assertLessEqual(len(plant.care_history), policy.keep_last + policy.slack)
+        self.assertEqual(plant.care_history_offset + len(plant.care_history), 2000)
+        self.assertEqual(watered_units(plant), 2000 * 5.0)
+
+        raw = growbuddy.ValidatedPlant("Basil", "Herb")
+        water_daily(raw, 2000, self.clock)
+        self.assertLess(len(json.dumps(plant.to_dict())), len(json.dumps(raw.to_dict())) / 2)
+
+    def test_single_event_periods_stay_raw(self):
+        events = [{'timestamp': "2024-01-01 08:00", 'note': "Watered with 5 units", 'type': 'manual_note'},
+                  {'timestamp': "2024-01-09 08:00", 'note': "Pruned", 'type': 'manual_note'},
+                  {'timestamp': "2024-01-10 08:00", 'note': "Watered with 2.5 units", 'type': 'manual_note'}]
+        summaries = growbuddy.summarize_care_events(events, 'week')
+        self.assertIs(summaries[0], events[0])
+        self.assertEqual(len(summaries), 2)
+        self.assertEqual((summaries[1]['period_start'], summaries[1]['waterings'],
+                          summaries[1]['water_units'], summaries[1]['notes']), ("2024-01-08", 1, 2.5, 1))
+
+    def test_rollup_coarsens_oldest_summaries(self):
+        events = [{'timestamp': f"2024-{month:02d}-{day:02d} 08:00", 'note': "Watered with 1 units"}
+                  for month in range(1, 13) for day in (3, 4, 17, 18)]
+        summaries = growbuddy.rollup_care_summaries(growbuddy.summarize_care_events(events, 'day'), 10)
+        self.assertLessEqual(len(summaries), 10)
+        self.assertEqual(sum(summary.get('waterings', 1) for summary in summaries), len(events))
+        periods = [growbuddy.CareRetentionPolicy.PERIODS.index(summary.get('period', 'day')) for summary in summaries]
+        self.assertEqual(periods, sorted(periods, reverse=True))
+
+    def test_journal_records_only_changed_summaries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            journal = growbuddy.PlantJournal(directory, fsync='never')
+            journal.open()
+            plant = growbuddy.ValidatedPlant("Basil", "Herb")
+            journal.track(plant)
+            compactor = growbuddy.CareHistoryCompactor(
+                growbuddy.CareRetentionPolicy(keep_last=20, slack=5, max_summaries=12))
+            compactor.track(plant)
+            for day in range(400):
+                self.clock.days = day
+                plant.water_plant("5")
+                compactor.run_pending()
+            journal.close()
+
+            with open(journal.journal_path, encoding='utf-8') as handle:
+                records = [json.loads(line) for line in handle if '"o":"c"' in line]
+            self.assertTrue(records)
+            self.assertTrue(any(record['v']['keep'] > 0 for record in records))
+            self.assertLess(sum(len(record['v']['summaries']) for record in records),
+                            len(records) * len(plant.care_summaries))
+
+            replayed = growbuddy.PlantJournal(directory, fsync='never')
+            plants = replayed.open()
+            replayed.close()
+            self.assertEqual([restored.to_dict() for restored in plants], [plant.to_dict()])
+
+
+if __name__ == "__main__":
+    unittest.main()
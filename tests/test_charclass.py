@@ -0,0 +1,49 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "growbuddy'.py")
+
+
+def load_growbuddy():
+    """Import growbuddy'.py, whose file name is not a valid module name"""
+    if "growbuddy" in sys.modules:
+        return sys.modules["growbuddy"]
+    spec = importlib.util.spec_from_file_location("growbuddy", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["growbuddy"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+growbuddy = load_growbuddy()
+
+
+class CharClassValidatorTest(unittest.TestCase):
+
+    def test_fuzz_agrees_with_regex(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.assertEqual(growbuddy.fuzz_charclass_validators(20_000, seed=seed), [])
+
+    def test_edge_cases_match_regex(self):
+        validator = growbuddy.CHARCLASS_VALIDATORS['CARE_NOTES']
+        values = ["", "Water weekly.", "x" * 200, "x" * 201, "ok\n", "ok\n\n", "ok\r",
+                  "café ²", "\U0001f331", "tab\tand　space", "no <tags>"]
+        match = growbuddy.re.compile(validator.pattern).match
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(validator.check(value), match(value) is not None)
+
+    def test_record_validator_uses_char_class_check(self):
+        is_valid, errors = growbuddy.PLANT_RECORD_VALIDATOR(
+            {'name': "Basil", 'type': "Herb", 'care_notes': "Water weekly, keep sunny!"})
+        self.assertTrue(is_valid, errors)
+        is_valid, _ = growbuddy.PLANT_RECORD_VALIDATOR(
+            {'name': "Basil", 'type': "Herb", 'care_notes': "<script>"})
+        self.assertFalse(is_valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
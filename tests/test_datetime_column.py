@@ -0,0 +1,107 @@
+import os
+import random
+import re
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+FORMATS = {'date': "%Y-%m-%d", 'time': "%H:%M", 'timestamp': "%Y-%m-%d %H:%M"}
+# The column parser only takes zero-padded ASCII fields; strptime also reads
+# '2024-1-5', ' 8:00' and non-ASCII digits, so those are screened out first
+SHAPES = {'date': re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}"),
+          'time': re.compile(r"[0-9]{2}:[0-9]{2}"),
+          'timestamp': re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}")}
+
+EDGE_CASES = [
+    "2024-02-29", "2023-02-29", "1900-02-29", "2000-02-29", "2024-02-30", "2024-04-31",
+    "0001-01-01", "0000-01-01", "9999-12-31", "9999-99-99", "2024-13-01", "2024-00-10",
+    "2024-1-5", "2024-01-5", "2024-01-05 ", " 2024-01-05", "2024-01-05\n", "2024/01/05",
+    "٢٠٢٤-٠١-٠٥", "２０２４-０１-０５", "2024-0１-05",
+    "24:00", "23:59", "00:00", "9:05", "09:5", "12:60", "29:59", "٠٩:٠٥", " 9:05",
+    "2024-02-29 24:00", "2024-02-29 23:59", "2023-02-29 10:00", "9999-99-99 00:00",
+    "2024-01-05  8:00", "2024-01-05 8:00", "2024-01-05T08:00", "2024-01-05 08:00:00",
+    "", "-", None, 20240105,
+]
+
+
+def reference(value, layout):
+    """Epoch seconds per datetime.strptime, for values in the parser's fixed-width form"""
+    if type(value) is not str or not SHAPES[layout].fullmatch(value):
+        return None
+    try:
+        parsed = datetime.strptime(value, FORMATS[layout])
+    except ValueError:
+        return None
+    if layout == 'time':
+        return parsed.hour * 3600 + parsed.minute * 60
+    return int((parsed - datetime(1970, 1, 1)).total_seconds())
+
+
+def fuzzed_values(layout, count, rng):
+    """Valid values with random characters swapped, dropped or added"""
+    noise = "0123456789012345678901234567899-: /T٣\n"
+    values = []
+    for _ in range(count):
+        moment = datetime(rng.randint(1, 9999), rng.randint(1, 12), rng.randint(1, 28),
+                          rng.randint(0, 23), rng.randint(0, 59))
+        # strftime does not zero-pad years below 1000 on every platform
+        text = moment.strftime(FORMATS[layout].replace("%Y", f"{moment.year:04d}"))
+        chars = list(text)
+        for _ in range(rng.choice([0, 0, 1, 1, 2])):
+            position = rng.randrange(len(chars) + 1)
+            action = rng.random()
+            if action < 0.7 and position < len(chars):
+                chars[position] = rng.choice(noise)
+            elif action < 0.85 and position < len(chars):
+                del chars[position]
+            else:
+                chars.insert(position, rng.choice(noise))
+        values.append("".join(chars))
+    return values
+
+
+class DatetimeColumnTest(unittest.TestCase):
+
+    def check(self, values, layout, use_numpy):
+        expected = [reference(value, layout) for value in values]
+        column = growbuddy.parse_datetime_column(values, layout, use_numpy=use_numpy)
+        parsed = column.values.tolist() if use_numpy else column.values
+        if use_numpy:
+            parsed = [None if value == growbuddy.INVALID_EPOCH else value for value in parsed]
+        mismatches = [(value, want, got) for value, want, got in zip(values, expected, parsed) if want != got]
+        self.assertEqual(mismatches[:10], [])
+        self.assertEqual(column.invalid, [index for index, value in enumerate(expected) if value is None])
+        return column
+
+    def test_edge_cases_match_strptime(self):
+        for layout in FORMATS:
+            for use_numpy in (False, True) if growbuddy.np is not None else (False,):
+                with self.subTest(layout=layout, numpy=use_numpy):
+                    self.check(EDGE_CASES, layout, use_numpy)
+
+    def test_fuzzed_values_match_strptime(self):
+        rng = random.Random(43)
+        for layout in FORMATS:
+            values = fuzzed_values(layout, 20_000, rng)
+            self.assertGreater(sum(reference(value, layout) is None for value in values), 1000)
+            for use_numpy in (False, True) if growbuddy.np is not None else (False,):
+                with self.subTest(layout=layout, numpy=use_numpy):
+                    self.check(values, layout, use_numpy)
+
+    @unittest.skipIf(growbuddy.np is None, "NumPy is not installed")
+    def test_datetime64_output_marks_invalid_as_nat(self):
+        values = ["2024-02-29 23:59", "2024-02-29 24:00", "1970-01-01 00:00"]
+        column = growbuddy.parse_datetime_column(values, 'timestamp', output='datetime64')
+        self.assertEqual(column.invalid, [1])
+        self.assertEqual(str(column.values[0]), "2024-02-29T23:59:00")
+        self.assertTrue(growbuddy.np.isnat(column.values[1]))
+        self.assertEqual(column.values[2].astype('int64'), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
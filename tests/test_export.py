@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+
+def make_garden(count):
+    plants = []
+    for number in range(count):
+        plant = growbuddy.ValidatedPlant(f"Plant {number}", "Herb", location="Portland, Oregon")
+        plant.water_plant("5")
+        plant.add_trait("Fragrant")
+        plants.append(plant)
+    return plants
+
+
+class ExportGardenTest(unittest.TestCase):
+
+    def test_one_shot_iterables_are_rejected(self):
+        plants = make_garden(3)
+        with tempfile.TemporaryDirectory() as directory:
+            for iterable in ((plant for plant in plants), iter(plants), map(lambda plant: plant, plants)):
+                with self.subTest(iterable=type(iterable).__name__):
+                    with self.assertRaises(TypeError):
+                        growbuddy.export_garden(iterable, directory)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_every_file_sees_every_plant(self):
+        plants = make_garden(3)
+        garden = growbuddy.VersionedGarden(plants)
+        for source in (plants, tuple(plants), garden):
+            with self.subTest(source=type(source).__name__), tempfile.TemporaryDirectory() as directory:
+                counts = growbuddy.export_garden(source, directory)
+                by_name = {os.path.basename(path).split('.')[0]: rows for path, rows in counts.items()}
+                self.assertEqual((by_name['plants'], by_name['care_history'], by_name['traits']), (3, 3, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+NOTES = ["Moved to the window", "Leaves look pale", "Fed with compost", "Pruned the top"]
+DISEASES = ["Root Rot", "Powdery Mildew", "Leaf Spot"]
+TRAITS = ["Fragrant", "Colorful", "Cold Hardy"]
+LOCATIONS = ["Portland, Oregon", "Salem, OREGON", "London, UK", ""]
+
+
+def state(journal):
+    return {key: plant.to_dict() for key, plant in journal.plants.items()}
+
+
+def mutate(journal, rng, steps):
+    """Apply random journaled mutations: care, fields, compaction, tracking and removal"""
+    for step in range(steps):
+        plants = list(journal.plants.values())
+        roll = rng.random()
+        if roll < 0.08 or not plants:
+            plant = growbuddy.ValidatedPlant(f"Plant {step}", rng.choice(["Herb", "Flower"]),
+                                             location=rng.choice(LOCATIONS))
+            journal.track(plant)
+            continue
+        plant = rng.choice(plants)
+        if roll < 0.35:
+            plant.add_care_note(rng.choice(NOTES))
+        elif roll < 0.55:
+            plant.water_plant(rng.choice(["5", "12.5"]))
+        elif roll < 0.62:
+            plant.add_disease(rng.choice(DISEASES))
+        elif roll < 0.69:
+            plant.add_trait(rng.choice(TRAITS))
+        elif roll < 0.8:
+            field, values = rng.choice([('name', ["Basil", "Mint"]), ('location', LOCATIONS),
+                                        ('care_notes', ["", "Keep moist"]),
+                                        ('owner_email', ["a@example.com", ""])])
+            setattr(plant, field, rng.choice(values))
+        elif roll < 0.93:
+            plant.compact_care_history(rng.randint(0, 4), rng.choice(['day', 'week']), 3)
+        elif len(plants) > 1:
+            journal.untrack(plant)
+
+
+class PlantJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def open_journal(self, **options):
+        journal = growbuddy.PlantJournal(self.directory, **options)
+        journal.open()
+        self.addCleanup(journal.close)
+        return journal
+
+    def reopen(self):
+        journal = growbuddy.PlantJournal(self.directory, fsync='never')
+        journal.open()
+        journal.close()
+        return journal
+
+    def test_replay_matches_live_plants(self):
+        for fsync in growbuddy.PlantJournal.FSYNC_POLICIES:
+            with self.subTest(fsync=fsync):
+                shutil.rmtree(self.directory)
+                journal = self.open_journal(fsync=fsync, group_size=8)
+                mutate(journal, random.Random(fsync), 400)
+                expected = state(journal)
+                journal.close()
+                self.assertEqual(state(self.reopen()), expected)
+
+    def test_torn_tail_is_truncated(self):
+        for fsync in growbuddy.PlantJournal.FSYNC_POLICIES:
+            with self.subTest(fsync=fsync):
+                shutil.rmtree(self.directory)
+                journal = self.open_journal(fsync=fsync)
+                mutate(journal, random.Random(1), 100)
+                journal.commit()
+                expected = state(journal)
+                intact_size = os.path.getsize(journal.journal_path)
+                next(iter(journal.plants.values())).add_care_note("Lost in the crash")
+                journal.close()
+
+                # Cut the last record in half, as a crash mid-write would
+                size = os.path.getsize(journal.journal_path)
+                with open(journal.journal_path, 'r+b') as handle:
+                    handle.truncate(intact_size + (size - intact_size) // 2)
+                self.assertEqual(state(self.reopen()), expected)
+                self.assertEqual(os.path.getsize(journal.journal_path), intact_size)
+
+                # The truncated journal keeps accepting records
+                journal = self.open_journal(fsync=fsync)
+                next(iter(journal.plants.values())).add_care_note("After recovery")
+                expected = state(journal)
+                journal.close()
+                self.assertEqual(state(self.reopen()), expected)
+
+    def test_compaction_keeps_replay_equal(self):
+        for fsync in growbuddy.PlantJournal.FSYNC_POLICIES:
+            with self.subTest(fsync=fsync):
+                shutil.rmtree(self.directory)
+                journal = self.open_journal(fsync=fsync, compact_every=50)
+                rng = random.Random(2)
+                for _ in range(4):
+                    mutate(journal, rng, 60)
+                    journal.compact()
+                mutate(journal, rng, 30)
+                expected = state(journal)
+                journal.close()
+                self.assertTrue(os.path.exists(journal.snapshot_path))
+                self.assertEqual(state(self.reopen()), expected)
+
+    def test_crash_before_journal_rewrite_skips_covered_records(self):
+        journal = self.open_journal()
+        rng = random.Random(3)
+        mutate(journal, rng, 200)
+        journal.commit()
+        with open(journal.journal_path, 'rb') as handle:
+            full_journal = handle.read()
+        journal.compact()
+        expected = state(journal)
+        journal.close()
+
+        # The snapshot was replaced but the journal still holds every record it covers
+        with open(journal.journal_path, 'wb') as handle:
+            handle.write(full_journal)
+        self.assertEqual(state(self.reopen()), expected)
+
+    def test_interrupted_snapshot_write_is_ignored(self):
+        journal = self.open_journal()
+        mutate(journal, random.Random(4), 150)
+        journal.compact()
+        mutate(journal, random.Random(5), 50)
+        expected = state(journal)
+        journal.close()
+        with open(journal.snapshot_path + ".tmp", 'w', encoding='utf-8') as handle:
+            handle.write('{"sequence": 999999, "plants": 3}\n{"key": 0, "pla')
+        self.assertEqual(state(self.reopen()), expected)
+
+    def test_background_compaction(self):
+        journal = self.open_journal(fsync='batch', group_size=4, group_interval=0.001, compact_every=40)
+        mutate(journal, random.Random(6), 300)
+        expected = state(journal)
+        journal.close()
+        self.assertTrue(os.path.exists(journal.snapshot_path))
+        self.assertEqual(state(self.reopen()), expected)
+
+    def test_changes_frozen_before_their_record_replay_once(self):
+        changes = {
+            'care_note': lambda plant: plant.add_care_note("Repotted"),
+            'water': lambda plant: plant.water_plant("5"),
+            'disease': lambda plant: plant.add_disease("Root Rot"),
+            'trait': lambda plant: plant.add_trait("Fragrant"),
+            'compact': lambda plant: plant.compact_care_history(1),
+            'field': lambda plant: setattr(plant, 'location', "Salem, Oregon"),
+        }
+        for name, change in changes.items():
+            with self.subTest(change=name):
+                shutil.rmtree(self.directory)
+                journal = self.open_journal()
+                plant = growbuddy.ValidatedPlant("Basil", "Herb")
+                plant.add_care_note("Planted")
+                plant.add_care_note("Staked")
+                # An earlier observer snapshots after the change but before the
+                # journal records it, as the background flusher can
+                plant.subscribe(lambda plant, operation, details: journal.compact())
+                journal.track(plant)
+                change(plant)
+                expected = state(journal)
+                journal.close()
+                self.assertEqual(state(self.reopen()), expected)
+
+    def test_recording_requires_open_journal(self):
+        journal = growbuddy.PlantJournal(self.directory)
+        with self.assertRaises(ValueError):
+            journal.track(growbuddy.ValidatedPlant("Basil", "Herb"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+LOCATIONS = ["Austin, Texas", "Dublin, Ireland", "austin, texas", ""]
+DISEASES = ["Root Rot", "Leaf Spot", "Powdery Mildew"]
+FILTERS = [{}, {'plant_type': "Herb"}, {'location': "texas", 'min_health': 40},
+           {'disease': "root rot"}, {'plant_type': "Herb", 'disease': "leaf spot"}]
+
+
+def make_plant(rng):
+    plant = growbuddy.ValidatedPlant(f"Plant {rng.randint(0, 30)}", rng.choice(growbuddy.PLANT_TYPES),
+                                     location=rng.choice(LOCATIONS), health=rng.randint(0, 100))
+    if rng.random() < 0.3:
+        plant.add_disease(rng.choice(DISEASES))
+    return plant
+
+
+def expected_order(source):
+    """Every plant that passes the filters, sorted from scratch"""
+    predicates = source._predicates()
+    matching = [plant for plant in source.plants if all(test(plant) for test in predicates)]
+    return sorted(matching, key=source.SORT_KEYS[source.sort_key], reverse=source.descending)
+
+
+def change(garden, rng):
+    """One append batch, field write or removal"""
+    roll = rng.random()
+    # Keep the garden small enough to sort from scratch after every change
+    if roll < 0.25 and len(garden) < 800:
+        # Mostly small batches that are inserted, sometimes enough to force a rebuild
+        count = rng.choice([1, 5, 40, growbuddy.GardenPageSource.MAX_INSERTS + 10])
+        for _ in range(count):
+            garden.append(make_plant(rng))
+    elif roll < 0.8:
+        plant = garden[rng.randrange(len(garden))]
+        field = rng.choice(['name', 'location', 'plant_type', 'disease', 'water'])
+        if field == 'name':
+            plant.name = f"Plant {rng.randint(0, 30)}"
+        elif field == 'location':
+            plant.location = rng.choice(LOCATIONS)
+        elif field == 'plant_type':
+            plant.plant_type = rng.choice(growbuddy.PLANT_TYPES)
+        elif field == 'disease':
+            plant.add_disease(rng.choice(DISEASES))
+        else:
+            plant.water_plant("5")
+    else:
+        for _ in range(rng.randint(1, 3)):
+            garden.remove(garden[rng.randrange(len(garden))])
+
+
+class GardenPageSourceTest(unittest.TestCase):
+
+    def assertMatchesBruteForce(self, source):
+        expected = expected_order(source)
+        self.assertEqual([id(plant) for plant in source._ensure_order()], [id(plant) for plant in expected])
+        self.assertEqual(source.rows(0, 50), [source.format_row(plant) for plant in expected[:50]])
+
+    def test_incremental_order_matches_brute_force(self):
+        rng = random.Random(46)
+        garden = growbuddy.VersionedGarden(make_plant(rng) for _ in range(400))
+        source = growbuddy.GardenPageSource(garden, page_size=20)
+        for key in growbuddy.GardenPageSource.SORT_KEYS:
+            for descending in (False, True):
+                for filters in FILTERS:
+                    with self.subTest(key=key, descending=descending, filters=filters):
+                        source.set_sort(key, descending)
+                        source.set_filter(**filters)
+                        self.assertMatchesBruteForce(source)
+                        for _ in range(12):
+                            change(garden, rng)
+                            self.assertMatchesBruteForce(source)
+
+    def test_plain_list_appends_and_removals(self):
+        rng = random.Random(47)
+        plants = [make_plant(rng) for _ in range(200)]
+        source = growbuddy.GardenPageSource(plants)
+        for key in growbuddy.GardenPageSource.SORT_KEYS:
+            for descending in (False, True):
+                with self.subTest(key=key, descending=descending):
+                    source.set_sort(key, descending)
+                    source.set_filter(plant_type="Herb")
+                    self.assertMatchesBruteForce(source)
+                    plants.extend(make_plant(rng) for _ in range(rng.randint(1, 30)))
+                    self.assertMatchesBruteForce(source)
+                    del plants[:rng.randint(1, 30)]
+                    self.assertMatchesBruteForce(source)
+
+
+if __name__ == "__main__":
+    unittest.main()
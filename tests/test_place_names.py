@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+
+class PlaceNameTest(unittest.TestCase):
+
+    def test_spelling_depends_only_on_the_value(self):
+        cases = [("oregon ", "Oregon"), ("  new   york", "New York"), ("UK", "UK"),
+                 ("McAllen", "McAllen"), ("OREGON", "OREGON")]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(growbuddy.normalize_place_name(value), expected)
+        growbuddy.parse_location.cache_clear()
+        first = growbuddy.parse_location("Salem, OREGON")
+        second = growbuddy.parse_location("Portland, oregon")
+        self.assertEqual((first, second), (("Salem", "OREGON"), ("Portland", "Oregon")))
+
+    def test_report_label_ignores_counting_order(self):
+        locations = ["Salem, OREGON", "Portland, oregon", "Bend, Oregon", "London, UK"]
+        reports = []
+        for ordering in (locations, locations[::-1], locations[1:] + locations[:1]):
+            for approximate in ((), ('location_distribution',)):
+                aggregate = growbuddy.GardenStatsAggregate(approximate)
+                for location in ordering:
+                    aggregate.add_record({'type': "Herb", 'location': location})
+                reports.append(aggregate.to_stats()['location_distribution'])
+        for report in reports:
+            self.assertEqual(report, {'Oregon': 3, 'UK': 1})
+
+    def test_shard_merge_picks_the_same_label(self):
+        left, right = growbuddy.GardenStatsAggregate(), growbuddy.GardenStatsAggregate()
+        left.add_record({'type': "Herb", 'location': "Salem, OREGON"})
+        right.add_record({'type': "Herb", 'location': "Bend, Oregon"})
+        merged = [growbuddy.GardenStatsAggregate().merge(a).merge(b) for a, b in ((left, right), (right, left))]
+        self.assertEqual([aggregate.to_stats()['location_distribution'] for aggregate in merged],
+                         [{'Oregon': 2}, {'Oregon': 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+
+def fresh(text):
+    """An equal str that is not the same object as text"""
+    return "".join(list(text))
+
+
+class StringPoolTest(unittest.TestCase):
+
+    def test_low_cardinality_fields_are_shared(self):
+        first = growbuddy.ValidatedPlant("Basil", fresh("Herb"), location=fresh("Portland, Oregon"))
+        second = growbuddy.ValidatedPlant("Mint", fresh("Herb"), location=fresh("Portland, Oregon"))
+        self.assertIs(first.plant_type, second.plant_type)
+        self.assertIs(first.location, second.location)
+        self.assertIs(first.region, second.region)
+        first.water_plant("5")
+        second.water_plant("5")
+        self.assertIs(first.care_history[-1]['note'], second.care_history[-1]['note'])
+
+    def test_free_text_and_timestamps_are_not_pooled(self):
+        size = len(growbuddy.GARDEN_STRINGS)
+        plant = growbuddy.ValidatedPlant("Basil", "Herb", care_notes=fresh("Pinch off flower buds weekly."))
+        plant.add_care_note(fresh("Moved to the south window"))
+        entry = growbuddy.intern_care_entry({'timestamp': fresh("2031-05-06 07:08"),
+                                             'note': fresh("Leaves look pale"), 'type': 'manual_note'})
+        self.assertEqual(len(growbuddy.GARDEN_STRINGS), size)
+        self.assertNotIn('2031-05-06 07:08', growbuddy.GARDEN_STRINGS._strings)
+        self.assertEqual(entry['note'], "Leaves look pale")
+
+    def test_caps_pass_values_through(self):
+        pool = growbuddy.StringPool(max_entries=2, max_length=5)
+        long_value = fresh("a" * 6)
+        self.assertIs(pool.intern(long_value), long_value)
+        self.assertEqual(len(pool), 0)
+        pool.intern(fresh("one"))
+        pool.intern(fresh("two"))
+        three = fresh("three")
+        self.assertIs(pool.intern(three), three)
+        self.assertEqual(len(pool), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import gc
+import os
+import sys
+import unittest
+import weakref
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_charclass import load_growbuddy
+
+growbuddy = load_growbuddy()
+
+
+def make_plant(number):
+    plant = growbuddy.ValidatedPlant(f"Plant {number}", "Herb", location="Portland, Oregon")
+    plant.add_care_note("Planted")
+    plant.add_trait("Fragrant")
+    return plant
+
+
+def mutate(plant, round_number):
+    """Touch every kind of field: scalars, in-place list appends and replaced lists"""
+    plant.name = f"Renamed {round_number}"
+    plant.location = "London, UK" if round_number % 2 else "Salem, Oregon"
+    plant.water_plant("5")
+    plant.add_care_note(f"Round {round_number}")
+    plant.add_disease(["Root Rot", "Leaf Spot", "Blight"][round_number % 3])
+    plant.add_trait(["Colorful", "Cold Hardy", "High Yield"][round_number % 3])
+    plant.compact_care_history(1)
+
+
+def contents(plants):
+    return [plant.to_dict() for plant in plants]
+
+
+class VersionedGardenTest(unittest.TestCase):
+
+    def setUp(self):
+        self.plants = [make_plant(number) for number in range(6)]
+        self.garden = growbuddy.VersionedGarden(self.plants)
+
+    def test_snapshot_ignores_writes_removals_and_appends(self):
+        expected = contents(self.garden)
+        snapshot = self.garden.snapshot()
+        for plant in self.plants[:3]:
+            mutate(plant, 1)
+        removed = self.plants[4]
+        self.garden.remove(removed)
+        # A removed plant is no longer guarded by the garden, but the snapshot still lists it
+        mutate(removed, 2)
+        self.garden.append(make_plant(99))
+
+        self.assertEqual(len(snapshot), 6)
+        self.assertEqual(contents(snapshot), expected)
+        self.assertEqual([view.name for view in snapshot], [f"Plant {number}" for number in range(6)])
+        self.assertEqual((snapshot[4].name, removed.name), ("Plant 4", "Renamed 2"))
+        self.assertEqual(contents(self.garden.snapshot()), contents(self.garden))
+
+    def test_overlapping_snapshots_keep_their_own_versions(self):
+        snapshots, expected = [], []
+        for round_number in range(4):
+            snapshots.append(self.garden.snapshot())
+            expected.append(contents(self.garden))
+            for plant in self.plants[round_number:round_number + 3]:
+                mutate(plant, round_number)
+            if round_number == 1:
+                self.garden.remove(self.plants[1])
+                mutate(self.plants[1], 10)
+            self.garden.append(make_plant(100 + round_number))
+        # Dropping a snapshot in the middle of the chain must not lose older ones' pre-images
+        del snapshots[1], expected[1]
+        gc.collect()
+        for plant in self.plants:
+            mutate(plant, 20)
+        for snapshot, plants in zip(snapshots, expected):
+            with self.subTest(version=snapshot.version):
+                self.assertEqual(contents(snapshot), plants)
+
+    def test_preimages_are_freed_with_the_last_snapshot(self):
+        first = self.garden.snapshot()
+        mutate(self.plants[0], 1)
+        second = self.garden.snapshot()
+        mutate(self.plants[0], 2)
+        mutate(self.plants[1], 2)
+        epochs = [weakref.ref(first._epoch), weakref.ref(second._epoch)]
+        self.assertEqual(len(first._epoch.preimages) + len(second._epoch.preimages), 3)
+
+        del first
+        gc.collect()
+        self.assertIsNone(epochs[0]())
+        self.assertIsNotNone(epochs[1]())
+        del second
+        gc.collect()
+        self.assertIsNone(epochs[1]())
+        mutate(self.plants[2], 3)
+        self.assertEqual(contents(self.garden.snapshot()), contents(self.garden))
+
+    def test_reused_plant_ids_do_not_pick_up_stale_preimages(self):
+        snapshot = self.garden.snapshot()
+        expected = contents(snapshot)
+        for round_number in range(50):
+            # Plants added, written and dropped while the snapshot is alive
+            plant = make_plant(1000 + round_number)
+            self.garden.append(plant)
+            mutate(plant, round_number)
+            self.garden.remove(plant)
+            del plant
+            gc.collect()
+            newcomer = make_plant(2000 + round_number)
+            self.garden.append(newcomer)
+            later = self.garden.snapshot()
+            mutate(newcomer, round_number + 1)
+            self.assertEqual(later[-1].to_dict()['name'], f"Plant {2000 + round_number}")
+            del later
+        self.assertEqual(contents(snapshot), expected)
+        self.assertEqual(contents(self.garden.snapshot()), contents(self.garden))
+
+
+if __name__ == "__main__":
+    unittest.main()